@@ -6,7 +6,9 @@ ETF Monitoring Application (개선됨)
 """
 
 from application.queries.holdings_comparison_query import HoldingsComparisonQuery
+from application.queries.stock_ownership_query import StockOwnershipQuery
 from application.queries.stock_statistics_query import StockStatisticsQuery
+from application.queries.weight_change_feed_query import WeightChangeFeedQuery
 from application.queries.weight_history_query import WeightHistoryQuery
 from application.use_cases.export_data import ExportDataUseCase
 from application.use_cases.get_holdings_comparison import GetHoldingsComparisonUseCase
@@ -20,7 +22,10 @@ from domain.services.holdings_analyzer import HoldingsAnalyzer
 from domain.services.statistics_calculator import StatisticsCalculator
 from flask import Flask, render_template
 from infrastructure.adapters.pykrx_adapter import PyKRXAdapter
+from infrastructure.cache.ticker_name_cache import TickerNameCache
+from infrastructure.cache.trading_calendar import CachedTradingCalendar
 from infrastructure.database.connection import db_connection
+from infrastructure.database.ingestion_writer import DailyIngestionWriter
 from infrastructure.database.migrations import DatabaseMigrations
 from infrastructure.database.repositories.sqlite_config_repository import (
     SQLiteConfigRepository,
@@ -28,12 +33,23 @@ from infrastructure.database.repositories.sqlite_config_repository import (
 from infrastructure.database.repositories.sqlite_etf_repository import (
     SQLiteETFRepository,
 )
+from infrastructure.database.repositories.sqlite_holding_diff_repository import (
+    SQLiteHoldingDiffRepository,
+)
+from infrastructure.database.repositories.sqlite_job_repository import (
+    SQLiteJobRepository,
+)
+from infrastructure.database.repositories.sqlite_statistics_repository import (
+    SQLiteStatisticsRepository,
+)
 from infrastructure.database.repositories.sqlite_stock_repository import (
     SQLiteStockRepository,
 )
+from infrastructure.jobs import BackgroundJobRunner
 from presentation.api.controllers.config_controller import ConfigController
 from presentation.api.controllers.etf_controller import ETFController
 from presentation.api.controllers.statistics_controller import StatisticsController
+from presentation.api.controllers.stock_controller import StockController
 from presentation.api.controllers.system_controller import SystemController
 from presentation.api.error_handlers import ErrorHandlers
 from presentation.api.routes import register_all_routes
@@ -55,7 +71,15 @@ def create_app():
     stock_repo = SQLiteStockRepository(db_connection)
     etf_repo = SQLiteETFRepository(db_connection)
     config_repo = SQLiteConfigRepository(db_connection)
-    market_adapter = PyKRXAdapter()
+    job_repo = SQLiteJobRepository(db_connection)
+    stats_repo = SQLiteStatisticsRepository(db_connection)
+    diff_repo = SQLiteHoldingDiffRepository(db_connection)
+    name_cache = TickerNameCache(db_connection)
+    market_adapter = PyKRXAdapter(name_cache=name_cache)
+    trading_calendar = CachedTradingCalendar(db_connection, market_adapter)
+    ingestion_writer = DailyIngestionWriter(db_connection)
+    job_runner = BackgroundJobRunner(job_repo)
+    job_runner.recover_interrupted()
 
     # Domain Layer
     filter_service = ETFFilterService()
@@ -64,17 +88,34 @@ def create_app():
 
     # Application Layer - Queries
     holdings_comparison_query = HoldingsComparisonQuery(
-        etf_repo, stock_repo, holdings_analyzer
+        etf_repo, stock_repo, holdings_analyzer, diff_repo
+    )
+    stock_statistics_query = StockStatisticsQuery(
+        etf_repo, statistics_calculator, stats_repo
     )
-    stock_statistics_query = StockStatisticsQuery(etf_repo, statistics_calculator)
     weight_history_query = WeightHistoryQuery(etf_repo)
+    weight_change_feed_query = WeightChangeFeedQuery(etf_repo, holdings_analyzer)
+    stock_ownership_query = StockOwnershipQuery(etf_repo, stock_repo)
 
     # Application Layer - Use Cases
     initialize_system_uc = InitializeSystemUseCase(
-        etf_repo, stock_repo, config_repo, market_adapter, filter_service
+        etf_repo,
+        stock_repo,
+        config_repo,
+        market_adapter,
+        filter_service,
+        trading_calendar,
+        ingestion_writer,
+        job_repo,
     )
     update_etf_data_uc = UpdateETFDataUseCase(
-        etf_repo, config_repo, market_adapter, filter_service
+        etf_repo,
+        config_repo,
+        market_adapter,
+        filter_service,
+        trading_calendar,
+        ingestion_writer,
+        job_repo,
     )
 
     get_holdings_comparison_uc = GetHoldingsComparisonUseCase(
@@ -92,16 +133,24 @@ def create_app():
 
     # Presentation Layer - Controllers
     etf_controller = ETFController(
-        etf_repo, get_holdings_comparison_uc, export_data_uc, weight_history_query
+        etf_repo,
+        get_holdings_comparison_uc,
+        export_data_uc,
+        weight_history_query,
+        weight_change_feed_query,
     )
     statistics_controller = StatisticsController(get_statistics_uc)
-    system_controller = SystemController(initialize_system_uc, update_etf_data_uc)
+    stock_controller = StockController(stock_ownership_query)
+    system_controller = SystemController(
+        initialize_system_uc, update_etf_data_uc, job_runner, job_repo
+    )
     config_controller = ConfigController(config_repo)
 
     def setup_controllers(api_bp):
         """Blueprint에 컨트롤러 주입"""
         api_bp.etf_controller = etf_controller
         api_bp.statistics_controller = statistics_controller
+        api_bp.stock_controller = stock_controller
         api_bp.system_controller = system_controller
         api_bp.config_controller = config_controller
 
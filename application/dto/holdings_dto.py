@@ -4,7 +4,7 @@ Holdings DTO (개선됨)
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from application.dto.base_dto import BaseDTO
 
@@ -93,6 +93,67 @@ class WeightHistoryDto(BaseDTO):
             history=history,
         )
 
+    @staticmethod
+    def from_rows(etf_ticker: str, stock_ticker: str, stock_name: str, rows: list):
+        """HoldingRow 리스트로부터 DTO 생성 (날짜 문자열을 그대로 사용)"""
+        return WeightHistoryDto(
+            etf_ticker=etf_ticker,
+            stock_ticker=stock_ticker,
+            stock_name=stock_name,
+            history=[
+                {"date": row.date, "weight": row.weight, "amount": row.amount}
+                for row in rows
+            ],
+        )
+
+
+@dataclass
+class WeightHistoryBatchDto(BaseDTO):
+    """
+    여러 비중 추이를 열 단위로 전송하기 위한 DTO
+
+    날짜 축(dates)은 한 번만 보내고, 각 시리즈의 weights/amounts는
+    dates와 같은 길이의 배열입니다. (해당 날짜에 보유하지 않았으면 None)
+    """
+
+    start_date: Optional[str]
+    end_date: Optional[str]
+    dates: List[str]
+    series: List[dict]
+
+    @staticmethod
+    def from_rows(
+        rows: list, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ):
+        """(ETF, 종목, 날짜) 순으로 정렬된 HoldingRow 리스트로부터 DTO 생성"""
+        dates = sorted({row.date for row in rows})
+        index = {date: i for i, date in enumerate(dates)}
+
+        series = []
+        current = None
+        for row in rows:
+            if (
+                current is None
+                or current["etf_ticker"] != row.etf_ticker
+                or current["stock_ticker"] != row.stock_ticker
+            ):
+                current = {
+                    "etf_ticker": row.etf_ticker,
+                    "stock_ticker": row.stock_ticker,
+                    "stock_name": row.stock_name,
+                    "weights": [None] * len(dates),
+                    "amounts": [None] * len(dates),
+                }
+                series.append(current)
+
+            i = index[row.date]
+            current["weights"][i] = row.weight
+            current["amounts"][i] = row.amount
+
+        return WeightHistoryBatchDto(
+            start_date=start_date, end_date=end_date, dates=dates, series=series
+        )
+
 
 @dataclass
 class TopHoldingsDto(BaseDTO):
@@ -149,3 +210,40 @@ class HoldingsChangeDto(BaseDTO):
             "new_stocks": [s.to_dict() for s in self.new_stocks],
             "removed_stocks": [s.to_dict() for s in self.removed_stocks],
         }
+
+
+@dataclass
+class WeightChangeDto(BaseDTO):
+    """ETF 간 비중 변화 피드 항목을 전송하기 위한 DTO"""
+
+    etf_ticker: str
+    etf_name: str
+    stock_ticker: str
+    stock_name: str
+    prev_weight: float
+    current_weight: float
+    change: float
+    status: str
+
+
+@dataclass
+class WeightChangeFeedDto(BaseDTO):
+    """ETF 간 비중 변화 피드 전체를 전송하기 위한 DTO"""
+
+    prev_date: str
+    current_date: str
+    threshold: float
+    theme: Optional[str]
+    changes: List[WeightChangeDto]
+    summary: dict
+
+    def to_dict(self) -> dict:
+        """커스텀 to_dict 구현"""
+        return {
+            "prev_date": self.prev_date,
+            "current_date": self.current_date,
+            "threshold": self.threshold,
+            "theme": self.theme,
+            "changes": [c.to_dict() for c in self.changes],
+            "summary": self.summary,
+        }
@@ -130,6 +130,33 @@ class ETFOverlapDto(BaseDTO):
     overlap_stocks: List[str]
     overlap_ratio_1: float
     overlap_ratio_2: float
+    weight_overlap: float = 0.0
+
+
+@dataclass
+class ETFOverlapMatrixDto(BaseDTO):
+    """
+    전체 ETF 쌍 중복도 행렬을 전송하기 위한 DTO
+
+    overlap_counts/weight_overlap은 etfs 순서의 n×n 대칭 행렬이며,
+    대각선은 각 ETF의 보유 종목 수/비중 합계입니다.
+    """
+
+    date: str
+    etfs: List[dict]
+    overlap_counts: List[List[int]]
+    weight_overlap: List[List[float]]
+    top_pairs: List[ETFOverlapDto]
+
+    def to_dict(self) -> dict:
+        """커스텀 to_dict 구현"""
+        return {
+            "date": self.date,
+            "etfs": self.etfs,
+            "overlap_counts": self.overlap_counts,
+            "weight_overlap": self.weight_overlap,
+            "top_pairs": [p.to_dict() for p in self.top_pairs],
+        }
 
 
 @dataclass
@@ -153,3 +180,23 @@ class StockFrequencyDto(BaseDTO):
     name: str
     frequency: int
     etf_tickers: List[str]
+
+
+@dataclass
+class StockOwnershipDto(BaseDTO):
+    """
+    종목의 ETF 보유 추이를 전송하기 위한 DTO
+
+    날짜 축(dates)은 한 번만 보내고, etf_counts/total_amounts와
+    각 ETF의 weights는 dates와 같은 길이의 배열입니다.
+    (해당 날짜에 보유하지 않았으면 None)
+    """
+
+    stock_ticker: str
+    stock_name: str
+    start_date: Optional[str]
+    end_date: Optional[str]
+    dates: List[str]
+    etf_counts: List[int]
+    total_amounts: List[float]
+    etfs: List[dict]
@@ -5,7 +5,7 @@ CQRS 패턴의 Query 측면을 구현합니다.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from application.dto.holdings_dto import (
     HoldingComparisonDto,
@@ -13,8 +13,10 @@ from application.dto.holdings_dto import (
 )
 from config.logging_config import LoggerMixin
 from domain.repositories.etf_repository import ETFRepository
+from domain.repositories.holding_diff_repository import HoldingDiffRepository
 from domain.repositories.stock_repository import StockRepository
 from domain.services.holdings_analyzer import HoldingsAnalyzer
+from domain.value_objects.weight_change import ChangeStatus
 from shared.utils.date_utils import to_date_string
 
 
@@ -24,10 +26,17 @@ class HoldingsComparisonQuery(LoggerMixin):
 
     특정 ETF의 두 시점 간 보유 종목을 비교하여 변화를 조회합니다.
 
+    ✅ 개선: 바로 이전 거래일과의 비교(기본 비교)는 수집 시점에 저장된
+    결과를 조회하고, 임의의 두 날짜 비교만 그 자리에서 계산합니다.
+    저장된 결과가 없으면 그 자리에서 계산만 하고 저장하지 않습니다.
+    (조회 경로에서 수집 작업과 쓰기 잠금을 다투지 않도록, 누락분은
+    마이그레이션이 채웁니다.)
+
     Args:
         etf_repository: ETF 리포지토리
         stock_repository: Stock 리포지토리
         holdings_analyzer: 보유 종목 분석 서비스
+        diff_repository: 연속 거래일 비교 결과 리포지토리
     """
 
     def __init__(
@@ -35,10 +44,12 @@ class HoldingsComparisonQuery(LoggerMixin):
         etf_repository: ETFRepository,
         stock_repository: StockRepository,
         holdings_analyzer: HoldingsAnalyzer,
+        diff_repository: HoldingDiffRepository,
     ):
         self.etf_repo = etf_repository
         self.stock_repo = stock_repository
         self.analyzer = holdings_analyzer
+        self.diff_repo = diff_repository
 
     def execute(
         self,
@@ -88,26 +99,25 @@ class HoldingsComparisonQuery(LoggerMixin):
             f"Comparing dates: {to_date_string(previous_date)} vs {to_date_string(current_date)}"
         )
 
-        # 보유 종목 조회
-        current_holdings = self.etf_repo.find_holdings_by_etf_and_date(
-            etf_ticker, current_date
-        )
-        previous_holdings = self.etf_repo.find_holdings_by_etf_and_date(
-            etf_ticker, previous_date
-        )
-
-        # 비교 수행
-        comparison_result = self.analyzer.compare_holdings(
-            previous_holdings, current_holdings
-        )
+        # ✅ 저장된 연속 거래일 비교 결과 우선 사용
+        stored = self._find_stored(etf_ticker, current_date, previous_date)
 
-        # DTO 변환
-        comparison_dtos = self._create_comparison_dtos(
-            previous_holdings, current_holdings, comparison_result
-        )
+        if stored:
+            comparison_dtos = [HoldingComparisonDto(**diff) for diff in stored["diffs"]]
+            summary = self._create_summary(stored["counts"])
+        else:
+            # 보유 종목 조회 (종목 코드 순 경량 행 → 정렬 병합)
+            current_holdings = self.etf_repo.find_holdings_by_etf_and_date(
+                etf_ticker, current_date, as_rows=True, sort_by_stock=True
+            )
+            previous_holdings = self.etf_repo.find_holdings_by_etf_and_date(
+                etf_ticker, previous_date, as_rows=True, sort_by_stock=True
+            )
 
-        # 요약 정보 생성
-        summary = self._create_summary(comparison_result)
+            # 비교 수행 (DTO와 요약을 한 번에 생성)
+            comparison_dtos, summary = self._compare(
+                previous_holdings, current_holdings
+            )
 
         return HoldingsComparisonResultDto(
             etf_ticker=etf_ticker,
@@ -118,73 +128,62 @@ class HoldingsComparisonQuery(LoggerMixin):
             summary=summary,
         )
 
-    def _create_comparison_dtos(
-        self, previous_holdings: List, current_holdings: List, comparison_result: dict
-    ) -> List[HoldingComparisonDto]:
-        """비교 결과를 DTO 리스트로 변환"""
-        prev_dict = {h.stock_ticker: h for h in previous_holdings}
-        curr_dict = {h.stock_ticker: h for h in current_holdings}
+    def _find_stored(
+        self,
+        etf_ticker: str,
+        current_date: datetime,
+        previous_date: datetime,
+    ) -> Optional[Dict]:
+        """
+        저장된 비교 결과를 조회합니다.
 
-        all_tickers = set(prev_dict.keys()) | set(curr_dict.keys())
+        결과가 없거나 기준 날짜가 다르면 None을 반환하며,
+        호출하는 쪽이 그 자리에서 계산합니다. (저장하지 않음)
+        """
+        if previous_date == current_date:
+            return None
 
+        return self.diff_repo.find_diffs(etf_ticker, current_date, previous_date)
+
+    def _compare(
+        self, previous_holdings: List, current_holdings: List
+    ) -> Tuple[List[HoldingComparisonDto], dict]:
+        """
+        비교 결과 DTO 리스트와 요약 정보를 한 번에 생성합니다.
+
+        ✅ 개선: 종목마다 한 번만 분류하고, 같은 순회에서 DTO와 상태별 개수를 만듭니다.
+        """
+        counts = dict.fromkeys(ChangeStatus, 0)
         dtos = []
-        for ticker in all_tickers:
-            prev_holding = prev_dict.get(ticker)
-            curr_holding = curr_dict.get(ticker)
-
-            prev_weight = prev_holding.weight if prev_holding else 0.0
-            curr_weight = curr_holding.weight if curr_holding else 0.0
-            change = curr_weight - prev_weight
-            curr_amount = curr_holding.amount if curr_holding else 0.0
-            stock_name = (
-                curr_holding.stock_name
-                if curr_holding
-                else prev_holding.stock_name
-                if prev_holding
-                else ""
-            )
 
-            # 상태 결정
-            if prev_holding is None:
-                status = "신규"
-            elif curr_holding is None:
-                status = "제외"
-            elif change > 0.01:
-                status = "비중 증가"
-            elif change < -0.01:
-                status = "비중 감소"
-            else:
-                status = "유지"
+        for diff in self.analyzer.merge_holdings(previous_holdings, current_holdings):
+            prev, curr = diff.previous, diff.current
+            counts[diff.status] += 1
 
             dtos.append(
                 HoldingComparisonDto(
-                    stock_ticker=ticker,
-                    stock_name=stock_name,
-                    prev_weight=prev_weight,
-                    current_weight=curr_weight,
-                    change=round(change, 4),
-                    current_amount=curr_amount,
-                    status=status,
+                    stock_ticker=diff.stock_ticker,
+                    stock_name=(curr or prev).stock_name,
+                    prev_weight=prev.weight if prev else 0.0,
+                    current_weight=curr.weight if curr else 0.0,
+                    change=round(diff.change, 4),
+                    current_amount=curr.amount if curr else 0.0,
+                    status=diff.status.value,
                 )
             )
 
         # 현재 비중 기준으로 정렬
         dtos.sort(key=lambda x: x.current_weight, reverse=True)
 
-        return dtos
+        return dtos, self._create_summary(counts)
 
-    def _create_summary(self, comparison_result: dict) -> dict:
+    def _create_summary(self, counts: Dict[ChangeStatus, int]) -> dict:
         """요약 정보 생성"""
         return {
-            "new_count": len(comparison_result["new"]),
-            "removed_count": len(comparison_result["removed"]),
-            "increased_count": len(comparison_result["increased"]),
-            "decreased_count": len(comparison_result["decreased"]),
-            "unchanged_count": len(comparison_result["unchanged"]),
-            "total_current": (
-                len(comparison_result["new"])
-                + len(comparison_result["increased"])
-                + len(comparison_result["decreased"])
-                + len(comparison_result["unchanged"])
-            ),
+            "new_count": counts[ChangeStatus.NEW],
+            "removed_count": counts[ChangeStatus.REMOVED],
+            "increased_count": counts[ChangeStatus.INCREASED],
+            "decreased_count": counts[ChangeStatus.DECREASED],
+            "unchanged_count": counts[ChangeStatus.UNCHANGED],
+            "total_current": sum(counts.values()) - counts[ChangeStatus.REMOVED],
         }
@@ -0,0 +1,117 @@
+"""
+Stock Ownership Query
+종목 중심 ETF 보유 추이 조회를 위한 Query 객체입니다.
+CQRS 패턴의 Query 측면을 구현합니다.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config.logging_config import LoggerMixin
+from domain.repositories.etf_repository import ETFRepository
+from domain.repositories.stock_repository import StockRepository
+from shared.utils.date_utils import to_date_string
+
+from application.dto.statistics_dto import StockOwnershipDto
+
+
+class StockOwnershipQuery(LoggerMixin):
+    """
+    종목 보유 추이 조회 쿼리
+
+    "이 종목을 어떤 ETF들이, 얼마나 보유해 왔는가"를 조회합니다.
+    기간 내 보유 행을 (종목, 날짜, 비중) 인덱스 범위 탐색 한 번으로 읽고,
+    날짜별 보유 ETF 수·평가금액 합계와 ETF별 비중 시리즈를 한 번에 만듭니다.
+
+    Args:
+        etf_repository: ETF 리포지토리
+        stock_repository: 주식 리포지토리
+    """
+
+    def __init__(
+        self, etf_repository: ETFRepository, stock_repository: StockRepository
+    ):
+        self.etf_repo = etf_repository
+        self.stock_repo = stock_repository
+
+    def execute(
+        self,
+        stock_ticker: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> StockOwnershipDto:
+        """
+        종목 보유 추이 조회를 실행합니다.
+
+        Args:
+            stock_ticker: 종목 코드
+            start_date: 시작일 (포함, None이면 처음부터)
+            end_date: 종료일 (포함, None이면 끝까지)
+
+        Returns:
+            종목 보유 추이 DTO (ETF는 마지막 날짜 비중 내림차순)
+
+        Raises:
+            ValueError: 종목을 찾을 수 없거나 기간이 잘못된 경우
+        """
+        self.logger.info(f"Executing stock ownership query: Stock={stock_ticker}")
+
+        if start_date and end_date and start_date > end_date:
+            raise ValueError("start_date must not be after end_date")
+
+        stock = self.stock_repo.find_by_ticker(stock_ticker)
+        if not stock:
+            raise ValueError(f"Stock not found: {stock_ticker}")
+
+        # 날짜순, 같은 날짜 안에서는 비중 내림차순
+        rows = self.etf_repo.find_holdings_by_stock(stock_ticker, start_date, end_date)
+
+        dates: List[str] = []
+        etf_counts: List[int] = []
+        total_amounts: List[float] = []
+        weights: Dict[str, List[Optional[float]]] = {}
+
+        for row in rows:
+            if not dates or dates[-1] != row.date:
+                dates.append(row.date)
+                etf_counts.append(0)
+                total_amounts.append(0.0)
+                for series in weights.values():
+                    series.append(None)
+
+            series = weights.get(row.etf_ticker)
+            if series is None:
+                series = weights[row.etf_ticker] = [None] * len(dates)
+
+            series[-1] = row.weight
+            etf_counts[-1] += 1
+            total_amounts[-1] += row.amount
+
+        etf_name_map = {
+            etf.ticker: etf.name for etf in self.etf_repo.find_by_tickers(list(weights))
+        }
+
+        # 마지막 날짜 비중이 큰 ETF부터 (이미 빠진 ETF는 뒤로)
+        ordered = sorted(
+            weights.items(), key=lambda item: (-(item[1][-1] or -1.0), item[0])
+        )
+
+        self.logger.debug(f"Found {len(rows)} holdings over {len(dates)} dates")
+
+        return StockOwnershipDto(
+            stock_ticker=stock.ticker,
+            stock_name=stock.name,
+            start_date=to_date_string(start_date) if start_date else None,
+            end_date=to_date_string(end_date) if end_date else None,
+            dates=dates,
+            etf_counts=etf_counts,
+            total_amounts=[round(amount, 2) for amount in total_amounts],
+            etfs=[
+                {
+                    "etf_ticker": ticker,
+                    "etf_name": etf_name_map.get(ticker, ticker),
+                    "weights": series,
+                }
+                for ticker, series in ordered
+            ],
+        )
@@ -4,10 +4,13 @@ Stock Statistics Query (최적화 및 개선됨)
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from config.logging_config import LoggerMixin
 from domain.repositories.etf_repository import ETFRepository
+from domain.repositories.statistics_repository import StatisticsRepository
 from domain.services.statistics_calculator import StatisticsCalculator
 from shared.utils.date_utils import to_date_string
 
@@ -16,6 +19,8 @@ from application.dto.statistics_dto import (
     AmountRankingStatsDto,
     DuplicateStockDto,
     DuplicateStockStatsDto,
+    ETFOverlapDto,
+    ETFOverlapMatrixDto,
     ThemeStatsDto,
 )
 
@@ -25,13 +30,23 @@ class StockStatisticsQuery(LoggerMixin):
     종목 통계 조회 쿼리
 
     중복 종목, 평가금액 순위, 테마별 통계 등을 조회합니다.
+
+    ✅ 개선: 중복 종목, 평가금액 순위, 요약, 비중 분포는 수집 시점에 만든
+    날짜별 집계(StatisticsRepository)를 바로 읽으므로 보유 종목 수와 무관하게
+    인덱스 조회 한 번으로 끝납니다. 집계가 없는 날짜는 보유 종목에서 바로
+    계산만 하고 저장하지 않습니다. (누락분은 마이그레이션이 채움)
+    테마 통계는 테마 ETF로 범위를 좁혀 DB에서 직접 집계합니다.
     """
 
     def __init__(
-        self, etf_repository: ETFRepository, statistics_calculator: StatisticsCalculator
+        self,
+        etf_repository: ETFRepository,
+        statistics_calculator: StatisticsCalculator,
+        statistics_repository: StatisticsRepository,
     ):
         self.etf_repo = etf_repository
         self.calculator = statistics_calculator
+        self.stats_repo = statistics_repository
 
     def get_duplicate_stocks(
         self, date: Optional[datetime] = None, min_count: int = 2, limit: int = 100
@@ -43,12 +58,15 @@ class StockStatisticsQuery(LoggerMixin):
         if not date:
             raise ValueError("No data available")
 
-        all_holdings = self.etf_repo.find_holdings_by_date(date)
-        self.logger.debug(f"Analyzing {len(all_holdings)} holdings")
+        daily_summary, stored = self._find_daily_summary(date)
 
-        duplicate_stocks = self.calculator.calculate_duplicate_stocks(
-            all_holdings, min_count
-        )[:limit]
+        duplicate_stocks = self._find_stock_aggregates(
+            date,
+            stored,
+            order_by=StatisticsRepository.ORDER_BY_ETF_COUNT,
+            min_etf_count=min_count,
+            limit=limit,
+        )
 
         # ✅ 개선: 헬퍼 메서드 사용
         etf_name_map = self._get_etf_name_map(
@@ -70,11 +88,10 @@ class StockStatisticsQuery(LoggerMixin):
         ]
 
         summary = self._create_duplicate_summary(duplicate_stocks)
-        total_etfs = len(set(h.etf_ticker for h in all_holdings))
 
         return DuplicateStockStatsDto(
             date=to_date_string(date),
-            total_etfs=total_etfs,
+            total_etfs=daily_summary["etf_count"],
             stocks=stock_dtos,
             summary=summary,
         )
@@ -89,8 +106,16 @@ class StockStatisticsQuery(LoggerMixin):
         if not date:
             raise ValueError("No data available")
 
-        all_holdings = self.etf_repo.find_holdings_by_date(date)
-        ranking = self.calculator.calculate_amount_ranking(all_holdings, top_n)
+        _, stored = self._find_daily_summary(date)
+
+        # 금액이 있는 종목만
+        ranking = self._find_stock_aggregates(
+            date,
+            stored,
+            order_by=StatisticsRepository.ORDER_BY_AMOUNT,
+            min_amount=0,
+            limit=top_n,
+        )
 
         stock_dtos = [
             AmountRankingDto(
@@ -121,15 +146,23 @@ class StockStatisticsQuery(LoggerMixin):
         if not date:
             raise ValueError("No data available")
 
-        all_etfs = self.etf_repo.find_all()
-        all_holdings = self.etf_repo.find_holdings_by_date(date)
-
-        theme_stats = self.calculator.calculate_theme_statistics(
-            all_holdings, all_etfs, theme
+        # 테마 ETF 선별 (ETF 목록은 작고 캐시됨)
+        theme_etfs = [
+            etf for etf in self.etf_repo.find_all() if etf.contains_keyword(theme)
+        ]
+        theme_etf_tickers = [etf.ticker for etf in theme_etfs]
+
+        # ✅ 개선: 보유 종목 전체를 읽지 않고 DB에서 집계 (상위 N개만 반환)
+        theme_summary = self.stats_repo.summarize_for_etfs(date, theme_etf_tickers)
+        duplicate_stocks = self.stats_repo.aggregate_stocks_for_etfs(
+            date,
+            theme_etf_tickers,
+            order_by=StatisticsRepository.ORDER_BY_ETF_COUNT,
+            min_etf_count=2,
+            limit=limit,
         )
 
         # ✅ 개선: 헬퍼 메서드 사용
-        duplicate_stocks = theme_stats["duplicate_stocks"][:limit]
         etf_name_map = self._get_etf_name_map(
             [ticker for stock in duplicate_stocks for ticker in stock["etf_tickers"]]
         )
@@ -148,25 +181,222 @@ class StockStatisticsQuery(LoggerMixin):
             for stock in duplicate_stocks
         ]
 
-        theme_etf_tickers = set(theme_stats["etf_tickers"])
-        theme_holdings = [h for h in all_holdings if h.etf_ticker in theme_etf_tickers]
-        top_stocks = self.calculator.calculate_amount_ranking(theme_holdings, 10)
+        top_stocks = [
+            {
+                key: stock[key]
+                for key in (
+                    "ticker",
+                    "name",
+                    "total_amount",
+                    "etf_count",
+                    "avg_weight",
+                    "max_weight",
+                )
+            }
+            for stock in self.stats_repo.aggregate_stocks_for_etfs(
+                date,
+                theme_etf_tickers,
+                order_by=StatisticsRepository.ORDER_BY_AMOUNT,
+                min_amount=0,
+                limit=10,
+            )
+        ]
 
-        # ✅ 개선: 헬퍼 메서드 사용
-        etf_names = self._get_etf_names(theme_stats["etf_tickers"])
+        etf_names = [etf.name for etf in theme_etfs]
+
+        self.logger.info(
+            f"Theme '{theme}' statistics: {len(theme_etfs)} ETFs, "
+            f"{theme_summary['stock_count']} unique stocks"
+        )
 
         return ThemeStatsDto(
             theme=theme,
-            etf_count=theme_stats["etf_count"],
+            etf_count=len(theme_etfs),
             etf_names=etf_names,
-            total_holdings=theme_stats["total_holdings"],
-            unique_stocks=theme_stats["unique_stocks"],
+            total_holdings=theme_summary["holding_count"],
+            unique_stocks=theme_summary["stock_count"],
             duplicate_stocks=duplicate_dtos,
             top_stocks=top_stocks,
         )
 
+    def get_statistics_summary(self, date: datetime) -> dict:
+        """✅ 추가: 전체 통계 요약을 집계 테이블에서 조회합니다."""
+        self.logger.info("Executing statistics summary query")
+
+        daily_summary, stored = self._find_daily_summary(date)
+        total_etfs = self.etf_repo.count()
+
+        most_common = None
+        top_by_count = self._find_stock_aggregates(
+            date, stored, order_by=StatisticsRepository.ORDER_BY_ETF_COUNT, limit=1
+        )
+        if top_by_count:
+            stock = top_by_count[0]
+            most_common = {
+                "ticker": stock["ticker"],
+                "name": stock["name"],
+                "frequency": stock["etf_count"],
+            }
+
+        highest_amount = None
+        top_by_amount = self._find_stock_aggregates(
+            date,
+            stored,
+            order_by=StatisticsRepository.ORDER_BY_AMOUNT,
+            min_amount=0,
+            limit=1,
+        )
+        if top_by_amount:
+            stock = top_by_amount[0]
+            highest_amount = {
+                "ticker": stock["ticker"],
+                "name": stock["name"],
+                "amount": stock["total_amount"],
+            }
+
+        holding_count = daily_summary["holding_count"]
+        avg_holdings = holding_count / total_etfs if total_etfs else 0
+
+        return {
+            "date": to_date_string(date),
+            "total_etfs": total_etfs,
+            "total_stocks": daily_summary["stock_count"],
+            "total_holdings": holding_count,
+            "avg_holdings_per_etf": round(avg_holdings, 2),
+            "most_common_stock": most_common,
+            "highest_amount_stock": highest_amount,
+        }
+
+    def get_weight_distribution(self, date: datetime) -> dict:
+        """✅ 추가: 비중 분포를 집계 테이블에서 조회합니다."""
+        self.logger.info("Executing weight distribution query")
+
+        daily_summary, _ = self._find_daily_summary(date)
+
+        return {
+            "date": to_date_string(date),
+            "total_holdings": daily_summary["holding_count"],
+            "distribution": daily_summary["distribution"],
+        }
+
+    def get_etf_overlap_matrix(
+        self,
+        date: Optional[datetime] = None,
+        theme: Optional[str] = None,
+        min_overlap: int = 1,
+        top_n: int = 20,
+    ) -> ETFOverlapMatrixDto:
+        """
+        ✅ 추가: 전체 ETF 쌍의 종목 중복도 행렬을 조회합니다.
+
+        날짜별 스냅샷에서 행렬을 한 번 계산해 두고(스냅샷과 함께 캐시),
+        테마가 주어지면 해당 ETF들의 행/열만 잘라 반환합니다.
+
+        Args:
+            date: 기준일 (None이면 최신)
+            theme: ETF명에 포함된 테마 키워드 (None이면 전체)
+            min_overlap: 상위 쌍에 포함할 최소 중복 종목 수 (1 이상)
+            top_n: 상위 쌍 개수 (0이면 전체)
+
+        Raises:
+            ValueError: 데이터가 없거나 min_overlap/top_n이 범위를 벗어난 경우
+        """
+        self.logger.info(f"Executing ETF overlap matrix query: theme={theme}")
+
+        if min_overlap < 1:
+            raise ValueError(f"min_overlap must be >= 1 (got {min_overlap})")
+        if top_n < 0:
+            raise ValueError(f"top_n must be >= 0 (got {top_n})")
+
+        date = date or self.etf_repo.get_latest_date()
+        if not date:
+            raise ValueError("No data available")
+
+        snapshot = self.etf_repo.find_holdings_snapshot(date)
+
+        etf_name_map = {
+            etf.ticker: etf.name
+            for etf in self.etf_repo.find_all()
+            if not theme or etf.contains_keyword(theme)
+        }
+        matrix = self.calculator.calculate_overlap_matrix(snapshot).for_etfs(
+            etf_name_map
+        )
+        tickers = matrix.etf_tickers
+        counts = matrix.holding_counts.tolist()
+        pairs = matrix.pairs(min_overlap)
+        if top_n > 0:
+            pairs = pairs[:top_n]
+
+        # 공통 종목 목록은 상위 쌍의 ETF만 만듦
+        rows_by_etf = snapshot.for_etfs(
+            {tickers[k] for pair in pairs for k in pair}
+        ).rows_by_etf()
+        stock_sets = {
+            ticker: {row.stock_ticker for row in rows}
+            for ticker, rows in rows_by_etf.items()
+        }
+
+        top_pairs = []
+        for i, j in pairs:
+            overlap = int(matrix.overlap_counts[i, j])
+
+            top_pairs.append(
+                ETFOverlapDto(
+                    etf1_ticker=tickers[i],
+                    etf1_name=etf_name_map[tickers[i]],
+                    etf2_ticker=tickers[j],
+                    etf2_name=etf_name_map[tickers[j]],
+                    overlap_count=overlap,
+                    overlap_stocks=sorted(
+                        stock_sets[tickers[i]] & stock_sets[tickers[j]]
+                    ),
+                    overlap_ratio_1=round(overlap / counts[i] * 100, 2),
+                    overlap_ratio_2=round(overlap / counts[j] * 100, 2),
+                    weight_overlap=round(float(matrix.weight_overlap[i, j]), 2),
+                )
+            )
+
+        return ETFOverlapMatrixDto(
+            date=to_date_string(date),
+            etfs=[
+                {
+                    "ticker": ticker,
+                    "name": etf_name_map[ticker],
+                    "holding_count": counts[k],
+                }
+                for k, ticker in enumerate(tickers)
+            ],
+            overlap_counts=matrix.overlap_counts.tolist(),
+            weight_overlap=np.round(matrix.weight_overlap, 2).tolist(),
+            top_pairs=top_pairs,
+        )
+
     # ✅ 새로운 헬퍼 메서드들
 
+    def _find_daily_summary(self, date: datetime) -> Tuple[dict, bool]:
+        """
+        날짜별 요약 집계와 사전 집계 존재 여부를 반환합니다.
+
+        집계가 없는 날짜(집계 도입 이전 데이터, 집계 삭제 후)는 보유 종목
+        데이터로부터 바로 계산합니다. 조회 경로에서 수집 작업과 쓰기 잠금을
+        다투지 않도록 저장하지 않습니다.
+        """
+        daily_summary = self.stats_repo.find_daily_summary(date)
+        if daily_summary is not None:
+            return daily_summary, True
+
+        self.logger.info(f"No aggregates for {to_date_string(date)}, computing live")
+        return self.stats_repo.summarize_for_etfs(date, None), False
+
+    def _find_stock_aggregates(
+        self, date: datetime, stored: bool, **options
+    ) -> List[Dict]:
+        """종목별 집계를 사전 집계(stored) 또는 보유 종목에서 조회합니다."""
+        if stored:
+            return self.stats_repo.find_stock_aggregates(date, **options)
+        return self.stats_repo.aggregate_stocks_for_etfs(date, None, **options)
+
     def _get_etf_name_map(self, tickers: List[str]) -> Dict[str, str]:
         """
         ETF ticker -> name 맵핑을 생성합니다.
@@ -180,13 +410,6 @@ class StockStatisticsQuery(LoggerMixin):
         etfs = self.etf_repo.find_by_tickers(unique_tickers)
         return {etf.ticker: etf.name for etf in etfs}
 
-    def _get_etf_names(self, tickers: List[str]) -> List[str]:
-        """
-        ETF ticker 리스트를 이름 리스트로 변환합니다.
-        """
-        etf_name_map = self._get_etf_name_map(tickers)
-        return [etf_name_map.get(ticker, ticker) for ticker in tickers]
-
     def _create_duplicate_summary(self, duplicate_stocks: List[dict]) -> dict:
         """중복 종목 요약 정보 생성"""
         if not duplicate_stocks:
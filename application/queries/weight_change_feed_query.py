@@ -0,0 +1,187 @@
+"""
+Weight Change Feed Query
+전체 ETF의 비중 변화 피드 조회를 위한 Query 객체입니다.
+CQRS 패턴의 Query 측면을 구현합니다.
+"""
+
+from datetime import datetime
+from typing import Iterable, List, Optional, Set, Tuple
+
+from config.logging_config import LoggerMixin
+from domain.repositories.etf_repository import ETFRepository
+from domain.services.holdings_analyzer import HoldingsAnalyzer
+from domain.value_objects.weight_change import CHANGE_STATUS_KEYS, ChangeStatus
+from shared.utils.date_utils import to_date_string
+
+from application.dto.holdings_dto import WeightChangeDto, WeightChangeFeedDto
+
+
+class WeightChangeFeedQuery(LoggerMixin):
+    """
+    비중 변화 피드 조회 쿼리
+
+    두 날짜 사이에 모든 ETF에서 일어난 유의미한 비중 변화(신규 편입, 제외,
+    비중 증가/감소)를 한 번에 조회합니다. ETF마다 비교 API를 호출하는 대신
+    두 날짜의 보유 종목을 날짜별 한 번씩 읽고(캐시된 스냅샷),
+    ETF별로 HoldingsAnalyzer의 정렬 병합 비교를 수행합니다.
+
+    두 날짜 모두 보유 종목이 있는 ETF만 비교합니다.
+    (신규 상장/수집 누락 ETF의 전 종목이 '신규'로 나오는 것을 방지)
+
+    Args:
+        etf_repository: ETF 리포지토리
+        holdings_analyzer: 보유 종목 분석 서비스
+    """
+
+    # 최소 변화량(threshold)을 적용하는 상태 (신규/제외/유지는 그대로 포함)
+    THRESHOLD_STATUSES = frozenset({ChangeStatus.INCREASED, ChangeStatus.DECREASED})
+
+    DEFAULT_STATUSES = (
+        ChangeStatus.NEW,
+        ChangeStatus.REMOVED,
+        ChangeStatus.INCREASED,
+        ChangeStatus.DECREASED,
+    )
+
+    def __init__(
+        self, etf_repository: ETFRepository, holdings_analyzer: HoldingsAnalyzer
+    ):
+        self.etf_repo = etf_repository
+        self.analyzer = holdings_analyzer
+
+    def execute(
+        self,
+        current_date: Optional[datetime] = None,
+        previous_date: Optional[datetime] = None,
+        threshold: float = 0.5,
+        theme: Optional[str] = None,
+        statuses: Optional[Iterable[str]] = None,
+        limit: int = 0,
+    ) -> WeightChangeFeedDto:
+        """
+        비중 변화 피드를 조회합니다.
+
+        Args:
+            current_date: 현재 날짜 (None이면 최신)
+            previous_date: 이전 날짜 (None이면 current_date 직전 거래일)
+            threshold: 비중 증가/감소의 최소 변화량 (%, 절대값 기준)
+            theme: ETF명에 포함된 테마 키워드 (None이면 전체)
+            statuses: 상태 키 목록 ('new', 'removed', 'increased',
+                'decreased', 'unchanged'), None이면 유지 제외 전체
+            limit: 최대 개수 (0이면 전체)
+
+        Returns:
+            비중 변화 피드 DTO (변화량 절대값 내림차순)
+
+        Raises:
+            ValueError: 데이터가 없거나 상태 키가 잘못된 경우
+        """
+        self.logger.info(
+            f"Executing weight change feed query: theme={theme}, "
+            f"threshold={threshold}, statuses={statuses}"
+        )
+
+        wanted = self._parse_statuses(statuses)
+        previous_date, current_date = self._resolve_dates(previous_date, current_date)
+
+        etf_names = {
+            etf.ticker: etf.name
+            for etf in self.etf_repo.find_all()
+            if not theme or etf.contains_keyword(theme)
+        }
+
+        # 날짜별 한 번씩 조회 (스냅샷 캐시 공유)
+        previous = self.etf_repo.find_holdings_snapshot(previous_date).rows_by_etf()
+        current = self.etf_repo.find_holdings_snapshot(current_date).rows_by_etf()
+
+        compared = sorted(set(previous) & set(current) & set(etf_names))
+        counts = dict.fromkeys(CHANGE_STATUS_KEYS.values(), 0)
+        changes: List[WeightChangeDto] = []
+
+        for etf_ticker in compared:
+            for diff in self.analyzer.merge_holdings(
+                previous[etf_ticker], current[etf_ticker]
+            ):
+                if diff.status not in wanted:
+                    continue
+                # ✅ 수정: 유지 행은 변화량이 기준(0.01%) 미만이라 threshold를 적용하지 않음
+                if (
+                    diff.status in self.THRESHOLD_STATUSES
+                    and abs(diff.change) < threshold
+                ):
+                    continue
+
+                prev, curr = diff.previous, diff.current
+                counts[CHANGE_STATUS_KEYS[diff.status]] += 1
+                changes.append(
+                    WeightChangeDto(
+                        etf_ticker=etf_ticker,
+                        etf_name=etf_names[etf_ticker],
+                        stock_ticker=diff.stock_ticker,
+                        stock_name=(curr or prev).stock_name,
+                        prev_weight=prev.weight if prev else 0.0,
+                        current_weight=curr.weight if curr else 0.0,
+                        change=round(diff.change, 4),
+                        status=diff.status.value,
+                    )
+                )
+
+        changes.sort(key=lambda c: abs(c.change), reverse=True)
+        total = len(changes)
+        if limit > 0:
+            changes = changes[:limit]
+
+        self.logger.debug(f"Found {total} changes across {len(compared)} ETFs")
+
+        return WeightChangeFeedDto(
+            prev_date=to_date_string(previous_date),
+            current_date=to_date_string(current_date),
+            threshold=threshold,
+            theme=theme,
+            changes=changes,
+            summary={
+                "etf_count": len(compared),
+                "total_changes": total,
+                "returned": len(changes),
+                **{f"{key}_count": count for key, count in counts.items()},
+            },
+        )
+
+    def _resolve_dates(
+        self, previous_date: Optional[datetime], current_date: Optional[datetime]
+    ) -> Tuple[datetime, datetime]:
+        """비교할 두 날짜를 결정합니다."""
+        available_dates = self.etf_repo.get_all_available_dates()  # 최신순
+        if not available_dates:
+            raise ValueError("No data available")
+
+        if current_date is None:
+            current_date = available_dates[0]
+
+        if previous_date is None:
+            earlier = [d for d in available_dates if d < current_date]
+            if not earlier:
+                raise ValueError(
+                    f"No earlier data to compare with {to_date_string(current_date)}"
+                )
+            previous_date = earlier[0]
+
+        if previous_date >= current_date:
+            raise ValueError("previous_date must be before current_date")
+
+        return previous_date, current_date
+
+    @staticmethod
+    def _parse_statuses(statuses: Optional[Iterable[str]]) -> Set[ChangeStatus]:
+        """상태 키 목록을 ChangeStatus 집합으로 변환합니다."""
+        if not statuses:
+            return set(WeightChangeFeedQuery.DEFAULT_STATUSES)
+
+        by_key = {key: status for status, key in CHANGE_STATUS_KEYS.items()}
+        unknown = [key for key in statuses if key not in by_key]
+        if unknown:
+            raise ValueError(
+                f"Unknown status: {', '.join(unknown)} (allowed: {', '.join(by_key)})"
+            )
+
+        return {by_key[key] for key in statuses}
@@ -4,11 +4,13 @@ Weight History Query
 CQRS 패턴의 Query 측면을 구현합니다.
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 
-from application.dto.holdings_dto import WeightHistoryDto
+from application.dto.holdings_dto import WeightHistoryBatchDto, WeightHistoryDto
 from config.logging_config import LoggerMixin
 from domain.repositories.etf_repository import ETFRepository
+from shared.utils.date_utils import to_date_string
 
 
 class WeightHistoryQuery(LoggerMixin):
@@ -21,6 +23,9 @@ class WeightHistoryQuery(LoggerMixin):
         etf_repository: ETF 리포지토리
     """
 
+    # 배치 조회 시 ETF/종목 코드 목록 최대 길이 (SQLite 바인딩 변수 제한 고려)
+    MAX_BATCH_TICKERS = 200
+
     def __init__(self, etf_repository: ETFRepository):
         self.etf_repo = etf_repository
 
@@ -47,8 +52,10 @@ class WeightHistoryQuery(LoggerMixin):
         if not etf:
             raise ValueError(f"ETF not found: {etf_ticker}")
 
-        # 비중 추이 조회
-        holdings = self.etf_repo.find_weight_history(etf_ticker, stock_ticker)
+        # 비중 추이 조회 (✅ 엔티티 대신 경량 행으로 조회)
+        holdings = self.etf_repo.find_weight_history(
+            etf_ticker, stock_ticker, as_rows=True
+        )
 
         if not holdings:
             raise ValueError(
@@ -61,11 +68,67 @@ class WeightHistoryQuery(LoggerMixin):
         self.logger.debug(f"Found {len(holdings)} history records")
 
         # DTO 변환
-        return WeightHistoryDto.from_holdings(
+        return WeightHistoryDto.from_rows(
             etf_ticker=etf_ticker,
             stock_ticker=stock_ticker,
             stock_name=stock_name,
-            holdings=holdings,
+            rows=holdings,
+        )
+
+    def execute_batch(
+        self,
+        etf_tickers: List[str],
+        stock_tickers: List[str],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> WeightHistoryBatchDto:
+        """
+        여러 ETF × 종목 조합의 비중 추이를 한 번에 조회합니다.
+
+        ✅ 추가: 조합마다 execute()를 호출하지 않고 단일 쿼리로 조회
+        보유 이력이 없는 조합은 결과에서 빠집니다.
+
+        Args:
+            etf_tickers: ETF 코드 목록
+            stock_tickers: 종목 코드 목록
+            start_date: 시작일 (포함, None이면 처음부터)
+            end_date: 종료일 (포함, None이면 끝까지)
+
+        Returns:
+            열 단위 비중 추이 DTO
+
+        Raises:
+            ValueError: 코드 목록이 비었거나 너무 긴 경우, 기간이 잘못된 경우
+        """
+        self.logger.info(
+            f"Executing batch weight history query: "
+            f"{len(etf_tickers)} ETFs x {len(stock_tickers)} stocks"
+        )
+
+        if not etf_tickers or not stock_tickers:
+            raise ValueError("etfs and stocks are required")
+
+        if max(len(etf_tickers), len(stock_tickers)) > self.MAX_BATCH_TICKERS:
+            raise ValueError(
+                f"Too many tickers (max {self.MAX_BATCH_TICKERS} per list)"
+            )
+
+        if start_date and end_date and start_date > end_date:
+            raise ValueError("start_date must not be after end_date")
+
+        rows = self.etf_repo.find_weight_histories(
+            list(dict.fromkeys(etf_tickers)),
+            list(dict.fromkeys(stock_tickers)),
+            start_date,
+            end_date,
+        )
+
+        self.logger.debug(f"Found {len(rows)} history records")
+
+        return WeightHistoryBatchDto.from_rows(
+            rows,
+            start_date=to_date_string(start_date) if start_date else None,
+            end_date=to_date_string(end_date) if end_date else None,
         )
 
     def get_latest_weight(self, etf_ticker: str, stock_ticker: str) -> Optional[float]:
@@ -79,13 +142,8 @@ class WeightHistoryQuery(LoggerMixin):
         Returns:
             최신 비중 (%), 데이터가 없으면 None
         """
-        holdings = self.etf_repo.find_weight_history(etf_ticker, stock_ticker)
-
-        if not holdings:
-            return None
-
-        # 날짜 기준으로 정렬되어 있으므로 마지막 항목이 최신
-        return holdings[-1].weight
+        # ✅ 개선: 전체 이력 대신 최신 한 건만 조회 (LIMIT 1)
+        return self.etf_repo.find_latest_weight(etf_ticker, stock_ticker)
 
     def has_history(self, etf_ticker: str, stock_ticker: str) -> bool:
         """
@@ -98,5 +156,5 @@ class WeightHistoryQuery(LoggerMixin):
         Returns:
             데이터 존재 여부
         """
-        holdings = self.etf_repo.find_weight_history(etf_ticker, stock_ticker)
-        return len(holdings) > 0
+        # ✅ 개선: 전체 이력 대신 존재 여부만 확인 (EXISTS)
+        return self.etf_repo.has_weight_history(etf_ticker, stock_ticker)
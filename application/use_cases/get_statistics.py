@@ -14,6 +14,7 @@ from shared.result import Result
 from application.dto.statistics_dto import (
     AmountRankingStatsDto,
     DuplicateStockStatsDto,
+    ETFOverlapMatrixDto,
     ThemeStatsDto,
 )
 from application.queries.stock_statistics_query import StockStatisticsQuery
@@ -75,6 +76,25 @@ class GetStatisticsUseCase(LoggerMixin):
             self.logger.error(f"Failed to get theme statistics: {e}", exc_info=True)
             return Result.fail("테마 통계 조회 실패")
 
+    def get_etf_overlap_matrix(
+        self,
+        date: Optional[datetime] = None,
+        theme: Optional[str] = None,
+        min_overlap: int = 1,
+        top_n: int = 20,
+    ) -> Result[ETFOverlapMatrixDto]:
+        """전체 ETF 쌍의 종목 중복도 행렬을 조회합니다."""
+        try:
+            result_dto = self.query.get_etf_overlap_matrix(
+                date, theme, min_overlap, top_n
+            )
+            return Result.ok(result_dto)
+        except ValueError as e:
+            return Result.fail(str(e))
+        except Exception as e:
+            self.logger.error(f"Failed to get ETF overlap matrix: {e}", exc_info=True)
+            return Result.fail("ETF 중복도 조회 실패")
+
     def get_statistics_summary(self, date: Optional[datetime] = None) -> Result[dict]:
         """전체 통계 요약 정보를 조회합니다."""
         try:
@@ -82,46 +102,8 @@ class GetStatisticsUseCase(LoggerMixin):
             if not date:
                 return Result.fail("데이터가 없습니다")
 
-            all_etfs = self.etf_repo.find_all()
-            all_holdings = self.etf_repo.find_holdings_by_date(date)
-
-            unique_stocks = len(set(h.stock_ticker for h in all_holdings))
-            avg_holdings = len(all_holdings) / len(all_etfs) if all_etfs else 0
-
-            stock_frequency = self.calculator.get_top_stocks_by_frequency(
-                all_holdings, top_n=1
-            )
-            most_common = None
-            if stock_frequency:
-                ticker, freq = stock_frequency[0]
-                holdings_with_name = [
-                    h for h in all_holdings if h.stock_ticker == ticker and h.stock_name
-                ]
-                stock_name = (
-                    holdings_with_name[0].stock_name if holdings_with_name else ticker
-                )
-                most_common = {"ticker": ticker, "name": stock_name, "frequency": freq}
-
-            amount_ranking = self.calculator.calculate_amount_ranking(
-                all_holdings, top_n=1
-            )
-            highest_amount = None
-            if amount_ranking:
-                highest_amount = {
-                    "ticker": amount_ranking[0]["ticker"],
-                    "name": amount_ranking[0]["name"],
-                    "amount": amount_ranking[0]["total_amount"],
-                }
-
-            summary = {
-                "date": date.strftime("%Y-%m-%d"),
-                "total_etfs": len(all_etfs),
-                "total_stocks": unique_stocks,
-                "total_holdings": len(all_holdings),
-                "avg_holdings_per_etf": round(avg_holdings, 2),
-                "most_common_stock": most_common,
-                "highest_amount_stock": highest_amount,
-            }
+            # ✅ 개선: 사전 집계 테이블 조회로 위임
+            summary = self.query.get_statistics_summary(date)
 
             return Result.ok(summary)
         except Exception as e:
@@ -135,14 +117,8 @@ class GetStatisticsUseCase(LoggerMixin):
             if not date:
                 return Result.fail("데이터가 없습니다")
 
-            all_holdings = self.etf_repo.find_holdings_by_date(date)
-            distribution = self.calculator.calculate_weight_distribution(all_holdings)
-
-            result = {
-                "date": date.strftime("%Y-%m-%d"),
-                "total_holdings": len(all_holdings),
-                "distribution": distribution,
-            }
+            # ✅ 개선: 사전 집계 테이블 조회로 위임
+            result = self.query.get_weight_distribution(date)
 
             return Result.ok(result)
         except Exception as e:
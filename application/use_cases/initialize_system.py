@@ -4,24 +4,45 @@ Initialize System Use Case
 """
 
 from datetime import datetime, timedelta
-from typing import List
+from typing import Optional, Set, Tuple
 
 from config.logging_config import LoggerMixin
 from config.settings import settings
-from domain.entities.stock import Stock
+from domain.entities.job import CheckpointStatus, Job, JobStatus
 from domain.repositories.config_repository import ConfigRepository
 from domain.repositories.etf_repository import ETFRepository
+from domain.repositories.job_repository import JobRepository
 from domain.repositories.stock_repository import StockRepository
 from domain.services.etf_filter_service import ETFFilterService
+from domain.services.trading_calendar import TradingCalendar
 from domain.value_objects.date_range import DateRange
 from domain.value_objects.filter_criteria import FilterCriteria
 from infrastructure.adapters.market_data_adapter import MarketDataAdapter
+from infrastructure.database.ingestion_writer import DailyIngestionWriter
 from shared.exceptions import ApplicationException
 from shared.result import Result
+from shared.utils.date_utils import from_date_string, to_date_string
 
 
 class InitializeSystemUseCase(LoggerMixin):
-    """시스템 초기화 유스케이스"""
+    """
+    시스템 초기화 유스케이스
+
+    ✅ 개선: 초기화를 영구 작업(Job)으로 실행합니다.
+    진행 상황은 (날짜, ETF) 단위 체크포인트로 저장되므로, 중간에 실패하거나
+    프로세스가 재시작되어도 다시 실행하면 끝난 작업은 건너뛰고 이어서 수집합니다.
+
+    단계:
+        stocks   → 기본 설정 로드 및 전체 주식 목록 수집
+        holdings → 날짜별 ETF 보유 종목 수집 (체크포인트)
+    """
+
+    JOB_TYPE = "initialize"
+
+    ALREADY_INITIALIZED_MESSAGE = "이미 데이터베이스가 존재합니다."
+
+    STAGE_STOCKS = "stocks"
+    STAGE_HOLDINGS = "holdings"
 
     def __init__(
         self,
@@ -30,53 +51,99 @@ class InitializeSystemUseCase(LoggerMixin):
         config_repository: ConfigRepository,
         market_data_adapter: MarketDataAdapter,
         filter_service: ETFFilterService,
+        trading_calendar: TradingCalendar,
+        ingestion_writer: DailyIngestionWriter,
+        job_repository: JobRepository,
     ):
         self.etf_repo = etf_repository
         self.stock_repo = stock_repository
         self.config_repo = config_repository
         self.market_adapter = market_data_adapter
         self.filter_service = filter_service
+        self.trading_calendar = trading_calendar
+        self.ingestion_writer = ingestion_writer
+        self.job_repo = job_repository
 
-    def execute(self) -> Result[dict]:
-        """시스템 초기화를 실행합니다."""
+    def prepare(self, days: Optional[int] = None) -> Result[dict]:
+        """
+        실행할 초기화 작업을 준비합니다.
+
+        미완료 초기화 작업이 있으면 새로 만들지 않고 그 작업을 반환합니다.
+        실제 수집은 run_job()에서 수행하므로 백그라운드 실행에 사용할 수 있습니다.
+
+        Args:
+            days: 수집 기간 (일), None이면 DEFAULT_COLLECT_DAYS
+                  (MAX_COLLECT_DAYS를 넘지 않음, 이어서 실행할 때는 무시)
+
+        Returns:
+            Result[dict]: {'job': Job 또는 None(이미 초기화됨), 'resumed': bool}
+        """
         try:
-            self.logger.info("Starting system initialization")
+            # 1. 이어서 실행할 작업 확인
+            job = self._find_resumable_job()
+            if job is not None:
+                self.logger.info(
+                    f"Resuming initialization job {job.id} "
+                    f"({job.done_units}/{job.total_units} days done)"
+                )
+                return Result.ok({"job": job, "resumed": True})
 
-            # 1. DB가 이미 초기화되어 있는지 확인
+            # 2. DB가 이미 초기화되어 있는지 확인
             if not self._is_initialization_needed():
                 self.logger.info("System already initialized")
-                return Result.ok(
-                    {
-                        "initialized": False,
-                        "stocks_collected": 0,
-                        "etfs_collected": 0,
-                        "days_collected": 0,
-                        "message": "이미 데이터베이스가 존재합니다.",
-                    }
-                )
-
-            # 2. 기본 설정 로드
-            self.logger.info("Loading default configuration")
-            self._load_default_config()
+                return Result.ok({"job": None, "resumed": False})
 
-            # 3. 전체 주식 목록 수집
-            self.logger.info("Collecting all stocks")
-            stocks_count = self._collect_all_stocks()
+            return Result.ok({"job": self._create_job(days), "resumed": False})
 
-            # 4. 초기 ETF 데이터 수집
-            self.logger.info(
-                f"Collecting ETF data for {settings.DEFAULT_COLLECT_DAYS} days"
+        except Exception as e:
+            self.logger.error(f"Failed to prepare initialization: {e}", exc_info=True)
+            return Result.fail(f"초기화 준비 중 오류가 발생했습니다: {str(e)}")
+
+    def execute(self, days: Optional[int] = None) -> Result[dict]:
+        """
+        시스템 초기화를 동기적으로 실행합니다.
+
+        Args:
+            days: 수집 기간 (일), prepare() 참고
+        """
+        self.logger.info("Starting system initialization")
+
+        prepared = self.prepare(days)
+        if prepared.is_failure():
+            return prepared
+
+        job = prepared.value["job"]
+        resumed = prepared.value["resumed"]
+
+        if job is None:
+            return Result.ok(
+                {
+                    "initialized": False,
+                    "job_id": None,
+                    "resumed": False,
+                    "stocks_collected": 0,
+                    "etfs_collected": 0,
+                    "days_collected": 0,
+                    "message": self.ALREADY_INITIALIZED_MESSAGE,
+                }
             )
-            etfs_count, days_count = self._collect_initial_etf_data()
+
+        try:
+            job = self.run_job(job)
 
             result = {
-                "initialized": True,
-                "stocks_collected": stocks_count,
-                "etfs_collected": etfs_count,
-                "days_collected": days_count,
-                "message": f"초기화 완료: {stocks_count}개 주식, {etfs_count}개 ETF, {days_count}일치 데이터 수집",
+                "initialized": job.status == JobStatus.COMPLETED,
+                "job_id": job.id,
+                "resumed": resumed,
+                "stocks_collected": self.stock_repo.count(),
+                "etfs_collected": self.etf_repo.count(),
+                "days_collected": job.done_units,
+                "message": job.message,
             }
 
+            if job.error:
+                return Result.fail(job.error)
+
             self.logger.info(f"Initialization completed: {result}")
             return Result.ok(result)
 
@@ -84,11 +151,86 @@ class InitializeSystemUseCase(LoggerMixin):
             self.logger.error(f"Initialization failed: {e}", exc_info=True)
             return Result.fail(f"초기화 중 오류가 발생했습니다: {str(e)}")
 
+    def run_job(self, job: Job) -> Job:
+        """
+        초기화 작업을 현재 단계부터 실행합니다.
+
+        Returns:
+            실행 후 작업 상태 (모든 날짜를 수집하지 못하면 FAILED)
+
+        Raises:
+            ApplicationException: 수집 중 복구할 수 없는 오류 (작업은 FAILED로 저장됨)
+        """
+        job = job.start(job.stage or self.STAGE_STOCKS)
+        self.job_repo.save(job)
+
+        try:
+            # 1. 기본 설정 및 주식 목록
+            if job.stage == self.STAGE_STOCKS:
+                self.logger.info("Loading default configuration")
+                self._load_default_config()
+
+                self.logger.info("Collecting all stocks")
+                stocks_count = self._collect_all_stocks()
+
+                job = job.with_stage(
+                    self.STAGE_HOLDINGS, f"{stocks_count}개 주식 수집 완료"
+                )
+                self.job_repo.save(job)
+
+            # 2. 날짜별 보유 종목 (체크포인트)
+            return self._collect_initial_etf_data(job)
+
+        except Exception as e:
+            self._save_failure(job, str(e))
+            raise
+
+    def _find_resumable_job(self) -> Optional[Job]:
+        """이어서 실행할 초기화 작업을 찾습니다."""
+        job = self.job_repo.find_latest(self.JOB_TYPE)
+        if job and job.is_resumable():
+            return job
+        return None
+
     def _is_initialization_needed(self) -> bool:
         """초기화가 필요한지 확인"""
+        # 완료된 초기화 작업이 있으면 불필요
+        latest = self.job_repo.find_latest(self.JOB_TYPE)
+        if latest is not None and not latest.is_resumable():
+            return False
+
+        # 작업 기록 이전에 초기화된 DB 호환
         etf_count = self.etf_repo.count()
         return etf_count == 0
 
+    def _create_job(self, days: Optional[int]) -> Job:
+        """수집 기간을 고정한 새 초기화 작업을 생성합니다."""
+        days = days or settings.DEFAULT_COLLECT_DAYS
+        days = max(1, min(days, settings.MAX_COLLECT_DAYS))
+
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+
+        job = Job.create(
+            self.JOB_TYPE,
+            {
+                "days": days,
+                "start_date": to_date_string(start_date),
+                "end_date": to_date_string(end_date),
+            },
+        )
+        self.job_repo.save(job)
+
+        self.logger.info(f"Created initialization job {job.id} for {days} days")
+        return job
+
+    def _save_failure(self, job: Job, error: str) -> None:
+        """작업을 실패 상태로 저장합니다. (저장 실패는 로그만 남김)"""
+        try:
+            self.job_repo.save(job.fail(error))
+        except Exception as e:
+            self.logger.warning(f"Failed to save job failure: {e}")
+
     def _load_default_config(self) -> None:
         """기본 설정을 로드합니다."""
         existing_themes = self.config_repo.get_all_themes()
@@ -120,11 +262,16 @@ class InitializeSystemUseCase(LoggerMixin):
             self.logger.error(f"Failed to collect stocks: {e}")
             raise ApplicationException(f"주식 목록 수집 실패: {str(e)}")
 
-    def _collect_initial_etf_data(self) -> tuple[int, int]:
-        """초기 ETF 데이터를 수집합니다."""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=settings.DEFAULT_COLLECT_DAYS)
-        date_range = DateRange.create(start_date, end_date)
+    def _collect_initial_etf_data(self, job: Job) -> Job:
+        """
+        초기 ETF 데이터를 수집합니다.
+
+        이미 완료된 날짜는 건너뛰고, 날짜마다 진행 상황을 저장합니다.
+        """
+        date_range = DateRange.create(
+            from_date_string(job.params["start_date"]),
+            from_date_string(job.params["end_date"]),
+        )
 
         criteria = FilterCriteria.create(
             themes=self.config_repo.get_all_themes(),
@@ -132,94 +279,124 @@ class InitializeSystemUseCase(LoggerMixin):
             require_active=settings.REQUIRE_ACTIVE_KEYWORD,
         )
 
-        collected_etfs = set()
-        days_collected = 0
+        # 거래일 캘린더로 휴장일을 미리 제외
+        business_days = date_range.business_days(self.trading_calendar)
+        completed_dates = self.job_repo.find_completed_dates(job.id)
+        failed_days = 0
 
-        business_days = date_range.business_days()
+        job = job.with_progress(len(completed_dates), len(business_days))
+        self.job_repo.save(job)
 
         for date in business_days:
-            self.logger.debug(f"Collecting data for {date.strftime('%Y-%m-%d')}")
-
-            try:
-                if not self.market_adapter.is_business_day(date):
-                    self.logger.debug(
-                        f"{date.strftime('%Y-%m-%d')} is not a business day"
-                    )
-                    continue
+            date_str = to_date_string(date)
+            if date_str in completed_dates:
+                continue
 
-                etfs_on_date = self._collect_etf_data_for_date(date, criteria)
+            self.logger.debug(f"Collecting data for {date_str}")
 
-                if etfs_on_date:
-                    collected_etfs.update(etf.ticker for etf in etfs_on_date)
-                    days_collected += 1
-                    self.logger.info(
-                        f"Collected {len(etfs_on_date)} ETFs for {date.strftime('%Y-%m-%d')}"
-                    )
+            etfs_done = rows_written = 0
+            try:
+                complete, etfs_done, rows_written = self._collect_etf_data_for_date(
+                    date, criteria, job.id
+                )
+                if complete:
+                    completed_dates.add(date_str)
+                else:
+                    failed_days += 1
 
             except Exception as e:
-                self.logger.warning(
-                    f"Failed to collect data for {date.strftime('%Y-%m-%d')}: {e}"
-                )
-                continue
+                self.logger.warning(f"Failed to collect data for {date_str}: {e}")
+                failed_days += 1
+
+            job = job.with_progress(
+                len(completed_dates),
+                len(business_days),
+                f"{len(completed_dates)}/{len(business_days)}일 수집 완료",
+                etfs_done=etfs_done,
+                rows_written=rows_written,
+            )
+            self.job_repo.save(job)
 
-        return len(collected_etfs), days_collected
+        if failed_days:
+            job = job.fail(
+                f"{failed_days}일의 데이터를 모두 수집하지 못했습니다. "
+                "다시 실행하면 남은 데이터만 이어서 수집합니다."
+            )
+        else:
+            job = job.complete(
+                f"초기화 완료: {self.stock_repo.count()}개 주식, "
+                f"{self.etf_repo.count()}개 ETF, {len(completed_dates)}일치 데이터 수집"
+            )
+
+        self.job_repo.save(job)
+        return job
 
     def _collect_etf_data_for_date(
-        self, date: datetime, criteria: FilterCriteria
-    ) -> List:
-        """✅ 수정: 특정 날짜의 ETF 데이터를 수집합니다."""
+        self, date: datetime, criteria: FilterCriteria, job_id: str
+    ) -> Tuple[bool, int, int]:
+        """
+        ✅ 수정: 특정 날짜의 ETF 데이터를 수집합니다.
+
+        보유 종목과 (날짜, ETF) 체크포인트를 한 트랜잭션으로 저장합니다.
+
+        Returns:
+            (날짜 전체 수집 완료 여부, 처리한 ETF 수, 저장한 보유 종목 행 수)
+            일부 ETF 수집에 실패하면 완료 여부는 False
+        """
         try:
             # 해당 날짜의 모든 ETF 수집
             all_etfs = self.market_adapter.collect_etfs_for_date(date)
 
-            if not all_etfs:
-                return []
-
             # 필터링
-            filtered_etfs = self.filter_service.filter_etfs(all_etfs, criteria)
+            filtered_etfs = (
+                self.filter_service.filter_etfs(all_etfs, criteria) if all_etfs else []
+            )
 
-            # ETF 저장
-            for etf in filtered_etfs:
-                self.etf_repo.save(etf)
+            # ✅ 개선: ETF, 종목, 보유 종목을 모아서 한 번의 트랜잭션으로 저장
+            batch = self.ingestion_writer.new_batch(date, job_id=job_id)
+            batch.add_etfs(filtered_etfs)
 
-            # 각 ETF의 보유 종목 수집
-            for etf in filtered_etfs:
-                try:
-                    holdings = self.market_adapter.collect_holdings_for_date(
-                        etf.ticker, date
-                    )
+            # 체크포인트가 있거나 이미 보유 종목이 저장된 ETF는 건너뜀
+            _, collected_tickers = self.etf_repo.get_collection_status(date)
+            done_tickers: Set[str] = collected_tickers | (
+                self.job_repo.find_checkpointed_tickers(job_id, date)
+            )
 
-                    if holdings:
-                        # ✅ 추가: Holdings 저장 전에 종목 정보 먼저 저장
-                        unique_stocks = {}
-                        for holding in holdings:
-                            if holding.stock_ticker not in unique_stocks:
-                                stock = Stock.create(
-                                    ticker=holding.stock_ticker,
-                                    name=holding.stock_name or holding.stock_ticker,
-                                )
-                                unique_stocks[holding.stock_ticker] = stock
-
-                        # 종목 정보 먼저 저장 (INSERT OR IGNORE로 중복 무시)
-                        if unique_stocks:
-                            self.stock_repo.save_all(list(unique_stocks.values()))
-                            self.logger.debug(
-                                f"Ensured {len(unique_stocks)} stocks exist for {etf.ticker}"
-                            )
-
-                        # 이제 Holdings 저장
-                        self.etf_repo.save_holdings(holdings)
-                        self.logger.debug(
-                            f"Saved {len(holdings)} holdings for {etf.ticker}"
-                        )
-
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to collect holdings for {etf.ticker}: {e}"
+            # 병렬 수집 결과를 배치에 누적 (종목 정보는 보유 종목에서 함께 추출)
+            pending_tickers = [
+                etf.ticker for etf in filtered_etfs if etf.ticker not in done_tickers
+            ]
+            for etf_ticker, holdings in self.market_adapter.collect_holdings_for_etfs(
+                pending_tickers, date
+            ):
+                if holdings:
+                    batch.add_holdings(holdings)
+                    batch.add_checkpoint(etf_ticker, CheckpointStatus.DONE)
+                    self.logger.debug(
+                        f"Collected {len(holdings)} holdings for {etf_ticker}"
                     )
-                    continue
+                else:
+                    batch.add_checkpoint(etf_ticker, CheckpointStatus.EMPTY)
+
+            # 수집에 실패한 ETF가 없을 때만 날짜 완료 처리
+            failed_tickers = set(pending_tickers) - set(batch.checkpoints)
+            if failed_tickers:
+                self.logger.warning(
+                    f"{len(failed_tickers)} ETFs failed on {to_date_string(date)}, "
+                    "will retry on resume"
+                )
+            else:
+                batch.mark_day_complete()
+
+            written = self.ingestion_writer.write(batch)
+
+            if filtered_etfs:
+                self.logger.info(
+                    f"Collected {len(filtered_etfs)} ETFs for {to_date_string(date)}"
+                )
 
-            return filtered_etfs
+            etfs_done = len(pending_tickers) - len(failed_tickers)
+            return not failed_tickers, etfs_done, written.holdings_inserted
 
         except Exception as e:
             self.logger.error(f"Failed to collect ETF data for date: {e}")
@@ -4,17 +4,23 @@ ETF 데이터 업데이트 유스케이스입니다.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Set
+from typing import List, Set, Tuple
 
 from config.logging_config import LoggerMixin
+from domain.entities.etf import ETF
+from domain.entities.job import Job
 from domain.repositories.config_repository import ConfigRepository
 from domain.repositories.etf_repository import ETFRepository
+from domain.repositories.job_repository import JobRepository
 from domain.services.etf_filter_service import ETFFilterService
+from domain.services.trading_calendar import TradingCalendar
 from domain.value_objects.date_range import DateRange
 from domain.value_objects.filter_criteria import FilterCriteria
 from infrastructure.adapters.market_data_adapter import MarketDataAdapter
+from infrastructure.database.ingestion_writer import DailyIngestionWriter
 from shared.exceptions import ApplicationException
 from shared.result import Result
+from shared.utils.date_utils import from_date_string, to_date_string
 
 
 class UpdateETFDataUseCase(LoggerMixin):
@@ -28,38 +34,43 @@ class UpdateETFDataUseCase(LoggerMixin):
         config_repository: Config 리포지토리
         market_data_adapter: 시장 데이터 어댑터
         filter_service: ETF 필터링 서비스
+        trading_calendar: 거래일 캘린더
+        ingestion_writer: 일 단위 일괄 저장기
+        job_repository: 작업 리포지토리 (진행 상황 기록)
     """
 
+    JOB_TYPE = "update"
+
+    UP_TO_DATE_MESSAGE = "이미 최신 데이터입니다."
+
     def __init__(
         self,
         etf_repository: ETFRepository,
         config_repository: ConfigRepository,
         market_data_adapter: MarketDataAdapter,
         filter_service: ETFFilterService,
+        trading_calendar: TradingCalendar,
+        ingestion_writer: DailyIngestionWriter,
+        job_repository: JobRepository,
     ):
         self.etf_repo = etf_repository
         self.config_repo = config_repository
         self.market_adapter = market_data_adapter
         self.filter_service = filter_service
+        self.trading_calendar = trading_calendar
+        self.ingestion_writer = ingestion_writer
+        self.job_repo = job_repository
 
-    def execute(self) -> Result[dict]:
+    def prepare(self) -> Result[dict]:
         """
-        데이터 업데이트를 실행합니다.
+        ✅ 추가: 실행할 업데이트 작업을 준비합니다.
+
+        실제 수집은 run_job()에서 수행하므로 백그라운드 실행에 사용할 수 있습니다.
 
         Returns:
-            Result[dict]: 업데이트 결과
-            {
-                'updated': bool,
-                'etfs_updated': int,
-                'days_updated': int,
-                'start_date': str,
-                'end_date': str,
-                'message': str
-            }
+            Result[dict]: {'job': Job 또는 None(이미 최신), 'start_date', 'end_date'}
         """
         try:
-            self.logger.info("Starting ETF data update")
-
             # 1. 최신 날짜 확인
             latest_date = self.etf_repo.get_latest_date()
             if not latest_date:
@@ -69,35 +80,76 @@ class UpdateETFDataUseCase(LoggerMixin):
             start_date = latest_date + timedelta(days=1)
             end_date = datetime.now()
 
+            data = {
+                "job": None,
+                "start_date": to_date_string(start_date),
+                "end_date": to_date_string(end_date),
+            }
+
             # 업데이트할 날짜가 없는 경우
             if start_date > end_date:
                 self.logger.info("Already up to date")
-                return Result.ok(
-                    {
-                        "updated": False,
-                        "etfs_updated": 0,
-                        "days_updated": 0,
-                        "start_date": start_date.strftime("%Y-%m-%d"),
-                        "end_date": end_date.strftime("%Y-%m-%d"),
-                        "message": "이미 최신 데이터입니다.",
-                    }
-                )
+                return Result.ok(data)
 
-            self.logger.info(
-                f"Updating data from {start_date.strftime('%Y-%m-%d')} "
-                f"to {end_date.strftime('%Y-%m-%d')}"
+            data["job"] = Job.create(
+                self.JOB_TYPE,
+                {"start_date": data["start_date"], "end_date": data["end_date"]},
+            )
+            self.job_repo.save(data["job"])
+
+            return Result.ok(data)
+
+        except Exception as e:
+            self.logger.error(f"Failed to prepare update: {e}", exc_info=True)
+            return Result.fail(f"데이터 업데이트 준비 중 오류가 발생했습니다: {str(e)}")
+
+    def execute(self) -> Result[dict]:
+        """
+        데이터 업데이트를 동기적으로 실행합니다.
+
+        Returns:
+            Result[dict]: 업데이트 결과
+            {
+                'updated': bool,
+                'etfs_updated': int,
+                'days_updated': int,
+                'start_date': str,
+                'end_date': str,
+                'message': str
+            }
+        """
+        self.logger.info("Starting ETF data update")
+
+        prepared = self.prepare()
+        if prepared.is_failure():
+            return prepared
+
+        job = prepared.value["job"]
+        start_date = prepared.value["start_date"]
+        end_date = prepared.value["end_date"]
+
+        if job is None:
+            return Result.ok(
+                {
+                    "updated": False,
+                    "etfs_updated": 0,
+                    "days_updated": 0,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "message": self.UP_TO_DATE_MESSAGE,
+                }
             )
 
-            # 3. 데이터 업데이트 수행
-            etfs_updated, days_updated = self._update_data_range(start_date, end_date)
+        try:
+            job, etfs_updated, days_updated = self._run(job)
 
             result = {
                 "updated": True,
                 "etfs_updated": etfs_updated,
                 "days_updated": days_updated,
-                "start_date": start_date.strftime("%Y-%m-%d"),
-                "end_date": end_date.strftime("%Y-%m-%d"),
-                "message": f"{days_updated}일치 데이터 업데이트 완료 ({etfs_updated}개 ETF)",
+                "start_date": start_date,
+                "end_date": end_date,
+                "message": job.message,
             }
 
             self.logger.info(f"Update completed: {result}")
@@ -107,16 +159,54 @@ class UpdateETFDataUseCase(LoggerMixin):
             self.logger.error(f"Update failed: {e}", exc_info=True)
             return Result.fail(f"데이터 업데이트 중 오류가 발생했습니다: {str(e)}")
 
-    def _update_data_range(
-        self, start_date: datetime, end_date: datetime
-    ) -> tuple[int, int]:
+    def run_job(self, job: Job) -> Job:
         """
-        날짜 범위의 데이터를 업데이트합니다.
+        ✅ 추가: 업데이트 작업을 실행하고 최종 작업 상태를 반환합니다.
+
+        날짜마다 진행 상황(완료 일수, ETF 수, 저장 행 수)을 저장합니다.
+        """
+        job, _, _ = self._run(job)
+        return job
+
+    def _run(self, job: Job) -> Tuple[Job, int, int]:
+        """
+        업데이트 작업을 실행합니다.
 
         Returns:
-            (업데이트된 ETF 개수, 업데이트된 일수)
+            (최종 작업, 업데이트된 ETF 개수, 업데이트된 일수)
         """
-        date_range = DateRange.create(start_date, end_date)
+        job = job.start()
+        self.job_repo.save(job)
+
+        try:
+            self.logger.info(
+                f"Updating data from {job.params['start_date']} "
+                f"to {job.params['end_date']}"
+            )
+
+            job, etfs_updated, days_updated = self._update_data_range(job)
+
+            job = job.complete(
+                f"{days_updated}일치 데이터 업데이트 완료 ({etfs_updated}개 ETF)"
+            )
+            self.job_repo.save(job)
+            return job, etfs_updated, days_updated
+
+        except Exception as e:
+            self.job_repo.save(job.fail(str(e)))
+            raise
+
+    def _update_data_range(self, job: Job) -> Tuple[Job, int, int]:
+        """
+        작업의 날짜 범위 데이터를 업데이트합니다.
+
+        Returns:
+            (진행 상황이 반영된 작업, 업데이트된 ETF 개수, 업데이트된 일수)
+        """
+        date_range = DateRange.create(
+            from_date_string(job.params["start_date"]),
+            from_date_string(job.params["end_date"]),
+        )
 
         # 필터 조건 생성
         criteria = FilterCriteria.create(
@@ -129,21 +219,21 @@ class UpdateETFDataUseCase(LoggerMixin):
         days_updated = 0
 
         # 영업일만 업데이트
-        business_days = date_range.business_days()
+        # ✅ 개선: 거래일 캘린더로 휴장일을 미리 제외 (날짜별 API 확인 제거)
+        business_days = date_range.business_days(self.trading_calendar)
 
-        for date in business_days:
+        job = job.with_progress(0, len(business_days))
+        self.job_repo.save(job)
+
+        for index, date in enumerate(business_days, start=1):
             self.logger.debug(f"Updating data for {date.strftime('%Y-%m-%d')}")
 
+            etfs_done = rows_written = 0
             try:
-                # 해당 날짜가 영업일인지 확인
-                if not self.market_adapter.is_business_day(date):
-                    self.logger.debug(
-                        f"{date.strftime('%Y-%m-%d')} is not a business day"
-                    )
-                    continue
-
                 # 해당 날짜의 데이터 수집
-                etfs_on_date = self._collect_and_save_for_date(date, criteria)
+                etfs_on_date, etfs_done, rows_written = self._collect_and_save_for_date(
+                    date, criteria
+                )
 
                 if etfs_on_date:
                     updated_etfs.update(etf.ticker for etf in etfs_on_date)
@@ -156,62 +246,74 @@ class UpdateETFDataUseCase(LoggerMixin):
                 self.logger.warning(
                     f"Failed to update data for {date.strftime('%Y-%m-%d')}: {e}"
                 )
-                continue
 
-        return len(updated_etfs), days_updated
+            job = job.with_progress(
+                index,
+                len(business_days),
+                f"{index}/{len(business_days)}일 업데이트 완료",
+                etfs_done=etfs_done,
+                rows_written=rows_written,
+            )
+            self.job_repo.save(job)
+
+        return job, len(updated_etfs), days_updated
 
     def _collect_and_save_for_date(
         self, date: datetime, criteria: FilterCriteria
-    ) -> List:
-        """특정 날짜의 데이터를 수집하고 저장합니다."""
+    ) -> Tuple[List[ETF], int, int]:
+        """
+        특정 날짜의 데이터를 수집하고 저장합니다.
+
+        Returns:
+            (필터링된 ETF 리스트, 보유 종목을 수집한 ETF 수, 저장한 보유 종목 행 수)
+        """
         try:
             # 해당 날짜의 모든 ETF 수집
             all_etfs = self.market_adapter.collect_etfs_for_date(date)
 
             if not all_etfs:
-                return []
+                return [], 0, 0
 
             # 필터링
             filtered_etfs = self.filter_service.filter_etfs(all_etfs, criteria)
 
-            # 새로운 ETF 저장 (기존 ETF는 자동으로 무시됨)
-            for etf in filtered_etfs:
-                if not self.etf_repo.exists(etf.ticker):
-                    self.etf_repo.save(etf)
-
-            # 각 ETF의 보유 종목 수집
-            for etf in filtered_etfs:
-                try:
-                    # 이미 해당 날짜의 데이터가 있는지 확인
-                    existing_holdings = self.etf_repo.find_holdings_by_etf_and_date(
-                        etf.ticker, date
-                    )
+            # ✅ 개선: 등록/수집 현황을 한 번에 조회하여 이미 수집된 ETF 제외
+            known_tickers, collected_tickers = self.etf_repo.get_collection_status(date)
 
-                    if existing_holdings:
-                        self.logger.debug(
-                            f"Holdings already exist for {etf.ticker} on "
-                            f"{date.strftime('%Y-%m-%d')}"
-                        )
-                        continue
-
-                    # 보유 종목 수집
-                    holdings = self.market_adapter.collect_holdings_for_date(
-                        etf.ticker, date
-                    )
+            # 하루치 데이터를 모아서 한 번의 트랜잭션으로 저장
+            batch = self.ingestion_writer.new_batch(date)
+            batch.add_etfs(
+                etf for etf in filtered_etfs if etf.ticker not in known_tickers
+            )
 
-                    if holdings:
-                        self.etf_repo.save_holdings(holdings)
-                        self.logger.debug(
-                            f"Saved {len(holdings)} holdings for {etf.ticker}"
-                        )
+            pending_tickers = [
+                etf.ticker
+                for etf in filtered_etfs
+                if etf.ticker not in collected_tickers
+            ]
+
+            skipped = len(filtered_etfs) - len(pending_tickers)
+            if skipped:
+                self.logger.debug(
+                    f"Holdings already exist for {skipped} ETFs on "
+                    f"{date.strftime('%Y-%m-%d')}"
+                )
 
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to collect holdings for {etf.ticker}: {e}"
+            # 병렬 수집 결과를 배치에 누적
+            etfs_done = 0
+            for etf_ticker, holdings in self.market_adapter.collect_holdings_for_etfs(
+                pending_tickers, date
+            ):
+                etfs_done += 1
+                if holdings:
+                    batch.add_holdings(holdings)
+                    self.logger.debug(
+                        f"Collected {len(holdings)} holdings for {etf_ticker}"
                     )
-                    continue
 
-            return filtered_etfs
+            written = self.ingestion_writer.write(batch)
+
+            return filtered_etfs, etfs_done, written.holdings_inserted
 
         except Exception as e:
             self.logger.error(f"Failed to collect data for date: {e}")
@@ -241,7 +343,7 @@ class UpdateETFDataUseCase(LoggerMixin):
             )
 
             # 데이터 수집
-            etfs = self._collect_and_save_for_date(date, criteria)
+            etfs, _, _ = self._collect_and_save_for_date(date, criteria)
 
             result = {
                 "updated": True,
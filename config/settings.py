@@ -31,6 +31,14 @@ class Settings:
     API_DELAY_SECONDS = 0.1
     RETRY_MAX_ATTEMPTS = 3
     RETRY_DELAY_SECONDS = 1
+    # 보유 종목 병렬 수집 워커 수 (요청 속도는 API_DELAY_SECONDS로 공통 제한)
+    COLLECT_MAX_WORKERS = int(os.getenv("COLLECT_MAX_WORKERS", "4"))
+    # 종목/ETF 이름 캐시 갱신 주기 (일)
+    NAME_CACHE_TTL_DAYS = int(os.getenv("NAME_CACHE_TTL_DAYS", "30"))
+    # 저장된 휴장일 재확인 주기 (일)
+    TRADING_CALENDAR_CLOSED_TTL_DAYS = int(
+        os.getenv("TRADING_CALENDAR_CLOSED_TTL_DAYS", "30")
+    )
 
     # ETF 필터링 설정
     REQUIRE_ACTIVE_KEYWORD = True
@@ -104,6 +112,12 @@ class Settings:
     # ✅ 캐싱 설정 (Medium Priority)
     CACHE_ENABLED = os.getenv("CACHE_ENABLED", "True").lower() == "true"
     CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))  # 5분
+    # ✅ 캐시 상한 (초과 시 LRU 제거, 0이면 제한 없음)과 만료 정리 주기
+    CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "2048"))
+    CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+    CACHE_SWEEP_INTERVAL_SECONDS = int(os.getenv("CACHE_SWEEP_INTERVAL_SECONDS", "60"))
+    # ✅ 없는 결과(None) 캐시 TTL (짧게 유지, 0이면 캐시하지 않음)
+    CACHE_NEGATIVE_TTL_SECONDS = int(os.getenv("CACHE_NEGATIVE_TTL_SECONDS", "30"))
 
     # 캐시 TTL 세부 설정
     CACHE_TTL_ETF_LIST = 300  # ETF 목록: 5분
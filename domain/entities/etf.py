@@ -34,6 +34,9 @@ class ETF:
     ticker: str
     name: str
 
+    # 액티브 ETF 판별 키워드
+    ACTIVE_KEYWORD = "액티브"
+
     @staticmethod
     def create(ticker: str, name: str) -> "ETF":
         """
@@ -89,7 +92,7 @@ class ETF:
 
     def is_active(self) -> bool:
         """액티브 ETF인지 확인"""
-        return "액티브" in self.name
+        return ETF.ACTIVE_KEYWORD in self.name
 
     def contains_keyword(self, keyword: str) -> bool:
         """ETF명에 특정 키워드가 포함되어 있는지 확인"""
@@ -3,25 +3,69 @@ Holding 엔티티
 ETF의 보유 종목 정보를 표현하는 도메인 엔티티입니다.
 """
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from typing import NamedTuple
 
+from domain.value_objects.weight_change import WEIGHT_CHANGE_THRESHOLD
 from shared.exceptions import InvalidEntityException
 from shared.utils.date_utils import to_date_string
 from shared.utils.validation import is_valid_amount, is_valid_ticker, is_valid_weight
 
 
-@dataclass(frozen=True)
+class HoldingRow(NamedTuple):
+    """
+    보유 종목 경량 행
+
+    엔티티 메서드가 필요 없는 대량 조회에서 Holding 대신 사용하는 읽기 전용 튜플입니다.
+    날짜는 파싱하지 않은 문자열(YYYY-MM-DD)을 그대로 담습니다.
+    """
+
+    etf_ticker: str
+    stock_ticker: str
+    date: str
+    weight: float
+    amount: float
+    stock_name: str
+
+
+@lru_cache(maxsize=4096)
+def _date_ordinal(date: datetime) -> int:
+    """날짜의 서수(ordinal)를 반환합니다. (같은 날짜는 같은 int 객체를 공유)"""
+    return date.toordinal()
+
+
+@lru_cache(maxsize=4096)
+def _date_from_ordinal(ordinal: int) -> datetime:
+    """서수(ordinal)를 datetime으로 변환합니다. (같은 날짜는 같은 객체를 공유)"""
+    return datetime.fromordinal(ordinal)
+
+
+def _intern(value: str) -> str:
+    """문자열을 intern합니다. (numpy.str_ 등 str 하위 타입도 허용)"""
+    return sys.intern(str(value)) if value else ""
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class Holding:
     """
     보유 종목 엔티티
 
     특정 날짜의 ETF 보유 종목 정보를 표현합니다.
 
+    ✅ 개선: 날짜 범위를 한 번에 읽을 때 객체 수가 많으므로 메모리를 줄였습니다.
+    - __slots__ 사용 (인스턴스별 __dict__ 없음)
+    - 종목 코드/종목명은 intern하여 같은 문자열을 공유
+    - 기준일은 서수(date_ordinal)로 저장하고 date 속성에서 datetime으로 변환
+      (시각 정보는 버리며, 기준일은 날짜 단위로만 사용)
+
     Attributes:
         etf_ticker: ETF 코드
         stock_ticker: 종목 코드
-        date: 기준일
+        date: 기준일 (date_ordinal에서 계산)
+        date_ordinal: 기준일 서수 (datetime.toordinal())
         weight: 비중 (%)
         amount: 평가금액 (원)
         stock_name: 종목명 (조회 시 조인으로 채워짐)
@@ -42,10 +86,31 @@ class Holding:
 
     etf_ticker: str
     stock_ticker: str
-    date: datetime
+    date_ordinal: int
     weight: float
-    amount: float = 0.0
-    stock_name: str = ""
+    amount: float
+    stock_name: str
+
+    def __init__(
+        self,
+        etf_ticker: str,
+        stock_ticker: str,
+        date: datetime,
+        weight: float,
+        amount: float = 0.0,
+        stock_name: str = "",
+    ):
+        object.__setattr__(self, "etf_ticker", _intern(etf_ticker))
+        object.__setattr__(self, "stock_ticker", _intern(stock_ticker))
+        object.__setattr__(self, "date_ordinal", _date_ordinal(date))
+        object.__setattr__(self, "weight", weight)
+        object.__setattr__(self, "amount", amount)
+        object.__setattr__(self, "stock_name", _intern(stock_name))
+
+    @property
+    def date(self) -> datetime:
+        """기준일"""
+        return _date_from_ordinal(self.date_ordinal)
 
     @staticmethod
     def create(
@@ -110,6 +175,33 @@ class Holding:
             stock_name=stock_name.strip() if stock_name else "",
         )
 
+    @staticmethod
+    def from_trusted(
+        etf_ticker: str,
+        stock_ticker: str,
+        date: datetime,
+        weight: float,
+        amount: float = 0.0,
+        stock_name: str = "",
+    ) -> "Holding":
+        """
+        검증을 생략하고 Holding 인스턴스를 생성합니다.
+
+        ✅ 추가: DB에서 읽은 행처럼 저장 시 이미 create()로 검증/정규화된
+        값을 다시 엔티티로 만들 때만 사용합니다. 외부 입력에는 create()를 사용하세요.
+
+        Args:
+            etf_ticker: 정규화된 ETF 코드
+            stock_ticker: 정규화된 종목 코드
+            date: 기준일
+            weight: 비중 (%)
+            amount: 평가금액 (원, NULL이면 0)
+            stock_name: 종목명 (NULL이면 빈 문자열)
+        """
+        return Holding(
+            etf_ticker, stock_ticker, date, weight, amount or 0.0, stock_name or ""
+        )
+
     def to_dict(self) -> dict:
         """엔티티를 딕셔너리로 변환"""
         return {
@@ -169,7 +261,9 @@ class Holding:
 
         return self.weight - other.weight
 
-    def has_weight_increased(self, other: "Holding", threshold: float = 0.01) -> bool:
+    def has_weight_increased(
+        self, other: "Holding", threshold: float = WEIGHT_CHANGE_THRESHOLD
+    ) -> bool:
         """
         비중이 증가했는지 확인
 
@@ -180,7 +274,9 @@ class Holding:
         change = self.calculate_weight_change(other)
         return change > threshold
 
-    def has_weight_decreased(self, other: "Holding", threshold: float = 0.01) -> bool:
+    def has_weight_decreased(
+        self, other: "Holding", threshold: float = WEIGHT_CHANGE_THRESHOLD
+    ) -> bool:
         """
         비중이 감소했는지 확인
 
@@ -0,0 +1,214 @@
+"""
+Job 엔티티
+초기화/백필처럼 오래 걸리는 작업의 실행 상태를 표현하는 도메인 엔티티입니다.
+"""
+
+import uuid
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from shared.exceptions import InvalidEntityException
+from shared.utils.validation import is_non_empty_string
+
+
+class JobStatus:
+    """작업 상태 값"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    # 이어서 실행할 수 있는 상태 (RUNNING은 프로세스 중단으로 남은 경우)
+    RESUMABLE = (PENDING, RUNNING, FAILED)
+
+
+class CheckpointStatus:
+    """체크포인트 상태 값"""
+
+    DONE = "done"  # 보유 종목 저장 완료
+    EMPTY = "empty"  # 조회 결과 없음 (재수집 불필요)
+
+    # 날짜 전체가 완료되었음을 나타내는 ETF 코드 자리 표시자
+    DAY_MARKER = "*"
+
+
+@dataclass(frozen=True)
+class Job:
+    """
+    작업 엔티티
+
+    작업 진행 상황은 날짜 단위(units)로 집계하며, 세부 진행은
+    (날짜, ETF) 단위 체크포인트로 별도 저장합니다.
+    남은 시간(ETA)은 이번 실행에서 처리한 날짜의 평균 소요 시간으로 추정합니다.
+
+    Attributes:
+        id: 작업 ID
+        job_type: 작업 종류 (예: "initialize")
+        status: 작업 상태 (JobStatus)
+        stage: 현재 단계
+        params: 작업 파라미터 (재개 시 동일하게 사용)
+        total_units: 전체 처리 단위 수
+        done_units: 완료된 처리 단위 수
+        etfs_done: 처리한 ETF 수
+        rows_written: 저장한 보유 종목 행 수
+        message: 진행/결과 메시지
+        error: 마지막 오류 메시지
+        started_units: 이번 실행을 시작할 때의 완료 단위 수 (ETA 계산용)
+        started_at: 이번 실행 시작 시각
+        finished_at: 종료 시각
+        created_at: 생성 시각
+        updated_at: 마지막 갱신 시각
+
+    Examples:
+        >>> job = Job.create("initialize", {"days": 10})
+        >>> job.status
+        'pending'
+        >>> job.with_progress(3, 10).progress_percent
+        30.0
+    """
+
+    id: str
+    job_type: str
+    status: str = JobStatus.PENDING
+    stage: str = ""
+    params: Dict[str, Any] = field(default_factory=dict)
+    total_units: int = 0
+    done_units: int = 0
+    etfs_done: int = 0
+    rows_written: int = 0
+    message: str = ""
+    error: str = ""
+    started_units: int = 0
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @staticmethod
+    def create(job_type: str, params: Optional[Dict[str, Any]] = None) -> "Job":
+        """
+        새 작업을 생성합니다.
+
+        Args:
+            job_type: 작업 종류
+            params: 작업 파라미터
+
+        Raises:
+            InvalidEntityException: 작업 종류가 비어 있는 경우
+        """
+        if not is_non_empty_string(job_type):
+            raise InvalidEntityException("Job", "Job type cannot be empty")
+
+        return Job(id=uuid.uuid4().hex, job_type=job_type, params=dict(params or {}))
+
+    def is_resumable(self) -> bool:
+        """이어서 실행할 수 있는 상태인지 확인"""
+        return self.status in JobStatus.RESUMABLE
+
+    def is_finished(self) -> bool:
+        """완료 또는 실패로 끝났는지 확인"""
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+    @property
+    def progress_percent(self) -> float:
+        """진행률 (%)"""
+        if self.total_units <= 0:
+            return 100.0 if self.status == JobStatus.COMPLETED else 0.0
+        return round(self.done_units / self.total_units * 100, 1)
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """남은 예상 시간 (초), 추정할 수 없으면 None"""
+        if self.status != JobStatus.RUNNING or self.started_at is None:
+            return None
+
+        units_this_run = self.done_units - self.started_units
+        if units_this_run <= 0 or self.total_units <= 0:
+            return None
+
+        elapsed = (datetime.now() - self.started_at).total_seconds()
+        remaining = max(self.total_units - self.done_units, 0)
+        return round(elapsed / units_this_run * remaining, 1)
+
+    def start(self, stage: str = "") -> "Job":
+        """실행 상태로 전환한 새 Job 반환"""
+        return replace(
+            self,
+            status=JobStatus.RUNNING,
+            stage=stage or self.stage,
+            error="",
+            started_units=self.done_units,
+            started_at=datetime.now(),
+            finished_at=None,
+        )
+
+    def with_stage(self, stage: str, message: str = "") -> "Job":
+        """단계를 변경한 새 Job 반환"""
+        return replace(self, stage=stage, message=message or self.message)
+
+    def with_progress(
+        self,
+        done_units: int,
+        total_units: int,
+        message: str = "",
+        etfs_done: int = 0,
+        rows_written: int = 0,
+    ) -> "Job":
+        """
+        진행 상황을 갱신한 새 Job 반환
+
+        Args:
+            done_units: 완료된 처리 단위 수
+            total_units: 전체 처리 단위 수
+            message: 진행 메시지
+            etfs_done: 추가로 처리한 ETF 수 (누적)
+            rows_written: 추가로 저장한 행 수 (누적)
+        """
+        return replace(
+            self,
+            done_units=done_units,
+            total_units=total_units,
+            message=message or self.message,
+            etfs_done=self.etfs_done + etfs_done,
+            rows_written=self.rows_written + rows_written,
+        )
+
+    def complete(self, message: str = "") -> "Job":
+        """완료 상태로 전환한 새 Job 반환"""
+        return replace(
+            self,
+            status=JobStatus.COMPLETED,
+            message=message or self.message,
+            error="",
+            finished_at=datetime.now(),
+        )
+
+    def fail(self, error: str) -> "Job":
+        """실패 상태로 전환한 새 Job 반환"""
+        return replace(
+            self, status=JobStatus.FAILED, error=error, finished_at=datetime.now()
+        )
+
+    def to_dict(self) -> dict:
+        """엔티티를 딕셔너리로 변환"""
+        return {
+            "job_id": self.id,
+            "job_type": self.job_type,
+            "status": self.status,
+            "stage": self.stage,
+            "params": self.params,
+            "total_units": self.total_units,
+            "done_units": self.done_units,
+            "progress_percent": self.progress_percent,
+            "etfs_done": self.etfs_done,
+            "rows_written": self.rows_written,
+            "eta_seconds": self.eta_seconds,
+            "message": self.message,
+            "error": self.error,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
@@ -5,11 +5,15 @@ ETF 데이터 접근을 위한 추상 인터페이스입니다.
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple, Union
 
 from domain.entities.etf import ETF
-from domain.entities.holding import Holding
+from domain.entities.holding import Holding, HoldingRow
 from domain.repositories.base import BaseRepository
+from domain.value_objects.holdings_snapshot import HoldingsSnapshot
+
+# 보유 종목 조회 결과 (as_rows=True이면 HoldingRow 리스트)
+HoldingList = Union[List[Holding], List[HoldingRow]]
 
 
 class ETFRepository(BaseRepository[ETF, str]):
@@ -113,14 +117,20 @@ class ETFRepository(BaseRepository[ETF, str]):
 
     @abstractmethod
     def find_holdings_by_etf_and_date(
-        self, etf_ticker: str, date: datetime
-    ) -> List[Holding]:
+        self,
+        etf_ticker: str,
+        date: datetime,
+        as_rows: bool = False,
+        sort_by_stock: bool = False,
+    ) -> HoldingList:
         """
         특정 ETF의 특정 날짜 보유 종목을 조회합니다.
 
         Args:
             etf_ticker: ETF 코드
             date: 기준일
+            as_rows: True이면 엔티티 대신 HoldingRow 튜플로 반환
+            sort_by_stock: True이면 종목 코드 순 (기본: 비중 내림차순)
 
         Returns:
             Holding 엔티티 리스트
@@ -129,20 +139,41 @@ class ETFRepository(BaseRepository[ETF, str]):
 
     @abstractmethod
     def find_holdings_by_stock_and_date(
-        self, stock_ticker: str, date: datetime
-    ) -> List[Holding]:
+        self, stock_ticker: str, date: datetime, as_rows: bool = False
+    ) -> HoldingList:
         """
         특정 종목을 보유한 모든 ETF를 특정 날짜 기준으로 조회합니다.
 
         Args:
             stock_ticker: 종목 코드
             date: 기준일
+            as_rows: True이면 엔티티 대신 HoldingRow 튜플로 반환
 
         Returns:
             Holding 엔티티 리스트
         """
         pass
 
+    @abstractmethod
+    def find_holdings_by_stock(
+        self,
+        stock_ticker: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[HoldingRow]:
+        """
+        특정 종목을 보유한 ETF들을 기간 전체에 걸쳐 조회합니다.
+
+        Args:
+            stock_ticker: 종목 코드
+            start_date: 시작일 (포함, None이면 처음부터)
+            end_date: 종료일 (포함, None이면 끝까지)
+
+        Returns:
+            날짜순, 같은 날짜 안에서는 비중 내림차순으로 정렬된 HoldingRow 리스트
+        """
+        pass
+
     @abstractmethod
     def find_holdings_by_date(self, date: datetime) -> List[Holding]:
         """
@@ -157,19 +188,87 @@ class ETFRepository(BaseRepository[ETF, str]):
         pass
 
     @abstractmethod
-    def find_weight_history(self, etf_ticker: str, stock_ticker: str) -> List[Holding]:
+    def find_holdings_snapshot(self, date: datetime) -> HoldingsSnapshot:
+        """
+        특정 날짜의 모든 보유 종목을 열 저장소로 조회합니다.
+
+        Holding 객체를 만들지 않으므로 날짜 전체를 다루는 집계에 사용합니다.
+
+        Args:
+            date: 기준일
+
+        Returns:
+            HoldingsSnapshot (데이터가 없으면 빈 스냅샷)
+        """
+        pass
+
+    @abstractmethod
+    def find_weight_history(
+        self, etf_ticker: str, stock_ticker: str, as_rows: bool = False
+    ) -> HoldingList:
         """
         특정 ETF 내 특정 종목의 비중 추이를 조회합니다.
 
         Args:
             etf_ticker: ETF 코드
             stock_ticker: 종목 코드
+            as_rows: True이면 엔티티 대신 HoldingRow 튜플로 반환
 
         Returns:
             시간순 정렬된 Holding 엔티티 리스트
         """
         pass
 
+    @abstractmethod
+    def find_weight_histories(
+        self,
+        etf_tickers: List[str],
+        stock_tickers: List[str],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[HoldingRow]:
+        """
+        여러 ETF × 종목 조합의 비중 추이를 한 번에 조회합니다.
+
+        Args:
+            etf_tickers: ETF 코드 목록
+            stock_tickers: 종목 코드 목록
+            start_date: 시작일 (포함, None이면 처음부터)
+            end_date: 종료일 (포함, None이면 끝까지)
+
+        Returns:
+            (ETF, 종목, 날짜) 순으로 정렬된 HoldingRow 리스트
+        """
+        pass
+
+    @abstractmethod
+    def find_latest_weight(self, etf_ticker: str, stock_ticker: str) -> Optional[float]:
+        """
+        특정 ETF 내 특정 종목의 가장 최근 비중을 조회합니다.
+
+        Args:
+            etf_ticker: ETF 코드
+            stock_ticker: 종목 코드
+
+        Returns:
+            최신 비중 (%), 데이터가 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    def has_weight_history(self, etf_ticker: str, stock_ticker: str) -> bool:
+        """
+        특정 ETF 내 특정 종목의 보유 이력이 있는지 확인합니다.
+
+        Args:
+            etf_ticker: ETF 코드
+            stock_ticker: 종목 코드
+
+        Returns:
+            이력 존재 여부
+        """
+        pass
+
     # 날짜 관련
 
     @abstractmethod
@@ -218,6 +317,19 @@ class ETFRepository(BaseRepository[ETF, str]):
         """
         pass
 
+    @abstractmethod
+    def get_collection_status(self, date: datetime) -> Tuple[Set[str], Set[str]]:
+        """
+        ✅ 추가: 특정 날짜의 수집 현황을 한 번에 조회합니다.
+
+        Args:
+            date: 확인할 날짜
+
+        Returns:
+            (등록된 ETF 코드 집합, 해당 날짜 보유 종목이 있는 ETF 코드 집합)
+        """
+        pass
+
     # 통계 관련
 
     @abstractmethod
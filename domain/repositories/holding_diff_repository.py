@@ -0,0 +1,42 @@
+"""
+Holding Diff Repository 인터페이스
+ETF별 연속 거래일 보유 종목 비교 결과 접근을 위한 추상 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Optional
+
+
+class HoldingDiffRepository(ABC):
+    """
+    보유 종목 비교 리포지토리 인터페이스
+
+    ETF마다 각 날짜의 보유 종목을 바로 이전 거래일과 비교한 결과
+    (상태, 이전/현재 비중, 변화량)를 제공합니다.
+    비교 결과는 수집 시점에 계산되므로 기본 비교 조회는 인덱스 조회 한 번입니다.
+    """
+
+    @abstractmethod
+    def find_diffs(
+        self, etf_ticker: str, date: datetime, prev_date: datetime
+    ) -> Optional[Dict]:
+        """
+        특정 ETF의 날짜별 비교 결과를 조회합니다.
+
+        Args:
+            etf_ticker: ETF 코드
+            date: 기준일 (현재 날짜)
+            prev_date: 비교 대상 이전 날짜 (저장된 결과의 이전 날짜와 다르면 None)
+
+        Returns:
+            없으면 None, 있으면:
+            {
+                'diffs': [
+                    {'stock_ticker', 'stock_name', 'prev_weight', 'current_weight',
+                     'change', 'current_amount', 'status'}, ...
+                ],  # 현재 비중 내림차순
+                'counts': {ChangeStatus: 개수}
+            }
+        """
+        pass
@@ -0,0 +1,96 @@
+"""
+Job Repository 인터페이스
+작업 실행 상태와 체크포인트 접근을 위한 추상 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Set
+
+from domain.entities.job import Job
+
+
+class JobRepository(ABC):
+    """
+    작업 리포지토리 인터페이스
+
+    작업(Job)의 상태와 (날짜, ETF) 단위 체크포인트의 영속성을 담당합니다.
+    체크포인트 기록은 수집 데이터와 같은 트랜잭션에서 저장되어야 하므로
+    일 단위 저장기(DailyIngestionWriter)가 담당합니다.
+    """
+
+    @abstractmethod
+    def save(self, job: Job) -> None:
+        """
+        작업 상태를 저장합니다. (없으면 생성, 있으면 갱신)
+
+        Args:
+            job: 저장할 작업
+        """
+        pass
+
+    @abstractmethod
+    def find_by_id(self, job_id: str) -> Optional[Job]:
+        """
+        ID로 작업을 조회합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            작업, 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    def find_latest(self, job_type: str) -> Optional[Job]:
+        """
+        특정 종류의 가장 최근 작업을 조회합니다.
+
+        Args:
+            job_type: 작업 종류
+
+        Returns:
+            작업, 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    def find_by_status(self, statuses: List[str]) -> List[Job]:
+        """
+        특정 상태의 작업들을 조회합니다.
+
+        Args:
+            statuses: 작업 상태 리스트
+
+        Returns:
+            작업 리스트 (최근 생성 순)
+        """
+        pass
+
+    @abstractmethod
+    def find_completed_dates(self, job_id: str) -> Set[str]:
+        """
+        작업에서 전체 완료된 날짜들을 조회합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            완료된 날짜 문자열 집합 (YYYY-MM-DD)
+        """
+        pass
+
+    @abstractmethod
+    def find_checkpointed_tickers(self, job_id: str, date: datetime) -> Set[str]:
+        """
+        작업에서 특정 날짜에 처리가 끝난 ETF 코드들을 조회합니다.
+
+        Args:
+            job_id: 작업 ID
+            date: 기준일
+
+        Returns:
+            ETF 코드 집합
+        """
+        pass
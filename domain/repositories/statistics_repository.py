@@ -0,0 +1,109 @@
+"""
+Statistics Repository 인터페이스
+날짜별 사전 집계 통계 접근을 위한 추상 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class StatisticsRepository(ABC):
+    """
+    통계 리포지토리 인터페이스
+
+    날짜별·종목별 집계(ETF 수, 총 평가금액, 평균/최소/최대 비중)와
+    날짜별 요약(보유 종목 수, 비중 분포)을 제공합니다.
+    집계는 수집 시점에 갱신되므로 조회 비용이 보유 종목 수와 무관합니다.
+    """
+
+    # 종목 집계 정렬 기준
+    ORDER_BY_ETF_COUNT = "etf_count"  # ETF 수, 총 평가금액 내림차순
+    ORDER_BY_AMOUNT = "amount"  # 총 평가금액 내림차순
+
+    @abstractmethod
+    def find_stock_aggregates(
+        self,
+        date: datetime,
+        order_by: str = ORDER_BY_ETF_COUNT,
+        min_etf_count: int = 1,
+        min_amount: Optional[float] = None,
+        limit: int = 0,
+    ) -> List[Dict]:
+        """
+        특정 날짜의 종목별 집계를 조회합니다.
+
+        Args:
+            date: 기준일
+            order_by: 정렬 기준 (ORDER_BY_ETF_COUNT, ORDER_BY_AMOUNT)
+            min_etf_count: 최소 포함 ETF 수
+            min_amount: 총 평가금액 하한 (초과), None이면 제한 없음
+            limit: 최대 개수 (0이면 전체)
+
+        Returns:
+            종목별 집계 리스트, 각 항목:
+            {
+                'ticker', 'name', 'etf_count', 'etf_tickers',
+                'total_amount', 'avg_weight', 'max_weight', 'min_weight'
+            }
+        """
+        pass
+
+    @abstractmethod
+    def find_daily_summary(self, date: datetime) -> Optional[Dict]:
+        """
+        특정 날짜의 요약 집계를 조회합니다.
+
+        Args:
+            date: 기준일
+
+        Returns:
+            {
+                'etf_count', 'stock_count', 'holding_count',
+                'distribution': {'under_1', '1_to_3', '3_to_5', '5_to_10', 'over_10'}
+            }
+            집계가 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    def aggregate_stocks_for_etfs(
+        self,
+        date: datetime,
+        etf_tickers: Optional[List[str]],
+        order_by: str = ORDER_BY_ETF_COUNT,
+        min_etf_count: int = 1,
+        min_amount: Optional[float] = None,
+        limit: int = 0,
+    ) -> List[Dict]:
+        """
+        특정 ETF들의 보유 종목만으로 종목별 집계를 계산합니다.
+
+        사전 집계가 없는 부분 집합(예: 테마)이나 아직 집계되지 않은 날짜에
+        사용하며, 집계는 DB에서 수행됩니다. (결과를 저장하지 않음)
+
+        Args:
+            date: 기준일
+            etf_tickers: 대상 ETF 코드 리스트 (None이면 그날 전체 ETF)
+            order_by, min_etf_count, min_amount, limit: find_stock_aggregates 참고
+
+        Returns:
+            find_stock_aggregates와 같은 형식의 리스트
+        """
+        pass
+
+    @abstractmethod
+    def summarize_for_etfs(
+        self, date: datetime, etf_tickers: Optional[List[str]]
+    ) -> Dict:
+        """
+        특정 ETF들의 보유 종목 요약을 계산합니다. (결과를 저장하지 않음)
+
+        Args:
+            date: 기준일
+            etf_tickers: 대상 ETF 코드 리스트 (None이면 그날 전체 ETF)
+
+        Returns:
+            find_daily_summary와 같은 형식의 딕셔너리
+        """
+        pass
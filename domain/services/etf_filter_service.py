@@ -3,11 +3,110 @@ ETF Filter Service
 ETF 필터링 비즈니스 로직을 담당하는 도메인 서비스입니다.
 """
 
-from typing import List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from config.logging_config import LoggerMixin
 from domain.entities.etf import ETF
 from domain.value_objects.filter_criteria import FilterCriteria
+from domain.value_objects.keyword_matcher import KeywordMatcher
+
+# 판정 결과 캐시의 미존재 표시 (None은 '탈락' 결과로 사용)
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class ETFMatch:
+    """
+    필터를 통과한 ETF와 일치한 테마
+
+    Attributes:
+        etf: ETF 엔티티
+        themes: ETF명에 포함된 테마 (조건의 테마 순서, 테마 조건이 없으면 빈 튜플)
+    """
+
+    etf: ETF
+    themes: Tuple[str, ...]
+
+
+class CompiledETFFilter:
+    """
+    컴파일된 ETF 필터
+
+    액티브 키워드, 제외 키워드, 테마 키워드를 하나의 KeywordMatcher로 묶어
+    ETF명을 한 번만 읽고 통과 여부와 일치한 테마를 함께 판정합니다.
+    수집 날짜마다 같은 ETF명이 반복되므로 ETF명별 판정 결과도 기억합니다.
+
+    ETFFilterService.compile()로 생성하면 같은 조건의 필터를 재사용합니다.
+
+    Args:
+        themes: 테마 키워드 (하나라도 포함되어야 통과, 비어 있으면 조건 없음)
+        exclusions: 제외 키워드 (하나라도 포함되면 탈락)
+        require_active: 액티브 키워드 필수 여부
+    """
+
+    def __init__(
+        self,
+        themes: Tuple[str, ...],
+        exclusions: Tuple[str, ...],
+        require_active: bool,
+    ):
+        self.themes = themes
+        self.require_active = require_active
+        self._matcher = KeywordMatcher(
+            (ETF.ACTIVE_KEYWORD, *exclusions, *themes)
+            if require_active
+            else (*exclusions, *themes)
+        )
+
+        index = {keyword: i for i, keyword in enumerate(self._matcher.keywords)}
+        self._active = index[ETF.ACTIVE_KEYWORD] if require_active else None
+        self._exclusions = frozenset(index[e.lower()] for e in exclusions)
+        # 키워드 인덱스 → 테마 (조건의 테마 순서대로 정렬하기 위해 순번 포함)
+        self._themes: Dict[int, List[Tuple[int, str]]] = {}
+        for order, theme in enumerate(themes):
+            self._themes.setdefault(index[theme.lower()], []).append((order, theme))
+
+        self._results: Dict[str, Optional[Tuple[str, ...]]] = {}
+
+    def classify(self, name: str) -> Optional[Tuple[str, ...]]:
+        """
+        ETF명을 판정합니다.
+
+        Args:
+            name: ETF명
+
+        Returns:
+            통과하면 일치한 테마 튜플, 탈락하면 None
+        """
+        result = self._results.get(name, _MISSING)
+        if result is not _MISSING:
+            return result
+
+        found = self._matcher.find(name)
+
+        if self._active is not None and self._active not in found:
+            result = None
+        elif not self._exclusions.isdisjoint(found):
+            result = None
+        else:
+            matched = sorted(
+                entry for i in found if i in self._themes for entry in self._themes[i]
+            )
+            themes = tuple(theme for _, theme in matched)
+            result = themes if themes or not self.themes else None
+
+        self._results[name] = result
+        return result
+
+
+@lru_cache(maxsize=32)
+def _compile_filter(
+    themes: Tuple[str, ...], exclusions: Tuple[str, ...], require_active: bool
+) -> CompiledETFFilter:
+    """조건별 컴파일된 필터 (같은 조건이면 재사용)"""
+    return CompiledETFFilter(themes, exclusions, require_active)
 
 
 class ETFFilterService(LoggerMixin):
@@ -17,6 +116,9 @@ class ETFFilterService(LoggerMixin):
     ETF를 테마, 제외 키워드, 액티브 여부 등의 기준으로 필터링하는
     비즈니스 로직을 담당합니다.
 
+    ✅ 개선: 조건마다 목록을 순차 스캔하며 키워드별 부분 문자열 검사를 하지 않고,
+    조건으로 컴파일한 다중 키워드 매처(캐시됨)로 ETF명을 한 번에 판정합니다.
+
     Examples:
         >>> service = ETFFilterService()
         >>> criteria = FilterCriteria.create(
@@ -25,87 +127,71 @@ class ETFFilterService(LoggerMixin):
         ...     require_active=True
         ... )
         >>> filtered = service.filter_etfs(all_etfs, criteria)
+        >>> matches = service.classify_etfs(all_etfs, criteria)
+        >>> matches[0].themes
+        ('반도체',)
     """
 
-    def filter_etfs(self, etfs: List[ETF], criteria: FilterCriteria) -> List[ETF]:
+    def compile(self, criteria: FilterCriteria) -> CompiledETFFilter:
         """
-        필터 조건에 따라 ETF 리스트를 필터링합니다.
+        필터 조건을 컴파일합니다. (같은 조건이면 캐시된 필터 반환)
 
         Args:
-            etfs: 필터링할 ETF 리스트
             criteria: 필터링 조건
 
         Returns:
-            필터링된 ETF 리스트
+            컴파일된 필터
         """
-        if not etfs:
-            self.logger.debug("No ETFs to filter")
-            return []
-
-        self.logger.info(f"Filtering {len(etfs)} ETFs with criteria: {criteria}")
-
-        filtered = etfs
-
-        # 액티브 필터 적용
-        if criteria.require_active:
-            filtered = self._filter_by_active(filtered)
-            self.logger.debug(f"After active filter: {len(filtered)} ETFs")
-
-        # 제외 키워드 필터 적용
-        if criteria.has_exclusions():
-            filtered = self._filter_by_exclusions(filtered, criteria.exclusions)
-            self.logger.debug(f"After exclusion filter: {len(filtered)} ETFs")
-
-        # 테마 필터 적용
-        if criteria.has_themes():
-            filtered = self._filter_by_themes(filtered, criteria.themes)
-            self.logger.debug(f"After theme filter: {len(filtered)} ETFs")
-
-        self.logger.info(
-            f"Filtering completed: {len(filtered)}/{len(etfs)} ETFs matched"
+        return _compile_filter(
+            tuple(criteria.themes),
+            tuple(criteria.exclusions),
+            criteria.require_active,
         )
 
-        return filtered
-
-    def _filter_by_active(self, etfs: List[ETF]) -> List[ETF]:
+    def classify_etfs(
+        self, etfs: List[ETF], criteria: FilterCriteria
+    ) -> List[ETFMatch]:
         """
-        액티브 ETF만 필터링합니다.
+        필터 조건을 통과한 ETF와 각 ETF에 일치한 테마를 반환합니다.
 
         Args:
-            etfs: ETF 리스트
+            etfs: 필터링할 ETF 리스트
+            criteria: 필터링 조건
 
         Returns:
-            액티브 ETF 리스트
+            ETFMatch 리스트 (입력 순서 유지)
         """
-        return [etf for etf in etfs if etf.is_active()]
+        if not etfs:
+            self.logger.debug("No ETFs to filter")
+            return []
 
-    def _filter_by_exclusions(
-        self, etfs: List[ETF], exclusions: List[str]
-    ) -> List[ETF]:
-        """
-        제외 키워드가 포함되지 않은 ETF만 필터링합니다.
+        self.logger.info(f"Filtering {len(etfs)} ETFs with criteria: {criteria}")
 
-        Args:
-            etfs: ETF 리스트
-            exclusions: 제외 키워드 리스트
+        compiled = self.compile(criteria)
+        matches = []
+        for etf in etfs:
+            themes = compiled.classify(etf.name)
+            if themes is not None:
+                matches.append(ETFMatch(etf, themes))
 
-        Returns:
-            필터링된 ETF 리스트
-        """
-        return [etf for etf in etfs if not etf.has_exclusion(exclusions)]
+        self.logger.info(
+            f"Filtering completed: {len(matches)}/{len(etfs)} ETFs matched"
+        )
 
-    def _filter_by_themes(self, etfs: List[ETF], themes: List[str]) -> List[ETF]:
+        return matches
+
+    def filter_etfs(self, etfs: List[ETF], criteria: FilterCriteria) -> List[ETF]:
         """
-        테마 키워드 중 하나라도 포함된 ETF만 필터링합니다.
+        필터 조건에 따라 ETF 리스트를 필터링합니다.
 
         Args:
-            etfs: ETF 리스트
-            themes: 테마 키워드 리스트
+            etfs: 필터링할 ETF 리스트
+            criteria: 필터링 조건
 
         Returns:
             필터링된 ETF 리스트
         """
-        return [etf for etf in etfs if etf.matches_theme(themes)]
+        return [match.etf for match in self.classify_etfs(etfs, criteria)]
 
     def count_by_criteria(self, etfs: List[ETF], criteria: FilterCriteria) -> int:
         """
@@ -3,11 +3,38 @@ Holdings Analyzer Service
 보유 종목 분석 비즈니스 로직을 담당하는 도메인 서비스입니다.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 from config.logging_config import LoggerMixin
-from domain.entities.holding import Holding
-from domain.value_objects.weight_change import WeightChange
+from domain.entities.holding import Holding, HoldingRow
+from domain.value_objects.weight_change import (
+    CHANGE_STATUS_KEYS,
+    ChangeStatus,
+    WeightChange,
+    classify_weight_change,
+)
+
+# 비교 대상 행 (Holding 또는 DB 경량 행)
+HoldingLike = Union[Holding, HoldingRow]
+
+
+class HoldingDiff(NamedTuple):
+    """
+    한 종목의 두 시점 비교 결과
+
+    Attributes:
+        stock_ticker: 종목 코드
+        previous: 이전 보유 행 (신규면 None)
+        current: 현재 보유 행 (제외면 None)
+        status: 변화 상태
+        change: 비중 변화량 (현재 - 이전)
+    """
+
+    stock_ticker: str
+    previous: Optional[HoldingLike]
+    current: Optional[HoldingLike]
+    status: ChangeStatus
+    change: float
 
 
 class HoldingsAnalyzer(LoggerMixin):
@@ -47,44 +74,16 @@ class HoldingsAnalyzer(LoggerMixin):
             f"current={len(current_holdings)}"
         )
 
-        # 티커별로 인덱싱
-        prev_dict = {h.stock_ticker: h for h in previous_holdings}
-        curr_dict = {h.stock_ticker: h for h in current_holdings}
-
-        # 모든 티커 수집
-        all_tickers = set(prev_dict.keys()) | set(curr_dict.keys())
-
-        # 분류
-        result = {
-            "new": [],
-            "removed": [],
-            "increased": [],
-            "decreased": [],
-            "unchanged": [],
-        }
-
-        for ticker in all_tickers:
-            prev_holding = prev_dict.get(ticker)
-            curr_holding = curr_dict.get(ticker)
-
-            # 신규 추가
-            if prev_holding is None and curr_holding is not None:
-                result["new"].append(curr_holding)
-
-            # 제외
-            elif prev_holding is not None and curr_holding is None:
-                result["removed"].append(prev_holding)
-
-            # 비중 변화 분석
-            elif prev_holding is not None and curr_holding is not None:
-                change = curr_holding.calculate_weight_change(prev_holding)
+        result = {key: [] for key in CHANGE_STATUS_KEYS.values()}
 
-                if change > 0.01:  # 0.01% 이상 증가
-                    result["increased"].append(curr_holding)
-                elif change < -0.01:  # 0.01% 이상 감소
-                    result["decreased"].append(curr_holding)
-                else:
-                    result["unchanged"].append(curr_holding)
+        # ✅ 개선: 정렬 병합으로 종목마다 한 번만 분류
+        for diff in self.merge_holdings(
+            self._sorted_by_stock(previous_holdings),
+            self._sorted_by_stock(current_holdings),
+        ):
+            result[CHANGE_STATUS_KEYS[diff.status]].append(
+                diff.current or diff.previous
+            )
 
         self.logger.info(
             f"Comparison result: new={len(result['new'])}, "
@@ -96,6 +95,55 @@ class HoldingsAnalyzer(LoggerMixin):
 
         return result
 
+    def merge_holdings(
+        self,
+        previous_holdings: Sequence[HoldingLike],
+        current_holdings: Sequence[HoldingLike],
+    ) -> Iterator[HoldingDiff]:
+        """
+        종목 코드 순으로 정렬된 두 보유 종목 목록을 병합하며 비교합니다.
+
+        ✅ 추가: 딕셔너리나 집합을 만들지 않고 두 목록을 한 번씩만 훑으며,
+        종목마다 상태를 한 번만 분류합니다. (입력은 stock_ticker 오름차순이어야 함)
+
+        Args:
+            previous_holdings: 이전 보유 종목 (stock_ticker 오름차순)
+            current_holdings: 현재 보유 종목 (stock_ticker 오름차순)
+
+        Yields:
+            HoldingDiff: 종목 코드 순 비교 결과
+        """
+        i = j = 0
+        n, m = len(previous_holdings), len(current_holdings)
+
+        while i < n or j < m:
+            prev = previous_holdings[i] if i < n else None
+            curr = current_holdings[j] if j < m else None
+
+            if curr is None or (
+                prev is not None and prev.stock_ticker < curr.stock_ticker
+            ):
+                yield HoldingDiff(
+                    prev.stock_ticker, prev, None, ChangeStatus.REMOVED, -prev.weight
+                )
+                i += 1
+            elif prev is None or curr.stock_ticker < prev.stock_ticker:
+                yield HoldingDiff(
+                    curr.stock_ticker, None, curr, ChangeStatus.NEW, curr.weight
+                )
+                j += 1
+            else:
+                change = curr.weight - prev.weight
+                yield HoldingDiff(
+                    curr.stock_ticker,
+                    prev,
+                    curr,
+                    classify_weight_change(change),
+                    change,
+                )
+                i += 1
+                j += 1
+
     def calculate_weight_changes(
         self, previous_holdings: List[Holding], current_holdings: List[Holding]
     ) -> Dict[str, WeightChange]:
@@ -123,6 +171,11 @@ class HoldingsAnalyzer(LoggerMixin):
 
         return changes
 
+    @staticmethod
+    def _sorted_by_stock(holdings: Sequence[HoldingLike]) -> List[HoldingLike]:
+        """종목 코드 순으로 정렬합니다. (이미 정렬된 입력은 O(n))"""
+        return sorted(holdings, key=lambda h: h.stock_ticker)
+
     def get_top_holdings(
         self, holdings: List[Holding], top_n: int = 10
     ) -> List[Holding]:
@@ -3,12 +3,16 @@ Statistics Calculator Service
 통계 계산 비즈니스 로직을 담당하는 도메인 서비스입니다.
 """
 
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
+import numpy as np
 from config.logging_config import LoggerMixin
 from domain.entities.etf import ETF
 from domain.entities.holding import Holding
+from domain.value_objects.holdings_snapshot import ETFOverlapMatrix, HoldingsSnapshot
+
+# Holding 리스트 또는 날짜별 열 저장소
+HoldingsInput = Union[List[Holding], HoldingsSnapshot]
 
 
 class StatisticsCalculator(LoggerMixin):
@@ -18,6 +22,11 @@ class StatisticsCalculator(LoggerMixin):
     중복 종목, 금액 순위, 비중 분석 등의 통계를 계산하는
     비즈니스 로직을 담당합니다.
 
+    보유 종목은 Holding 리스트나 HoldingsSnapshot(열 저장소)으로 받으며,
+    ✅ 개선: 내부적으로 스냅샷의 벡터 연산으로 그룹화/순위를 계산합니다.
+    날짜 전체나 ETF 부분 집합의 통계를 DB에서 바로 집계하려면
+    StatisticsRepository를 사용합니다.
+
     Examples:
         >>> calculator = StatisticsCalculator()
         >>> duplicates = calculator.calculate_duplicate_stocks(all_holdings)
@@ -25,7 +34,7 @@ class StatisticsCalculator(LoggerMixin):
     """
 
     def calculate_duplicate_stocks(
-        self, holdings: List[Holding], min_count: int = 2
+        self, holdings: HoldingsInput, min_count: int = 2
     ) -> List[Dict]:
         """
         중복 종목 통계를 계산합니다.
@@ -33,7 +42,7 @@ class StatisticsCalculator(LoggerMixin):
         여러 ETF에 포함된 종목들을 찾아 중복 횟수와 통계를 계산합니다.
 
         Args:
-            holdings: 보유 종목 리스트
+            holdings: 보유 종목 리스트 또는 스냅샷
             min_count: 최소 중복 횟수 (기본값: 2)
 
         Returns:
@@ -49,64 +58,47 @@ class StatisticsCalculator(LoggerMixin):
                 'min_weight': 최소 비중
             }
         """
-        self.logger.debug(f"Calculating duplicate stocks from {len(holdings)} holdings")
-
-        # 종목별로 그룹화
-        stock_stats = defaultdict(
-            lambda: {
-                "ticker": "",
-                "name": "",
-                "etf_tickers": set(),
-                "weights": [],
-                "amounts": [],
-            }
-        )
+        snapshot = self._as_snapshot(holdings)
+        self.logger.debug(f"Calculating duplicate stocks from {len(snapshot)} holdings")
 
-        for holding in holdings:
-            ticker = holding.stock_ticker
-            stats = stock_stats[ticker]
+        # ✅ 개선: 종목별 그룹 집계를 벡터 연산으로 계산
+        groups = snapshot.group_by_stock()
+        selected = np.flatnonzero(groups.etf_count >= min_count)
 
-            stats["ticker"] = holding.stock_ticker
-            stats["name"] = holding.stock_name
-            stats["etf_tickers"].add(holding.etf_ticker)
-            stats["weights"].append(holding.weight)
-            stats["amounts"].append(holding.amount)
+        # ETF 개수와 총 금액 기준으로 정렬 (내림차순)
+        selected = selected[
+            np.lexsort((-groups.total_amount[selected], -groups.etf_count[selected]))
+        ]
 
-        # min_count 이상인 종목만 필터링하고 통계 계산
         results = []
-        for ticker, stats in stock_stats.items():
-            etf_count = len(stats["etf_tickers"])
-
-            if etf_count >= min_count:
-                results.append(
-                    {
-                        "ticker": stats["ticker"],
-                        "name": stats["name"],
-                        "etf_count": etf_count,
-                        "etf_tickers": list(stats["etf_tickers"]),
-                        "total_amount": sum(stats["amounts"]),
-                        "avg_weight": round(
-                            sum(stats["weights"]) / len(stats["weights"]), 2
-                        ),
-                        "max_weight": round(max(stats["weights"]), 2),
-                        "min_weight": round(min(stats["weights"]), 2),
-                    }
-                )
-
-        # ETF 개수와 총 금액 기준으로 정렬
-        results.sort(key=lambda x: (x["etf_count"], x["total_amount"]), reverse=True)
+        for group in selected.tolist():
+            ticker = snapshot.stock_tickers[groups.codes[group]]
+            etf_codes = np.unique(snapshot.etf_codes[groups.rows_of(group)])
+
+            results.append(
+                {
+                    "ticker": ticker,
+                    "name": snapshot.stock_names.get(ticker, ""),
+                    "etf_count": int(groups.etf_count[group]),
+                    "etf_tickers": [snapshot.etf_tickers[c] for c in etf_codes],
+                    "total_amount": float(groups.total_amount[group]),
+                    "avg_weight": round(float(groups.avg_weight[group]), 2),
+                    "max_weight": round(float(groups.max_weight[group]), 2),
+                    "min_weight": round(float(groups.min_weight[group]), 2),
+                }
+            )
 
         self.logger.info(f"Found {len(results)} duplicate stocks")
         return results
 
     def calculate_amount_ranking(
-        self, holdings: List[Holding], top_n: int = 100
+        self, holdings: HoldingsInput, top_n: int = 100
     ) -> List[Dict]:
         """
         평가금액 순위를 계산합니다.
 
         Args:
-            holdings: 보유 종목 리스트
+            holdings: 보유 종목 리스트 또는 스냅샷
             top_n: 상위 N개 (0이면 전체)
 
         Returns:
@@ -120,66 +112,44 @@ class StatisticsCalculator(LoggerMixin):
                 'max_weight': 최대 비중
             }
         """
-        self.logger.debug(f"Calculating amount ranking from {len(holdings)} holdings")
-
-        # 종목별로 그룹화
-        stock_stats = defaultdict(
-            lambda: {
-                "ticker": "",
-                "name": "",
-                "etf_count": 0,
-                "weights": [],
-                "amounts": [],
-            }
-        )
+        snapshot = self._as_snapshot(holdings)
+        self.logger.debug(f"Calculating amount ranking from {len(snapshot)} holdings")
 
-        for holding in holdings:
-            ticker = holding.stock_ticker
-            stats = stock_stats[ticker]
+        groups = snapshot.group_by_stock()
 
-            stats["ticker"] = holding.stock_ticker
-            stats["name"] = holding.stock_name
-            stats["etf_count"] += 1
-            stats["weights"].append(holding.weight)
-            stats["amounts"].append(holding.amount)
-
-        # 통계 계산
-        results = []
-        for ticker, stats in stock_stats.items():
-            total_amount = sum(stats["amounts"])
-
-            if total_amount > 0:  # 금액이 있는 종목만
-                results.append(
-                    {
-                        "ticker": stats["ticker"],
-                        "name": stats["name"],
-                        "total_amount": total_amount,
-                        "etf_count": stats["etf_count"],
-                        "avg_weight": round(
-                            sum(stats["weights"]) / len(stats["weights"]), 2
-                        ),
-                        "max_weight": round(max(stats["weights"]), 2),
-                    }
-                )
-
-        # 총 평가금액 기준으로 정렬
-        results.sort(key=lambda x: x["total_amount"], reverse=True)
+        # 금액이 있는 종목만, 총 평가금액 기준으로 정렬
+        selected = np.flatnonzero(groups.total_amount > 0)
+        selected = selected[np.argsort(-groups.total_amount[selected], kind="stable")]
 
         # 상위 N개만 반환
         if top_n > 0:
-            results = results[:top_n]
+            selected = selected[:top_n]
+
+        results = []
+        for group in selected.tolist():
+            ticker = snapshot.stock_tickers[groups.codes[group]]
+            results.append(
+                {
+                    "ticker": ticker,
+                    "name": snapshot.stock_names.get(ticker, ""),
+                    "total_amount": float(groups.total_amount[group]),
+                    "etf_count": int(groups.holding_count[group]),
+                    "avg_weight": round(float(groups.avg_weight[group]), 2),
+                    "max_weight": round(float(groups.max_weight[group]), 2),
+                }
+            )
 
         self.logger.info(f"Calculated amount ranking: {len(results)} stocks")
         return results
 
     def calculate_theme_statistics(
-        self, holdings: List[Holding], etfs: List[ETF], theme: str
+        self, holdings: HoldingsInput, etfs: List[ETF], theme: str
     ) -> Dict:
         """
         특정 테마의 통계를 계산합니다.
 
         Args:
-            holdings: 보유 종목 리스트
+            holdings: 보유 종목 리스트 또는 스냅샷
             etfs: ETF 리스트
             theme: 테마 키워드
 
@@ -201,10 +171,10 @@ class StatisticsCalculator(LoggerMixin):
         theme_etf_tickers = {etf.ticker for etf in theme_etfs}
 
         # 해당 ETF의 보유 종목만 필터링
-        theme_holdings = [h for h in holdings if h.etf_ticker in theme_etf_tickers]
+        theme_holdings = self._as_snapshot(holdings).for_etfs(theme_etf_tickers)
 
         # 고유 종목 수 계산
-        unique_stocks = len(set(h.stock_ticker for h in theme_holdings))
+        unique_stocks = len(np.unique(theme_holdings.stock_codes))
 
         # 중복 종목 통계
         duplicate_stocks = self.calculate_duplicate_stocks(theme_holdings, min_count=2)
@@ -225,12 +195,12 @@ class StatisticsCalculator(LoggerMixin):
 
         return result
 
-    def calculate_weight_distribution(self, holdings: List[Holding]) -> Dict[str, int]:
+    def calculate_weight_distribution(self, holdings: HoldingsInput) -> Dict[str, int]:
         """
         비중 분포를 계산합니다.
 
         Args:
-            holdings: 보유 종목 리스트
+            holdings: 보유 종목 리스트 또는 스냅샷
 
         Returns:
             비중 범위별 종목 개수:
@@ -242,29 +212,7 @@ class StatisticsCalculator(LoggerMixin):
                 'over_10': 10% 이상
             }
         """
-        distribution = {
-            "under_1": 0,
-            "1_to_3": 0,
-            "3_to_5": 0,
-            "5_to_10": 0,
-            "over_10": 0,
-        }
-
-        for holding in holdings:
-            weight = holding.weight
-
-            if weight < 1.0:
-                distribution["under_1"] += 1
-            elif weight < 3.0:
-                distribution["1_to_3"] += 1
-            elif weight < 5.0:
-                distribution["3_to_5"] += 1
-            elif weight < 10.0:
-                distribution["5_to_10"] += 1
-            else:
-                distribution["over_10"] += 1
-
-        return distribution
+        return self._as_snapshot(holdings).weight_distribution()
 
     def calculate_etf_overlap(
         self, etf1_holdings: List[Holding], etf2_holdings: List[Holding]
@@ -301,25 +249,52 @@ class StatisticsCalculator(LoggerMixin):
             "overlap_ratio_2": round(ratio2 * 100, 2),
         }
 
+    def calculate_overlap_matrix(self, holdings: HoldingsInput) -> ETFOverlapMatrix:
+        """
+        전체 ETF 쌍의 종목 중복도를 한 번에 계산합니다.
+
+        ✅ 추가: 두 ETF씩 집합 연산을 반복하지 않고 종목→ETF 역색인에서 공동 보유 쌍만 누적
+        (스냅샷에 한 번 계산된 결과를 재사용)
+
+        Args:
+            holdings: 보유 종목 리스트 또는 스냅샷
+
+        Returns:
+            ETFOverlapMatrix: 종목 수/비중(min 합계) 중복도 행렬
+        """
+        snapshot = self._as_snapshot(holdings)
+        self.logger.debug(
+            f"Calculating overlap matrix for {len(snapshot.etf_tickers)} ETFs"
+        )
+        return snapshot.overlap_matrix
+
     def get_top_stocks_by_frequency(
-        self, holdings: List[Holding], top_n: int = 20
+        self, holdings: HoldingsInput, top_n: int = 20
     ) -> List[Tuple[str, int]]:
         """
         가장 많은 ETF에 포함된 종목을 찾습니다.
 
         Args:
-            holdings: 보유 종목 리스트
+            holdings: 보유 종목 리스트 또는 스냅샷
             top_n: 상위 N개
 
         Returns:
             (종목코드, ETF 개수) 튜플 리스트
         """
-        frequency = defaultdict(set)
-
-        for holding in holdings:
-            frequency[holding.stock_ticker].add(holding.etf_ticker)
+        snapshot = self._as_snapshot(holdings)
+        groups = snapshot.group_by_stock()
 
         # ETF 개수로 정렬
-        sorted_stocks = sorted(frequency.items(), key=lambda x: len(x[1]), reverse=True)
-
-        return [(ticker, len(etf_set)) for ticker, etf_set in sorted_stocks[:top_n]]
+        selected = np.argsort(-groups.etf_count, kind="stable")[:top_n]
+
+        return [
+            (snapshot.stock_tickers[groups.codes[g]], int(groups.etf_count[g]))
+            for g in selected.tolist()
+        ]
+
+    @staticmethod
+    def _as_snapshot(holdings: HoldingsInput) -> HoldingsSnapshot:
+        """보유 종목 리스트를 열 저장소로 변환합니다. (이미 스냅샷이면 그대로)"""
+        if isinstance(holdings, HoldingsSnapshot):
+            return holdings
+        return HoldingsSnapshot.from_holdings(holdings)
@@ -0,0 +1,35 @@
+"""
+Trading Calendar
+거래일 판단을 위한 도메인 서비스 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+
+class TradingCalendar(ABC):
+    """
+    거래일 캘린더 인터페이스
+
+    실제 거래일 정보(공휴일 포함)는 외부 데이터로부터 얻어야 하므로
+    구현은 인프라 계층에서 제공합니다.
+    """
+
+    @abstractmethod
+    def business_days(self, start_date: datetime, end_date: datetime) -> List[datetime]:
+        """
+        기간 내의 거래일 리스트를 반환합니다.
+
+        Args:
+            start_date: 시작일
+            end_date: 종료일
+
+        Returns:
+            거래일 리스트 (오름차순)
+        """
+        pass
+
+    def is_business_day(self, date: datetime) -> bool:
+        """특정 날짜가 거래일인지 확인합니다."""
+        return bool(self.business_days(date, date))
@@ -5,7 +5,7 @@ DateRange 값 객체
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 
 from shared.exceptions import InvalidEntityException
 from shared.utils.date_utils import (
@@ -15,6 +15,9 @@ from shared.utils.date_utils import (
     to_date_string,
 )
 
+if TYPE_CHECKING:
+    from domain.services.trading_calendar import TradingCalendar
+
 
 @dataclass(frozen=True)
 class DateRange:
@@ -128,13 +131,24 @@ class DateRange:
         """범위 내의 모든 날짜 리스트 반환"""
         return get_date_range(self.start_date, self.end_date)
 
-    def business_days(self) -> List[datetime]:
-        """범위 내의 영업일 리스트 반환"""
+    def business_days(
+        self, calendar: Optional["TradingCalendar"] = None
+    ) -> List[datetime]:
+        """
+        범위 내의 영업일 리스트 반환
+
+        ✅ 개선: 거래일 캘린더가 주어지면 공휴일까지 제외합니다.
+
+        Args:
+            calendar: 거래일 캘린더 (None이면 주말만 제외)
+        """
+        if calendar is not None:
+            return calendar.business_days(self.start_date, self.end_date)
         return get_business_days(self.start_date, self.end_date)
 
-    def business_days_count(self) -> int:
+    def business_days_count(self, calendar: Optional["TradingCalendar"] = None) -> int:
         """범위 내의 영업일 개수 반환"""
-        return len(self.business_days())
+        return len(self.business_days(calendar))
 
     def contains(self, date: datetime) -> bool:
         """특정 날짜가 범위 내에 있는지 확인"""
@@ -0,0 +1,433 @@
+"""
+HoldingsSnapshot 값 객체
+특정 날짜의 보유 종목을 열(column) 단위 배열로 표현하는 읽기 전용 값 객체입니다.
+"""
+
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain.entities.holding import Holding, HoldingRow
+from shared.utils.date_utils import to_date_string
+
+# 비중 분포 구간 경계 (%): <1, 1~3, 3~5, 5~10, >=10
+WEIGHT_BUCKET_EDGES = (1.0, 3.0, 5.0, 10.0)
+WEIGHT_BUCKET_LABELS = ("under_1", "1_to_3", "3_to_5", "5_to_10", "over_10")
+
+# 중복도 계산 시 한 번에 만드는 공동 보유 (ETF, ETF) 쌍의 최대 수
+OVERLAP_BLOCK_ELEMENTS = 1 << 22
+
+
+def _run_offsets(lengths: np.ndarray) -> np.ndarray:
+    """길이가 lengths인 구간들을 이어 붙였을 때 각 원소의 구간 내 위치"""
+    run_starts = np.cumsum(lengths) - lengths
+    return np.arange(int(lengths.sum())) - np.repeat(run_starts, lengths)
+
+
+def _group_pairs(
+    starts: np.ndarray, sizes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    정렬된 구간(시작 위치, 길이)마다 구간 안의 모든 (i, j) 쌍을 만듭니다. (i < j)
+
+    Returns:
+        (왼쪽 위치, 오른쪽 위치) 배열
+    """
+    positions = np.repeat(starts, sizes) + _run_offsets(sizes)
+    partners = np.repeat(starts + sizes, sizes) - positions - 1
+
+    left = np.repeat(positions, partners)
+    right = left + 1 + _run_offsets(partners)
+    return left, right
+
+
+@dataclass(frozen=True)
+class StockGroups:
+    """
+    종목별 그룹 집계 결과 (모든 배열은 같은 순서의 종목 단위)
+
+    Attributes:
+        codes: 종목 코드 번호 (HoldingsSnapshot.stock_tickers 인덱스)
+        etf_count: 포함된 고유 ETF 수
+        holding_count: 보유 행 수
+        total_amount: 총 평가금액
+        avg_weight: 평균 비중
+        min_weight: 최소 비중
+        max_weight: 최대 비중
+        order: 종목 순으로 정렬된 행 인덱스
+        starts: order에서 각 종목 구간의 시작 위치
+    """
+
+    codes: np.ndarray
+    etf_count: np.ndarray
+    holding_count: np.ndarray
+    total_amount: np.ndarray
+    avg_weight: np.ndarray
+    min_weight: np.ndarray
+    max_weight: np.ndarray
+    order: np.ndarray
+    starts: np.ndarray
+
+    def rows_of(self, group: int) -> np.ndarray:
+        """특정 그룹(종목)에 속한 행 인덱스를 반환합니다."""
+        start = self.starts[group]
+        end = (
+            self.starts[group + 1] if group + 1 < len(self.starts) else len(self.order)
+        )
+        return self.order[start:end]
+
+
+@dataclass(frozen=True)
+class ETFOverlapMatrix:
+    """
+    전체 ETF 쌍의 보유 종목 중복도 (모든 행렬은 etf_tickers 순서의 n×n 대칭 행렬)
+
+    Attributes:
+        etf_tickers: ETF 코드 목록
+        holding_counts: ETF별 보유 종목 수
+        overlap_counts: 두 ETF가 함께 보유한 종목 수 (대각선은 보유 종목 수)
+        weight_overlap: 함께 보유한 종목의 min(비중) 합계 (%, 대각선은 비중 합계)
+    """
+
+    etf_tickers: Tuple[str, ...]
+    holding_counts: np.ndarray
+    overlap_counts: np.ndarray
+    weight_overlap: np.ndarray
+
+    def for_etfs(self, etf_tickers: Iterable[str]) -> "ETFOverlapMatrix":
+        """특정 ETF들의 행/열만 담은 행렬을 반환합니다. (기존 순서 유지)"""
+        wanted = set(etf_tickers)
+        selected = np.array(
+            [i for i, t in enumerate(self.etf_tickers) if t in wanted], dtype=np.intp
+        )
+        grid = np.ix_(selected, selected)
+
+        return ETFOverlapMatrix(
+            etf_tickers=tuple(self.etf_tickers[i] for i in selected.tolist()),
+            holding_counts=self.holding_counts[selected],
+            overlap_counts=self.overlap_counts[grid],
+            weight_overlap=self.weight_overlap[grid],
+        )
+
+    def pairs(self, min_overlap: int = 1) -> List[Tuple[int, int]]:
+        """
+        중복 종목이 min_overlap개 이상인 (i, j) 쌍을 반환합니다. (i < j)
+
+        비중 중복도 내림차순, 같으면 중복 종목 수 내림차순으로 정렬됩니다.
+        """
+        upper_i, upper_j = np.triu_indices(len(self.etf_tickers), k=1)
+        counts = self.overlap_counts[upper_i, upper_j]
+        keep = counts >= max(min_overlap, 1)
+        upper_i, upper_j = upper_i[keep], upper_j[keep]
+
+        order = np.lexsort(
+            (
+                -self.overlap_counts[upper_i, upper_j],
+                -self.weight_overlap[upper_i, upper_j],
+            )
+        )
+        return list(zip(upper_i[order].tolist(), upper_j[order].tolist()))
+
+
+@dataclass(frozen=True)
+class HoldingsSnapshot:
+    """
+    날짜별 보유 종목 열 저장소
+
+    보유 종목을 Holding 객체 리스트 대신 NumPy 배열로 보관합니다.
+    ETF/종목 코드는 정렬된 고유 티커 목록(intern된 문자열)의 인덱스로 저장하므로
+    행마다 문자열이나 객체를 만들지 않으며, 그룹화/순위 계산은 벡터 연산으로 처리합니다.
+    Holding 객체가 필요하면 to_holdings()로 필요한 행만 만듭니다.
+
+    Attributes:
+        date: 기준일
+        etf_tickers: ETF 코드 목록 (etf_codes가 가리키는 값)
+        stock_tickers: 종목 코드 목록 (stock_codes가 가리키는 값)
+        etf_codes: 행별 ETF 코드 번호 (int32)
+        stock_codes: 행별 종목 코드 번호 (int32)
+        weights: 행별 비중 (float64)
+        amounts: 행별 평가금액 (float64)
+        stock_names: 종목 코드 → 종목명
+
+    Examples:
+        >>> snapshot = HoldingsSnapshot.from_holdings(holdings, date)
+        >>> groups = snapshot.group_by_stock()
+        >>> snapshot.weight_distribution()
+        {'under_1': 660, '1_to_3': 303, ...}
+    """
+
+    date: Optional[datetime]
+    etf_tickers: Tuple[str, ...]
+    stock_tickers: Tuple[str, ...]
+    etf_codes: np.ndarray
+    stock_codes: np.ndarray
+    weights: np.ndarray
+    amounts: np.ndarray
+    stock_names: Dict[str, str] = field(default_factory=dict)
+
+    @staticmethod
+    def from_columns(
+        date: Optional[datetime],
+        etf_tickers: Sequence[str],
+        stock_tickers: Sequence[str],
+        weights: Sequence[float],
+        amounts: Sequence[float],
+        stock_names: Optional[Dict[str, str]] = None,
+    ) -> "HoldingsSnapshot":
+        """
+        열 데이터로 스냅샷을 생성합니다.
+
+        Args:
+            date: 기준일
+            etf_tickers: 행별 ETF 코드
+            stock_tickers: 행별 종목 코드
+            weights: 행별 비중
+            amounts: 행별 평가금액
+            stock_names: 종목 코드 → 종목명
+        """
+        etf_vocab, etf_codes = np.unique(
+            np.asarray(etf_tickers, dtype=str), return_inverse=True
+        )
+        stock_vocab, stock_codes = np.unique(
+            np.asarray(stock_tickers, dtype=str), return_inverse=True
+        )
+
+        return HoldingsSnapshot(
+            date=date,
+            etf_tickers=tuple(sys.intern(str(t)) for t in etf_vocab),
+            stock_tickers=tuple(sys.intern(str(t)) for t in stock_vocab),
+            etf_codes=etf_codes.astype(np.int32).reshape(-1),
+            stock_codes=stock_codes.astype(np.int32).reshape(-1),
+            weights=np.asarray(weights, dtype=np.float64),
+            amounts=np.asarray(amounts, dtype=np.float64),
+            stock_names=dict(stock_names or {}),
+        )
+
+    @staticmethod
+    def from_holdings(
+        holdings: Iterable[Holding], date: Optional[datetime] = None
+    ) -> "HoldingsSnapshot":
+        """Holding 리스트로 스냅샷을 생성합니다."""
+        holdings = list(holdings)
+        if date is None and holdings:
+            date = holdings[0].date
+
+        return HoldingsSnapshot.from_columns(
+            date,
+            [h.etf_ticker for h in holdings],
+            [h.stock_ticker for h in holdings],
+            [h.weight for h in holdings],
+            [h.amount for h in holdings],
+            {h.stock_ticker: h.stock_name for h in holdings},
+        )
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    @property
+    def nbytes(self) -> int:
+        """행 배열이 차지하는 메모리 (bytes)"""
+        return (
+            self.etf_codes.nbytes
+            + self.stock_codes.nbytes
+            + self.weights.nbytes
+            + self.amounts.nbytes
+        )
+
+    def for_etfs(self, etf_tickers: Iterable[str]) -> "HoldingsSnapshot":
+        """특정 ETF들의 행만 담은 스냅샷을 반환합니다. (코드 목록은 공유)"""
+        index = {ticker: code for code, ticker in enumerate(self.etf_tickers)}
+        codes = [index[t] for t in etf_tickers if t in index]
+        return self._select(np.isin(self.etf_codes, codes))
+
+    def to_holdings(self, etf_ticker: Optional[str] = None) -> List[Holding]:
+        """
+        Holding 리스트로 변환합니다.
+
+        Args:
+            etf_ticker: 지정하면 해당 ETF의 행만 변환
+        """
+        rows = self if etf_ticker is None else self.for_etfs([etf_ticker])
+
+        return [
+            Holding.from_trusted(
+                etf_ticker=rows.etf_tickers[e],
+                stock_ticker=rows.stock_tickers[s],
+                date=rows.date,
+                weight=float(w),
+                amount=float(a),
+                stock_name=rows.stock_names.get(rows.stock_tickers[s], ""),
+            )
+            for e, s, w, a in zip(
+                rows.etf_codes.tolist(),
+                rows.stock_codes.tolist(),
+                rows.weights.tolist(),
+                rows.amounts.tolist(),
+            )
+        ]
+
+    def rows_by_etf(self) -> Dict[str, List[HoldingRow]]:
+        """
+        ETF별 보유 행을 종목 코드 순으로 반환합니다.
+
+        종목 코드 번호는 정렬된 티커 목록의 인덱스이므로 번호 순이 곧 티커 순이며,
+        HoldingsAnalyzer.merge_holdings()에 그대로 넘길 수 있습니다.
+        """
+        order = np.lexsort((self.stock_codes, self.etf_codes))
+        date_str = to_date_string(self.date) if self.date else ""
+
+        by_etf = defaultdict(list)
+        for e, s, w, a in zip(
+            self.etf_codes[order].tolist(),
+            self.stock_codes[order].tolist(),
+            self.weights[order].tolist(),
+            self.amounts[order].tolist(),
+        ):
+            etf_ticker = self.etf_tickers[e]
+            stock_ticker = self.stock_tickers[s]
+            by_etf[etf_ticker].append(
+                HoldingRow(
+                    etf_ticker,
+                    stock_ticker,
+                    date_str,
+                    w,
+                    a,
+                    self.stock_names.get(stock_ticker, ""),
+                )
+            )
+        return by_etf
+
+    def group_by_stock(self) -> StockGroups:
+        """종목별 ETF 수, 총 평가금액, 평균/최소/최대 비중을 벡터 연산으로 계산합니다."""
+        order = np.argsort(self.stock_codes, kind="stable")
+        sorted_codes = self.stock_codes[order]
+
+        if len(sorted_codes):
+            starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        else:
+            starts = np.zeros(0, dtype=np.intp)
+
+        codes = sorted_codes[starts]
+        minlength = len(self.stock_tickers)
+
+        holding_count = np.bincount(self.stock_codes, minlength=minlength)[codes]
+        total_amount = np.bincount(
+            self.stock_codes, weights=self.amounts, minlength=minlength
+        )[codes]
+        weight_sum = np.bincount(
+            self.stock_codes, weights=self.weights, minlength=minlength
+        )[codes]
+
+        # 고유 (종목, ETF) 쌍으로 ETF 수 계산
+        pairs = np.unique(
+            self.stock_codes.astype(np.int64) * max(len(self.etf_tickers), 1)
+            + self.etf_codes
+        )
+        etf_count = np.bincount(
+            pairs // max(len(self.etf_tickers), 1), minlength=minlength
+        )[codes]
+
+        sorted_weights = self.weights[order]
+        if len(starts):
+            min_weight = np.minimum.reduceat(sorted_weights, starts)
+            max_weight = np.maximum.reduceat(sorted_weights, starts)
+        else:
+            min_weight = max_weight = np.zeros(0)
+
+        return StockGroups(
+            codes=codes,
+            etf_count=etf_count,
+            holding_count=holding_count,
+            total_amount=total_amount,
+            avg_weight=(weight_sum / holding_count if len(codes) else np.zeros(0)),
+            min_weight=min_weight,
+            max_weight=max_weight,
+            order=order,
+            starts=starts,
+        )
+
+    @cached_property
+    def overlap_matrix(self) -> ETFOverlapMatrix:
+        """
+        전체 ETF 쌍의 종목 수/비중 중복도를 한 번에 계산합니다.
+
+        종목별 보유 ETF 목록(종목 순 정렬 구간 = 종목→ETF 역색인)에서
+        같은 종목을 보유한 ETF 쌍만 만들어 누적합니다. (희소 계산)
+        중간 배열은 실제 공동 보유 쌍 수(종목별 보유 ETF 수 k의 k(k-1)/2 합)에
+        비례하며, OVERLAP_BLOCK_ELEMENTS 쌍 단위로 나눠 계산합니다.
+        결과는 API 응답 형식인 n×n 행렬입니다.
+        스냅샷은 날짜별로 캐시되므로 결과도 스냅샷에 한 번만 계산해 둡니다.
+        """
+        n_etfs = len(self.etf_tickers)
+        holding_counts = np.bincount(self.etf_codes, minlength=n_etfs)
+        weight_totals = np.bincount(
+            self.etf_codes, weights=self.weights, minlength=n_etfs
+        )
+
+        # 종목 순으로 정렬된 (ETF, 비중) - 종목마다 ETF는 한 번씩만 나옴
+        groups = self.group_by_stock()
+        etfs = self.etf_codes[groups.order].astype(np.int64)
+        weights = self.weights[groups.order]
+
+        # 2개 이상 ETF가 보유한 종목만 쌍을 만듦
+        shared = np.flatnonzero(groups.holding_count >= 2)
+        sizes = groups.holding_count[shared]
+        pair_counts = sizes * (sizes - 1) // 2
+
+        counts = np.zeros(n_etfs * n_etfs, dtype=np.int64)
+        overlap = np.zeros(n_etfs * n_etfs, dtype=np.float64)
+
+        batch_ids = (np.cumsum(pair_counts) - pair_counts) // OVERLAP_BLOCK_ELEMENTS
+        for batch in np.split(
+            np.arange(len(shared)), np.flatnonzero(np.diff(batch_ids)) + 1
+        ):
+            if not len(batch):
+                continue
+            left, right = _group_pairs(groups.starts[shared[batch]], sizes[batch])
+            keys = etfs[left] * n_etfs + etfs[right]
+            counts += np.bincount(keys, minlength=n_etfs * n_etfs)
+            overlap += np.bincount(
+                keys,
+                weights=np.minimum(weights[left], weights[right]),
+                minlength=n_etfs * n_etfs,
+            )
+
+        # 쌍은 한 방향으로만 누적되므로 전치를 더해 대칭 행렬로 만듦
+        overlap_counts = counts.reshape(n_etfs, n_etfs)
+        overlap_counts = (overlap_counts + overlap_counts.T).astype(np.int32)
+        weight_overlap = overlap.reshape(n_etfs, n_etfs)
+        weight_overlap = weight_overlap + weight_overlap.T
+
+        np.fill_diagonal(overlap_counts, holding_counts)
+        np.fill_diagonal(weight_overlap, weight_totals)
+
+        return ETFOverlapMatrix(
+            etf_tickers=self.etf_tickers,
+            holding_counts=holding_counts,
+            overlap_counts=overlap_counts,
+            weight_overlap=weight_overlap,
+        )
+
+    def weight_distribution(self) -> Dict[str, int]:
+        """비중 구간별 행 수를 반환합니다."""
+        buckets = np.searchsorted(WEIGHT_BUCKET_EDGES, self.weights, side="right")
+        counts = np.bincount(buckets, minlength=len(WEIGHT_BUCKET_LABELS))
+        return {label: int(count) for label, count in zip(WEIGHT_BUCKET_LABELS, counts)}
+
+    def _select(self, mask: np.ndarray) -> "HoldingsSnapshot":
+        """마스크에 해당하는 행만 담은 스냅샷을 반환합니다."""
+        return HoldingsSnapshot(
+            date=self.date,
+            etf_tickers=self.etf_tickers,
+            stock_tickers=self.stock_tickers,
+            etf_codes=self.etf_codes[mask],
+            stock_codes=self.stock_codes[mask],
+            weights=self.weights[mask],
+            amounts=self.amounts[mask],
+            stock_names=self.stock_names,
+        )
@@ -0,0 +1,95 @@
+"""
+KeywordMatcher 값 객체
+여러 키워드를 한 번의 문자열 순회로 찾는 Aho–Corasick 매처입니다.
+"""
+
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+
+class KeywordMatcher:
+    """
+    다중 키워드 매처 (Aho–Corasick)
+
+    키워드 목록으로 트라이와 실패 링크를 한 번 만들어 두고,
+    문자열을 한 글자씩 한 번만 읽어 포함된 키워드를 모두 찾습니다.
+    키워드 수와 무관하게 비용이 문자열 길이에 비례하며, 겹치는 키워드
+    (예: "AI"와 "AI반도체")도 모두 찾습니다. 대소문자는 구분하지 않습니다.
+
+    Attributes:
+        keywords: 소문자로 정규화된 고유 키워드 목록 (find()가 반환하는 인덱스의 대상)
+
+    Examples:
+        >>> matcher = KeywordMatcher(["반도체", "AI"])
+        >>> matcher.find("KODEX AI반도체액티브")
+        frozenset({0, 1})
+    """
+
+    __slots__ = ("keywords", "_goto", "_fail", "_output")
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(
+            dict.fromkeys(k.lower() for k in keywords if k)
+        )
+
+        goto: List[Dict[str, int]] = [{}]
+        output: List[FrozenSet[int]] = [frozenset()]
+
+        # 트라이 구성
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append(frozenset())
+                state = next_state
+            output[state] = output[state] | {index}
+
+        # 실패 링크 (BFS), 실패 상태의 출력 병합
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state] = output[next_state] | output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find(self, text: str) -> FrozenSet[int]:
+        """
+        문자열에 포함된 키워드들의 인덱스를 반환합니다.
+
+        Args:
+            text: 검색할 문자열
+
+        Returns:
+            keywords 인덱스 집합 (없으면 빈 집합)
+        """
+        if not self.keywords:
+            return frozenset()
+
+        goto, fail, output = self._goto, self._fail, self._output
+        found = frozenset()
+        state = 0
+
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found = found | output[state]
+
+        return found
@@ -20,6 +20,43 @@ class ChangeStatus(Enum):
     UNCHANGED = "유지"  # 비중 유지
 
 
+# API/집계에서 사용하는 상태 키
+CHANGE_STATUS_KEYS = {
+    ChangeStatus.NEW: "new",
+    ChangeStatus.REMOVED: "removed",
+    ChangeStatus.INCREASED: "increased",
+    ChangeStatus.DECREASED: "decreased",
+    ChangeStatus.UNCHANGED: "unchanged",
+}
+
+# 비중 유지로 간주하는 변화량 상한 (%, 미만) - 비교 화면/분석 서비스 공통 기준
+WEIGHT_CHANGE_THRESHOLD = 0.01
+
+
+def classify_weight_change(
+    change: float, threshold: float = WEIGHT_CHANGE_THRESHOLD
+) -> ChangeStatus:
+    """
+    두 시점 모두 보유한 종목의 비중 변화량을 분류합니다.
+
+    WeightChange.create와 같이 변화량을 소수점 4자리로 반올림한 뒤,
+    절대값이 threshold 미만이면 유지로 봅니다. (threshold와 같으면 증가/감소)
+
+    Args:
+        change: 비중 변화량 (현재 - 이전)
+        threshold: 유지로 간주할 변화량 상한 (미만)
+
+    Returns:
+        INCREASED / DECREASED / UNCHANGED
+    """
+    change = round(change, 4)
+    if abs(change) < threshold:
+        return ChangeStatus.UNCHANGED
+    if change > 0:
+        return ChangeStatus.INCREASED
+    return ChangeStatus.DECREASED
+
+
 @dataclass(frozen=True)
 class WeightChange:
     """
@@ -50,7 +87,9 @@ class WeightChange:
 
     @staticmethod
     def create(
-        previous_weight: float, current_weight: float, threshold: float = 0.01
+        previous_weight: float,
+        current_weight: float,
+        threshold: float = WEIGHT_CHANGE_THRESHOLD,
     ) -> "WeightChange":
         """
         WeightChange 인스턴스를 생성하고 상태를 결정합니다.
@@ -118,15 +157,7 @@ class WeightChange:
             return ChangeStatus.REMOVED
 
         # 변화량이 threshold 미만이면 유지로 간주
-        if abs(change) < threshold:
-            return ChangeStatus.UNCHANGED
-
-        # 비중 증가
-        if change > 0:
-            return ChangeStatus.INCREASED
-
-        # 비중 감소
-        return ChangeStatus.DECREASED
+        return classify_weight_change(change, threshold)
 
     def to_dict(self) -> dict:
         """값 객체를 딕셔너리로 변환"""
@@ -5,11 +5,15 @@ Market Data Adapter
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List
+from typing import Iterator, List, Tuple
 
+from config.logging_config import get_logger
 from domain.entities.etf import ETF
 from domain.entities.holding import Holding
 from domain.entities.stock import Stock
+from shared.utils.date_utils import get_business_days
+
+logger = get_logger(__name__)
 
 
 class MarketDataAdapter(ABC):
@@ -72,6 +76,32 @@ class MarketDataAdapter(ABC):
         """
         pass
 
+    def collect_holdings_for_etfs(
+        self, etf_tickers: List[str], date: datetime
+    ) -> Iterator[Tuple[str, List[Holding]]]:
+        """
+        여러 ETF의 특정 날짜 보유 종목을 수집합니다.
+
+        수집이 끝나는 대로 (ETF 코드, Holding 리스트)를 하나씩 반환하므로
+        호출 측에서 결과를 바로 저장할 수 있습니다. 수집에 실패한 ETF는
+        로그만 남기고 건너뜁니다.
+
+        기본 구현은 순차 수집이며, 구현체에서 병렬 수집으로 재정의할 수 있습니다.
+
+        Args:
+            etf_tickers: ETF 코드 리스트
+            date: 기준일
+
+        Yields:
+            (ETF 코드, Holding 엔티티 리스트) 튜플
+        """
+        for etf_ticker in etf_tickers:
+            try:
+                yield etf_ticker, self.collect_holdings_for_date(etf_ticker, date)
+            except Exception as e:
+                logger.warning(f"Failed to collect holdings for {etf_ticker}: {e}")
+                continue
+
     @abstractmethod
     def is_business_day(self, date: datetime) -> bool:
         """
@@ -85,6 +115,28 @@ class MarketDataAdapter(ABC):
         """
         pass
 
+    def get_trading_days(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[datetime]:
+        """
+        ✅ 추가: 기간 내의 거래일 리스트를 조회합니다.
+
+        기본 구현은 평일마다 is_business_day를 호출합니다.
+        한 번의 요청으로 기간 전체를 조회할 수 있는 구현체는 재정의합니다.
+
+        Args:
+            start_date: 시작일
+            end_date: 종료일
+
+        Returns:
+            거래일 리스트 (오름차순)
+        """
+        return [
+            date
+            for date in get_business_days(start_date, end_date)
+            if self.is_business_day(date)
+        ]
+
     @abstractmethod
     def get_stock_name(self, ticker: str) -> str:
         """
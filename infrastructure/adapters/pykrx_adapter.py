@@ -5,9 +5,11 @@ PyKRX 라이브러리를 사용한 시장 데이터 어댑터 구현체입니다
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from config.logging_config import LoggerMixin
 from config.settings import market_settings, settings
@@ -16,9 +18,12 @@ from domain.entities.holding import Holding
 from domain.entities.stock import Stock
 from pykrx import stock
 from shared.exceptions import ExternalAPIException
-from shared.utils.date_utils import to_krx_format
+from shared.utils.date_utils import from_krx_format, get_date_range, to_krx_format
+from shared.utils.validation import is_valid_ticker
 
 from infrastructure.adapters.market_data_adapter import MarketDataAdapter
+from infrastructure.adapters.rate_limiter import TokenBucketRateLimiter
+from infrastructure.cache.ticker_name_cache import TickerNameCache
 
 
 class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
@@ -31,10 +36,73 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
         # "XXXXXX": "특수자산명",
     }
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        name_cache: Optional[TickerNameCache] = None,
+    ):
         self.api_delay = settings.API_DELAY_SECONDS
         self.retry_max = settings.RETRY_MAX_ATTEMPTS
         self.retry_delay = settings.RETRY_DELAY_SECONDS
+        self.max_workers = max(1, max_workers or settings.COLLECT_MAX_WORKERS)
+
+        # ✅ 추가: 모든 워커가 공유하는 요청 속도 제한기 (API_DELAY_SECONDS 간격 유지)
+        self.rate_limiter = TokenBucketRateLimiter.from_delay(self.api_delay)
+
+        # ✅ 추가: 종목/ETF 이름 영구 캐시 (None이면 매번 API 조회)
+        self.name_cache = name_cache
+
+    def _throttle(self) -> None:
+        """KRX 요청 전 속도 제한 토큰을 획득합니다."""
+        self.rate_limiter.acquire()
+
+    def _lookup_name(
+        self, kind: str, ticker: str, fetch: Callable[[str], object]
+    ) -> Optional[str]:
+        """
+        캐시를 먼저 확인하고, 없거나 만료된 경우에만 API로 이름을 조회합니다.
+
+        Args:
+            kind: 티커 종류 (TickerNameCache.KIND_STOCK, KIND_ETF)
+            ticker: 종목/ETF 코드
+            fetch: PyKRX 이름 조회 함수
+
+        Returns:
+            이름, 실패 시 None
+        """
+        if self.name_cache:
+            cached_name = self.name_cache.get(kind, ticker)
+            if cached_name:
+                return cached_name
+
+        try:
+            self._throttle()
+            name = fetch(ticker)
+            if name and isinstance(name, str) and name.strip():
+                name = name.strip()
+                if self.name_cache:
+                    self.name_cache.put(kind, ticker, name)
+                return name
+        except Exception as e:
+            self.logger.debug(
+                "Could not get %s name for ticker %s: %s", kind, ticker, str(e)
+            )
+
+        # 재조회 실패 시 만료된 이름이라도 사용
+        if self.name_cache:
+            return self.name_cache.get_stale(kind, ticker)
+
+        return None
+
+    def _flush_name_cache(self) -> None:
+        """새로 조회한 이름들을 캐시 테이블에 저장합니다."""
+        if not self.name_cache:
+            return
+
+        try:
+            self.name_cache.flush()
+        except Exception as e:
+            self.logger.warning("Failed to persist ticker names: %s", str(e))
 
     def collect_all_stocks(self) -> List[Stock]:
         """전체 주식 목록을 수집합니다."""
@@ -49,8 +117,6 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
                 stocks = self.collect_stocks_by_market(market)
                 all_stocks.extend(stocks)
 
-                time.sleep(self.api_delay)
-
             self.logger.info("Collected total stocks: %d", len(all_stocks))
             return all_stocks
 
@@ -66,6 +132,7 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
             # 재시도 로직
             for attempt in range(self.retry_max):
                 try:
+                    self._throttle()
                     tickers = stock.get_market_ticker_list(today, market=market)
                     break
                 except Exception as e:
@@ -87,14 +154,14 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
                     if name:
                         stocks.append(Stock.create(ticker=ticker, name=name))
 
-                    time.sleep(self.api_delay)
-
                 except Exception as e:
                     self.logger.warning(
                         "Failed to get stock name for ticker %s: %s", ticker, str(e)
                     )
                     continue
 
+            self._flush_name_cache()
+
             self.logger.info("Collected %d stocks from %s", len(stocks), market)
             return stocks
 
@@ -123,14 +190,9 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
             self.logger.debug(f"Special ticker detected: {ticker} -> {special_name}")
             return special_name
 
-        try:
-            name = stock.get_market_ticker_name(ticker)
-            if name and isinstance(name, str) and name.strip():
-                return name.strip()
-            return None
-        except Exception as e:
-            self.logger.debug("Could not get name for ticker %s: %s", ticker, str(e))
-            return None
+        return self._lookup_name(
+            TickerNameCache.KIND_STOCK, ticker, stock.get_market_ticker_name
+        )
 
     def collect_etfs_for_date(self, date: datetime) -> List[ETF]:
         """특정 날짜의 ETF 목록을 수집합니다."""
@@ -141,6 +203,7 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
             # 재시도 로직
             for attempt in range(self.retry_max):
                 try:
+                    self._throttle()
                     tickers = stock.get_etf_ticker_list(date_str)
                     break
                 except Exception as e:
@@ -159,14 +222,14 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
                     if name:
                         etfs.append(ETF.create(ticker=ticker, name=name))
 
-                    time.sleep(self.api_delay)
-
                 except Exception as e:
                     self.logger.warning(
                         "Failed to get ETF name for ticker %s: %s", ticker, str(e)
                     )
                     continue
 
+            self._flush_name_cache()
+
             self.logger.info("Collected %d ETFs for %s", len(etfs), date_str)
             return etfs
 
@@ -189,16 +252,9 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
             self.logger.debug(f"Special ticker {ticker} is not an ETF")
             return None
 
-        try:
-            name = stock.get_etf_ticker_name(ticker)
-            if name and isinstance(name, str) and name.strip():
-                return name.strip()
-            return None
-        except Exception as e:
-            self.logger.debug(
-                "Could not get name for ETF ticker %s: %s", ticker, str(e)
-            )
-            return None
+        return self._lookup_name(
+            TickerNameCache.KIND_ETF, ticker, stock.get_etf_ticker_name
+        )
 
     def collect_holdings_for_date(
         self, etf_ticker: str, date: datetime
@@ -210,6 +266,7 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
             # 재시도 로직
             for attempt in range(self.retry_max):
                 try:
+                    self._throttle()
                     df = stock.get_etf_portfolio_deposit_file(etf_ticker, date_str)
                     break
                 except Exception as e:
@@ -232,36 +289,8 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
                 )
                 return []
 
-            holdings = []
-            for stock_ticker, row in df.iterrows():
-                try:
-                    # 평가금액 처리
-                    amount = 0.0
-                    if "금액" in df.columns:
-                        amount = float(row["금액"]) if pd.notna(row["금액"]) else 0.0
-
-                    # ✅ 수정: 종목명 안전하게 가져오기 (특수 ticker 처리 포함)
-                    stock_name = self._get_holding_stock_name(
-                        df, row, str(stock_ticker)
-                    )
-
-                    holding = Holding.create(
-                        etf_ticker=etf_ticker,
-                        stock_ticker=str(stock_ticker),
-                        date=date,
-                        weight=float(row["비중"]),
-                        amount=amount,
-                        stock_name=stock_name,
-                    )
-                    holdings.append(holding)
-
-                except Exception as e:
-                    self.logger.warning(
-                        "Failed to create holding for ticker %s: %s",
-                        stock_ticker,
-                        str(e),
-                    )
-                    continue
+            # ✅ 개선: 행 단위 변환 대신 컬럼 단위로 일괄 변환
+            holdings = self._holdings_from_dataframe(df, etf_ticker, date)
 
             self.logger.debug(
                 "Collected %d holdings for %s on %s",
@@ -280,40 +309,156 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
             )
             raise ExternalAPIException("PyKRX", str(e))
 
-    def _get_holding_stock_name(
-        self, df: pd.DataFrame, row: pd.Series, stock_ticker: str
-    ) -> str:
+    def collect_holdings_for_etfs(
+        self, etf_tickers: List[str], date: datetime
+    ) -> Iterator[Tuple[str, List[Holding]]]:
+        """
+        ✅ 추가: 여러 ETF의 보유 종목을 워커 풀에서 병렬로 수집합니다.
+
+        모든 워커가 하나의 속도 제한기를 공유하므로 KRX 요청 속도는
+        순차 수집과 같고, 네트워크 대기 시간만 워커 수만큼 겹쳐집니다.
+        완료된 순서대로 결과를 반환합니다.
+        """
+        try:
+            if self.max_workers <= 1 or len(etf_tickers) <= 1:
+                yield from super().collect_holdings_for_etfs(etf_tickers, date)
+            else:
+                yield from self._collect_holdings_parallel(etf_tickers, date)
+        finally:
+            self._flush_name_cache()
+
+    def _collect_holdings_parallel(
+        self, etf_tickers: List[str], date: datetime
+    ) -> Iterator[Tuple[str, List[Holding]]]:
+        """워커 풀에서 보유 종목을 수집하고 완료된 순서대로 반환합니다."""
+        workers = min(self.max_workers, len(etf_tickers))
+        self.logger.debug(
+            "Collecting holdings for %d ETFs with %d workers", len(etf_tickers), workers
+        )
+
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="krx-holdings"
+        )
+        try:
+            futures = {
+                executor.submit(self.collect_holdings_for_date, ticker, date): ticker
+                for ticker in etf_tickers
+            }
+
+            for future in as_completed(futures):
+                etf_ticker = futures[future]
+                try:
+                    holdings = future.result()
+                except Exception as e:
+                    self.logger.warning(
+                        "Failed to collect holdings for %s: %s", etf_ticker, str(e)
+                    )
+                    continue
+
+                yield etf_ticker, holdings
+        finally:
+            # 호출 측이 중간에 중단한 경우 남은 작업 취소
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _holdings_from_dataframe(
+        self, df: pd.DataFrame, etf_ticker: str, date: datetime
+    ) -> List[Holding]:
         """
-        ✅ 수정: Holdings의 종목명을 안전하게 가져옵니다.
+        ✅ 추가: PDF DataFrame을 컬럼 단위 연산으로 Holding 리스트로 변환합니다.
+
+        Holding.create와 같은 규칙(티커 6자리 숫자, 비중 0~100, 금액 0 이상)을
+        컬럼 전체에 한 번에 적용하고, 통과한 행만 Holding으로 만듭니다.
+        규칙을 통과하지 못한 행은 개별적으로 로그를 남기고 제외합니다.
 
-        우선순위:
+        종목명 우선순위:
         1. 특수 ticker 처리 (010010 등)
         2. DataFrame의 '종목명' 컬럼
-        3. PyKRX API로 조회
+        3. PyKRX API로 조회 (이름이 비어 있는 행만)
         4. 티커를 이름으로 사용
         """
-        # ✅ 추가: 특수 ticker 처리 (최우선)
-        if stock_ticker in self.SPECIAL_TICKERS:
-            special_name = self.SPECIAL_TICKERS[stock_ticker]
-            self.logger.debug(f"Using special name for {stock_ticker}: {special_name}")
-            return special_name
+        normalized_etf_ticker = etf_ticker.strip().zfill(6)
+        if not is_valid_ticker(normalized_etf_ticker):
+            self.logger.warning("Invalid ETF ticker for holdings: %s", etf_ticker)
+            return []
+
+        row_count = len(df)
+
+        # 티커 정규화
+        tickers = df.index.astype(str).str.strip().str.zfill(6)
+        ticker_ok = np.asarray(tickers.str.fullmatch(r"\d{6}"), dtype=bool)
+        tickers = tickers.to_numpy(dtype=object)
+
+        # 비중 (숫자가 아니면 NaN → 검증 실패)
+        weights = pd.to_numeric(df["비중"], errors="coerce").to_numpy(dtype=float)
+        weight_ok = (weights >= 0) & (weights <= 100)
+
+        # 평가금액 (결측은 0, 숫자가 아닌 값은 검증 실패)
+        if "금액" in df.columns:
+            raw_amounts = df["금액"]
+            amounts = pd.to_numeric(raw_amounts, errors="coerce")
+            amount_ok = ~(amounts.isna() & raw_amounts.notna()).to_numpy()
+            amounts = amounts.fillna(0.0).to_numpy(dtype=float)
+            amount_ok &= amounts >= 0
+        else:
+            amounts = np.zeros(row_count)
+            amount_ok = np.ones(row_count, dtype=bool)
+
+        valid = ticker_ok & weight_ok & amount_ok
+
+        for i in np.flatnonzero(~valid):
+            if not ticker_ok[i]:
+                reason = f"Invalid stock ticker: {df.index[i]}"
+            elif not weight_ok[i]:
+                reason = f"Invalid weight: {weights[i]} (must be 0-100)"
+            else:
+                reason = f"Invalid amount: {df['금액'].iloc[i]} (must be >= 0)"
+            self.logger.warning(
+                "Failed to create holding for ticker %s: %s", df.index[i], reason
+            )
 
-        # 1. DataFrame에서 시도
-        if "종목명" in df.columns and pd.notna(row["종목명"]):
-            name = str(row["종목명"]).strip()
-            if name:
-                return name
+        names = self._holding_names(df, tickers, valid)
 
-        # 2. PyKRX API로 시도
-        try:
-            name = self._safe_get_stock_name(stock_ticker)
-            if name:
-                return name
-        except:
-            pass
+        return [
+            Holding(
+                etf_ticker=normalized_etf_ticker,
+                stock_ticker=ticker,
+                date=date,
+                weight=round(weight, 4),
+                amount=round(amount, 2),
+                stock_name=name,
+            )
+            for ticker, weight, amount, name in zip(
+                tickers[valid],
+                weights[valid].tolist(),
+                amounts[valid].tolist(),
+                names[valid],
+            )
+        ]
+
+    def _holding_names(
+        self, df: pd.DataFrame, tickers: np.ndarray, valid: np.ndarray
+    ) -> np.ndarray:
+        """보유 종목명 컬럼을 만들고, 비어 있는 유효 행만 개별 조회합니다."""
+        if "종목명" in df.columns:
+            names = (
+                df["종목명"]
+                .astype("string")
+                .str.strip()
+                .fillna("")
+                .to_numpy(dtype=object)
+            )
+        else:
+            names = np.full(len(df), "", dtype=object)
+
+        # ✅ 특수 ticker 처리 (최우선)
+        special = pd.Series(tickers).map(self.SPECIAL_TICKERS)
+        has_special = special.notna().to_numpy()
+        names[has_special] = special[has_special].to_numpy(dtype=object)
+
+        for i in np.flatnonzero(valid & (names == "")):
+            names[i] = self._safe_get_stock_name(tickers[i]) or tickers[i]
 
-        # 3. 티커를 이름으로 사용
-        return stock_ticker
+        return names
 
     def is_business_day(self, date: datetime) -> bool:
         """특정 날짜가 영업일인지 확인합니다."""
@@ -326,6 +471,7 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
             date_str = to_krx_format(date)
 
             try:
+                self._throttle()
                 df = stock.get_market_ohlcv(
                     date_str, date_str, market_settings.REFERENCE_TICKER
                 )
@@ -337,12 +483,57 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
             self.logger.warning("Failed to check business day: %s", str(e))
             return False
 
+    def get_trading_days(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[datetime]:
+        """
+        ✅ 추가: 기준 종목의 기간 시세를 한 번에 조회하여 거래일을 구합니다.
+
+        Raises:
+            ExternalAPIException: 조회 실패 시, 또는 지난 평일이 있는 기간인데
+                시세가 하나도 없는 경우 (일시적 장애로 빈 응답이 온 것으로 판단)
+        """
+        start_str = to_krx_format(start_date)
+        end_str = to_krx_format(end_date)
+
+        try:
+            self._throttle()
+            df = stock.get_market_ohlcv(
+                start_str, end_str, market_settings.REFERENCE_TICKER
+            )
+        except Exception as e:
+            self.logger.warning(
+                "Failed to get trading days %s~%s: %s", start_str, end_str, str(e)
+            )
+            raise ExternalAPIException("PyKRX", str(e))
+
+        if df is None or df.empty:
+            # ✅ 수정: 빈 응답을 "전부 휴장"으로 저장하지 않도록 실패로 처리
+            today = datetime.now().date()
+            if any(
+                d.weekday() < 5 and d.date() < today
+                for d in get_date_range(start_date, end_date)
+            ):
+                raise ExternalAPIException(
+                    "PyKRX", f"Empty OHLCV for {start_str}~{end_str}"
+                )
+            return []
+
+        trading_days = sorted(
+            {from_krx_format(ts.strftime("%Y%m%d")) for ts in df.index}
+        )
+        self.logger.debug(
+            "Found %d trading days in %s~%s", len(trading_days), start_str, end_str
+        )
+        return trading_days
+
     def get_stock_name(self, ticker: str) -> str:
         """
         ✅ 수정: 종목 코드로 종목명을 조회합니다.
         """
         name = self._safe_get_stock_name(ticker)
         if name:
+            self._flush_name_cache()
             return name
 
         # 실패 시 예외 발생
@@ -354,6 +545,7 @@ class PyKRXAdapter(MarketDataAdapter, LoggerMixin):
         """
         name = self._safe_get_etf_name(ticker)
         if name:
+            self._flush_name_cache()
             return name
 
         # 실패 시 예외 발생
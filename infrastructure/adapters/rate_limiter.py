@@ -0,0 +1,80 @@
+"""
+Rate Limiter
+외부 API 호출 속도를 제한하는 토큰 버킷 구현입니다.
+"""
+
+import time
+from threading import Lock
+
+
+class TokenBucketRateLimiter:
+    """
+    토큰 버킷 기반 속도 제한기
+
+    여러 스레드가 하나의 인스턴스를 공유하여 전체 요청 속도를
+    초당 rate 회 이하로 유지합니다. capacity가 1이면 요청 사이의
+    최소 간격이 1/rate 초로 보장됩니다.
+
+    Args:
+        rate: 초당 허용 요청 수 (0 이하이면 제한 없음)
+        capacity: 버킷 최대 토큰 수 (순간 허용 요청 수)
+
+    Examples:
+        >>> limiter = TokenBucketRateLimiter(rate=10)
+        >>> limiter.acquire()  # 필요 시 대기 후 반환
+        0.0
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = Lock()
+
+    @classmethod
+    def from_delay(cls, delay_seconds: float) -> "TokenBucketRateLimiter":
+        """요청 간 지연 시간(초)으로부터 속도 제한기를 생성합니다."""
+        rate = 1.0 / delay_seconds if delay_seconds > 0 else 0.0
+        return cls(rate=rate)
+
+    @property
+    def enabled(self) -> bool:
+        """속도 제한 활성화 여부"""
+        return self.rate > 0
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 획득할 때까지 대기합니다.
+
+        Args:
+            tokens: 필요한 토큰 수
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if not self.enabled:
+            return 0.0
+
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                self._refill()
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+
+                wait_time = (tokens - self._tokens) / self.rate
+
+            # 락 밖에서 대기하여 다른 스레드의 토큰 확인을 막지 않음
+            time.sleep(wait_time)
+            waited += wait_time
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰을 채웁니다. (락 보유 상태에서 호출)"""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
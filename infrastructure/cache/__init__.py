@@ -3,16 +3,26 @@ Cache Infrastructure Module
 캐싱 관련 인프라 컴포넌트를 제공합니다.
 """
 
+from infrastructure.cache import cache_tags
 from infrastructure.cache.cache_manager import (
+    MISSING,
     CacheManager,
     cache_manager,
     cached,
     invalidate_cache,
+    invalidate_tags,
 )
+from infrastructure.cache.ticker_name_cache import TickerNameCache
+from infrastructure.cache.trading_calendar import CachedTradingCalendar
 
 __all__ = [
     "CacheManager",
+    "MISSING",
     "cache_manager",
     "cached",
     "invalidate_cache",
+    "invalidate_tags",
+    "cache_tags",
+    "TickerNameCache",
+    "CachedTradingCalendar",
 ]
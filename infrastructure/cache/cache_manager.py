@@ -3,17 +3,118 @@ Cache Manager (완전 개선 버전)
 메모리 기반 캐싱 레이어를 제공합니다.
 ✅ Medium Priority: 성능 최적화
 ✅ 배치 캐시 무효화 추가
+✅ 항목 수/메모리 상한(LRU 제거), 항목별 TTL, 백그라운드 만료 정리 추가
+✅ 태그 기반 무효화 추가 (태그→키 색인, 태그 버전)
+✅ 같은 키 동시 계산 합치기(single-flight), 만료 값 제공 중 갱신(stale-while-revalidate)
+✅ 없는 결과(None) 캐시(짧은 별도 TTL), MISSING 센티널, 적중/미스 카운터
+✅ 구조화된 튜플 캐시 키 (self 제외, 날짜/리스트 정규화)
 """
 
+import inspect
+import logging
+import sys
 import time
-from datetime import datetime
+from collections import OrderedDict
+from datetime import date, datetime, timezone
 from functools import wraps
-from threading import Lock
-from typing import Any, Callable, Dict, List, Optional
+from itertools import islice
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from config.logging_config import LoggerMixin
 from config.settings import settings
 
+# 컨테이너 크기 추정 시 직접 측정하는 최대 원소 수 (나머지는 평균으로 추정)
+SIZE_SAMPLE_ITEMS = 64
+
+# 캐시 키: 직접 지정한 문자열, 또는 @cached가 만드는
+# (접두사, 함수명, 위치 인자 튜플, 키워드 인자 튜플)
+CacheKey = Union[str, Tuple[Any, ...]]
+
+
+class _Missing:
+    """캐시에 없음을 나타내는 센티널 (캐시된 None과 구분)"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+MISSING = _Missing()
+
+
+class _CacheEntry:
+    """캐시 항목 (값, 만료 시각, 추정 크기, 태그, 만료 값 제공 한도 시각)"""
+
+    __slots__ = ("value", "expires_at", "size", "tags", "stale_until")
+
+    def __init__(
+        self,
+        value: Any,
+        expires_at: float,
+        size: int,
+        tags: Tuple[str, ...] = (),
+        stale_until: Optional[float] = None,
+    ):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.tags = tags
+        self.stale_until = expires_at if stale_until is None else stale_until
+
+
+class _Flight:
+    """진행 중인 계산 (같은 키를 기다리는 호출자들이 결과를 공유)"""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def estimate_size(value: Any, depth: int = 0) -> int:
+    """
+    값이 차지하는 메모리를 대략적으로 추정합니다. (bytes)
+
+    sys.getsizeof는 컨테이너 자신의 크기만 재므로 두 단계까지 내려가 원소 크기를
+    더하고, 큰 컨테이너는 앞쪽 원소의 평균으로 추정합니다.
+    NumPy 배열이나 nbytes를 제공하는 객체(HoldingsSnapshot 등)는 nbytes를 사용합니다.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    size = sys.getsizeof(value)
+    if depth >= 2:
+        return size
+
+    if isinstance(value, dict):
+        count = len(value)
+        sample = [
+            estimate_size(k, depth + 1) + estimate_size(v, depth + 1)
+            for k, v in islice(value.items(), SIZE_SAMPLE_ITEMS)
+        ]
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        count = len(value)
+        sample = [
+            estimate_size(item, depth + 1) for item in islice(value, SIZE_SAMPLE_ITEMS)
+        ]
+    elif hasattr(value, "__dict__"):
+        return size + estimate_size(vars(value), depth + 1)
+    else:
+        return size
+
+    if not sample:
+        return size
+
+    return size + sum(sample) * count // len(sample)
+
 
 class CacheManager(LoggerMixin):
     """
@@ -22,51 +123,140 @@ class CacheManager(LoggerMixin):
     TTL(Time To Live) 기반으로 캐시를 관리하며,
     자주 조회되는 데이터의 성능을 향상시킵니다.
 
+    ✅ 개선:
+    - 항목마다 저장 시 지정한 TTL로 만료 시각을 기록합니다.
+    - 항목 수(max_entries)와 추정 메모리(max_bytes) 상한을 넘으면
+      가장 오래 사용되지 않은 항목부터 제거합니다. (LRU)
+    - 백그라운드 스레드가 주기적으로 만료 항목을 정리합니다.
+    - 항목에 태그를 붙여 저장하면 invalidate_tags()가 태그→키 색인으로
+      해당 항목만 지웁니다. (전체 키를 훑지 않으므로 캐시 크기와 무관)
+      태그마다 버전을 두어, 무효화 전에 계산을 시작해 무효화 후에 저장하려는
+      값은 저장하지 않습니다.
+    - get_or_set()은 같은 키의 동시 미스를 한 번의 계산으로 합치고(single-flight),
+      stale_ttl을 주면 만료 후 그 시간 동안은 이전 값을 바로 반환하면서
+      한 스레드만 백그라운드에서 새 값을 계산합니다. (stale-while-revalidate)
+    - None 결과(없는 티커 등)도 negative_ttl 동안 캐시하며, get(key, MISSING)으로
+      "캐시에 없음"과 "None이 캐시됨"을 구분할 수 있습니다.
+
     Thread-safe 구현으로 멀티스레드 환경에서 안전합니다.
+
+    Args:
+        default_ttl: 기본 TTL (초), None이면 설정값 사용
+        max_entries: 최대 항목 수, None이면 설정값 사용 (0이면 제한 없음)
+        max_bytes: 최대 추정 메모리 (bytes), None이면 설정값 사용 (0이면 제한 없음)
+        sweep_interval: 만료 정리 주기 (초), None이면 설정값 사용 (0이면 정리 안 함)
+        negative_ttl: None 결과 TTL (초), None이면 설정값 사용 (0이면 캐시 안 함)
     """
 
-    def __init__(self, default_ttl: int = None):
-        """
-        Args:
-            default_ttl: 기본 TTL (초), None이면 설정값 사용
-        """
-        self._cache: Dict[str, Any] = {}
-        self._timestamps: Dict[str, datetime] = {}
+    def __init__(
+        self,
+        default_ttl: int = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_interval: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+    ):
+        self._cache: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
         self._lock = Lock()
         self.default_ttl = default_ttl or settings.CACHE_TTL_SECONDS
+        self.max_entries = (
+            settings.CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        )
+        self.max_bytes = settings.CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.sweep_interval = (
+            settings.CACHE_SWEEP_INTERVAL_SECONDS
+            if sweep_interval is None
+            else sweep_interval
+        )
+        self.negative_ttl = (
+            settings.CACHE_NEGATIVE_TTL_SECONDS
+            if negative_ttl is None
+            else negative_ttl
+        )
         self.enabled = settings.CACHE_ENABLED
 
+        self._tag_index: Dict[str, Set[CacheKey]] = {}
+        # 태그 → 버전 (None 키는 clear() 세대: 전체 삭제 시 모든 계산 중 값을 무효화)
+        self._tag_versions: Dict[Optional[str], int] = {}
+
+        self._total_bytes = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._tag_invalidations = 0
+        self._inflight: Dict[CacheKey, _Flight] = {}
+        self._flight_waits = 0
+        self._stale_hits = 0
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+
+        self._sweeper: Optional[Thread] = None
+        self._stop_sweeper = Event()
+
         self.logger.info(
-            f"CacheManager initialized: enabled={self.enabled}, ttl={self.default_ttl}s"
+            f"CacheManager initialized: enabled={self.enabled}, "
+            f"ttl={self.default_ttl}s, max_entries={self.max_entries}, "
+            f"max_bytes={self.max_bytes}"
         )
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: CacheKey, default: Any = None) -> Any:
         """
         캐시에서 값을 조회합니다.
 
         Args:
             key: 캐시 키
+            default: 없거나 만료되었을 때 반환할 값
+                (MISSING을 넘기면 캐시된 None과 구분 가능)
 
         Returns:
-            캐시된 값, 없거나 만료되었으면 None
+            캐시된 값, 없거나 만료되었으면 default
+
+        Examples:
+            >>> value = cache_manager.get(key, MISSING)
+            >>> if value is MISSING:
+            ...     value = load()
         """
         if not self.enabled:
-            return None
+            return default
 
         with self._lock:
-            if key not in self._cache:
-                return None
-
-            # TTL 확인
-            if self._is_expired(key):
-                self._delete_internal(key)
-                return None
-
-            value = self._cache[key]
-            self.logger.debug(f"Cache HIT: {key}")
-            return value
-
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+
+            # TTL 확인 (만료 값 제공 기간이 남은 항목은 get_or_set()용으로 유지)
+            now = time.monotonic()
+            if entry.expires_at <= now:
+                if entry.stale_until <= now:
+                    self._delete_internal(key)
+                    self._expirations += 1
+                self._misses += 1
+                return default
+
+            # 최근 사용으로 이동 (LRU)
+            self._cache.move_to_end(key)
+            self._count_hit(entry)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Cache HIT: {key}")
+            return entry.value
+
+    def _count_hit(self, entry: _CacheEntry) -> None:
+        """적중 카운터 갱신 (None 결과는 따로 집계, 락 없음)"""
+        if entry.value is None:
+            self._negative_hits += 1
+        else:
+            self._hits += 1
+
+    def set(
+        self,
+        key: CacheKey,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+        versions: Optional[Dict[Optional[str], int]] = None,
+        stale_ttl: float = 0,
+    ) -> None:
         """
         캐시에 값을 저장합니다.
 
@@ -74,17 +264,50 @@ class CacheManager(LoggerMixin):
             key: 캐시 키
             value: 저장할 값
             ttl: TTL (초), None이면 기본값 사용
+            tags: 항목이 의존하는 데이터 태그 (invalidate_tags()로 무효화)
+            versions: 값을 계산하기 전에 tag_versions()로 받아 둔 태그 버전
+                (그 사이 무효화된 태그가 있거나 clear()가 호출되었으면 저장하지 않음)
+            stale_ttl: 만료 후 get_or_set()이 이전 값을 제공할 수 있는 시간 (초)
         """
         if not self.enabled:
             return
 
+        tags = tuple(tags or ())
+
+        ttl = ttl or self.default_ttl
+        size = estimate_size(key) + estimate_size(value)
+
+        if self.max_bytes and size > self.max_bytes:
+            self.logger.warning(
+                f"Cache SKIP: {key} ({size} bytes exceeds max_bytes={self.max_bytes})"
+            )
+            return
+
         with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = datetime.now()
+            if versions and any(
+                self._tag_versions.get(tag, 0) != version
+                for tag, version in versions.items()
+            ):
+                self.logger.debug(
+                    f"Cache STALE: {key} (tag invalidated during compute)"
+                )
+                return
+
+            self._delete_internal(key)
+            expires_at = time.monotonic() + ttl
+            self._cache[key] = _CacheEntry(
+                value, expires_at, size, tags, expires_at + stale_ttl
+            )
+            self._total_bytes += size
+            for tag in tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+            self._evict_over_limit()
+
+            self.logger.debug(f"Cache SET: {key} (ttl={ttl}s, ~{size} bytes)")
 
-            self.logger.debug(f"Cache SET: {key} (ttl={ttl or self.default_ttl}s)")
+        self._ensure_sweeper()
 
-    def delete(self, key: str) -> None:
+    def delete(self, key: CacheKey) -> None:
         """캐시에서 특정 키를 삭제합니다."""
         if not self.enabled:
             return
@@ -92,13 +315,34 @@ class CacheManager(LoggerMixin):
         with self._lock:
             self._delete_internal(key)
 
-    def _delete_internal(self, key: str) -> None:
+    def _delete_internal(self, key: CacheKey) -> None:
         """내부용 삭제 메서드 (락 없음)"""
-        if key in self._cache:
-            del self._cache[key]
-            del self._timestamps[key]
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._forget(key, entry)
             self.logger.debug(f"Cache DELETE: {key}")
 
+    def _forget(self, key: CacheKey, entry: _CacheEntry) -> None:
+        """_cache에서 빠진 항목의 크기와 태그 색인을 정리합니다. (락 없음)"""
+        self._total_bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def _evict_over_limit(self) -> None:
+        """상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다. (락 없음)"""
+        while self._cache and (
+            (self.max_entries and len(self._cache) > self.max_entries)
+            or (self.max_bytes and self._total_bytes > self.max_bytes)
+        ):
+            key, entry = self._cache.popitem(last=False)
+            self._forget(key, entry)
+            self._evictions += 1
+            self.logger.debug(f"Cache EVICT: {key}")
+
     def clear(self) -> None:
         """모든 캐시를 삭제합니다."""
         if not self.enabled:
@@ -107,7 +351,10 @@ class CacheManager(LoggerMixin):
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
-            self._timestamps.clear()
+            self._tag_index.clear()
+            self._total_bytes = 0
+            # ✅ 수정: 세대를 올려 clear() 전에 시작된 계산/갱신 값이 저장되지 않게 함
+            self._tag_versions[None] = self._tag_versions.get(None, 0) + 1
             self.logger.info(f"Cache CLEAR: {count} items removed")
 
     def clear_pattern(self, pattern: str) -> int:
@@ -124,15 +371,7 @@ class CacheManager(LoggerMixin):
             return 0
 
         with self._lock:
-            # 와일드카드 패턴 처리
-            if pattern.endswith("*"):
-                prefix = pattern[:-1]
-                keys_to_delete = [k for k in self._cache.keys() if k.startswith(prefix)]
-            elif pattern.startswith("*"):
-                suffix = pattern[1:]
-                keys_to_delete = [k for k in self._cache.keys() if k.endswith(suffix)]
-            else:
-                keys_to_delete = [k for k in self._cache.keys() if pattern in k]
+            keys_to_delete = self._match_keys(pattern)
 
             for key in keys_to_delete:
                 self._delete_internal(key)
@@ -169,21 +408,7 @@ class CacheManager(LoggerMixin):
             all_keys_to_delete = set()
 
             for pattern in patterns:
-                # 와일드카드 패턴 처리
-                if pattern.endswith("*"):
-                    prefix = pattern[:-1]
-                    matching_keys = [
-                        k for k in self._cache.keys() if k.startswith(prefix)
-                    ]
-                elif pattern.startswith("*"):
-                    suffix = pattern[1:]
-                    matching_keys = [
-                        k for k in self._cache.keys() if k.endswith(suffix)
-                    ]
-                else:
-                    matching_keys = [k for k in self._cache.keys() if pattern in k]
-
-                all_keys_to_delete.update(matching_keys)
+                all_keys_to_delete.update(self._match_keys(pattern))
 
             # 중복 제거된 키들을 한 번에 삭제
             for key in all_keys_to_delete:
@@ -199,13 +424,235 @@ class CacheManager(LoggerMixin):
 
         return total_deleted
 
-    def _is_expired(self, key: str) -> bool:
-        """캐시 항목이 만료되었는지 확인합니다."""
-        if key not in self._timestamps:
-            return True
+    def get_or_set(
+        self,
+        key: CacheKey,
+        loader: Callable[[], Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Union[Iterable[str], Callable[[], Iterable[str]]]] = None,
+        stale_ttl: float = 0,
+        negative_ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        캐시된 값을 반환하고, 없으면 loader()로 계산해 저장합니다.
+
+        같은 키를 동시에 요청하면 첫 호출자만 loader()를 실행하고 나머지는
+        그 결과(또는 예외)를 기다려 함께 받습니다. (single-flight)
+        stale_ttl로 저장된 항목은 만료 후 stale_ttl초 동안 이전 값을 즉시 반환하고,
+        한 스레드만 백그라운드에서 새 값을 계산합니다. (stale-while-revalidate)
+        None 결과는 negative_ttl 동안 저장해 같은 조회가 반복되지 않게 합니다.
+
+        Args:
+            key: 캐시 키
+            loader: 값을 계산하는 함수 (인자 없음)
+            ttl: TTL (초), None이면 기본값 사용
+            tags: 항목이 의존하는 데이터 태그 (또는 태그를 반환하는 함수,
+                적중 시에는 호출하지 않음)
+            stale_ttl: 만료 후 이전 값을 제공할 시간 (초, 0이면 사용 안 함)
+            negative_ttl: None 결과 TTL (초), None이면 기본값 사용 (0이면 저장 안 함)
+
+        Returns:
+            캐시된 값 또는 새로 계산한 값
+        """
+        if not self.enabled:
+            return loader()
+
+        refresh = False
+
+        with self._lock:
+            entry = self._cache.get(key)
+            now = time.monotonic()
+
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._cache.move_to_end(key)
+                    self._count_hit(entry)
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"Cache HIT: {key}")
+                    return entry.value
+
+                if entry.stale_until > now:
+                    # 만료 값 제공: 갱신 중이 아니면 백그라운드 갱신 시작
+                    self._stale_hits += 1
+                    if key not in self._inflight:
+                        tags = _resolve_tags(tags)
+                        flight = self._inflight[key] = _Flight()
+                        versions = self._current_versions(tags)
+                        refresh = True
+                    stale_value = entry.value
+                else:
+                    self._delete_internal(key)
+                    self._expirations += 1
+                    entry = None
+
+            if entry is None:
+                flight = self._inflight.get(key)
+                leader = flight is None
+                if leader:
+                    tags = _resolve_tags(tags)
+                    flight = self._inflight[key] = _Flight()
+                    versions = self._current_versions(tags)
+                    self._misses += 1
+                else:
+                    self._flight_waits += 1
+
+        if entry is not None:
+            if refresh:
+                Thread(
+                    target=self._refresh,
+                    args=(
+                        key,
+                        flight,
+                        loader,
+                        ttl,
+                        tags,
+                        versions,
+                        stale_ttl,
+                        negative_ttl,
+                    ),
+                    name="cache-refresh",
+                    daemon=True,
+                ).start()
+            self.logger.debug(f"Cache STALE HIT: {key}")
+            return stale_value
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        return self._run_flight(
+            key, flight, loader, ttl, tags, versions, stale_ttl, negative_ttl
+        )
+
+    def _run_flight(
+        self,
+        key: CacheKey,
+        flight: _Flight,
+        loader: Callable[[], Any],
+        ttl: Optional[int],
+        tags: Tuple[str, ...],
+        versions: Dict[Optional[str], int],
+        stale_ttl: float,
+        negative_ttl: Optional[float],
+    ) -> Any:
+        """loader()를 실행해 저장하고, 기다리던 호출자들에게 결과를 알립니다."""
+        try:
+            start_time = time.time()
+            flight.value = loader()
+            elapsed = time.time() - start_time
 
-        age = datetime.now() - self._timestamps[key]
-        return age.total_seconds() > self.default_ttl
+            if flight.value is not None:
+                self.set(
+                    key,
+                    flight.value,
+                    ttl,
+                    tags=tags,
+                    versions=versions,
+                    stale_ttl=stale_ttl,
+                )
+            else:
+                negative_ttl = (
+                    self.negative_ttl if negative_ttl is None else negative_ttl
+                )
+                if negative_ttl > 0:
+                    self.set(key, None, negative_ttl, tags=tags, versions=versions)
+            self.logger.debug(f"Cache MISS: {key} (computed in {elapsed:.3f}s)")
+            return flight.value
+
+        except BaseException as e:
+            flight.error = e
+            raise
+
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+            flight.done.set()
+
+    def _refresh(self, *args) -> None:
+        """백그라운드 갱신 (실패하면 기록만 하고 만료 값은 기간이 끝날 때까지 유지)"""
+        try:
+            self._run_flight(*args)
+        except Exception as e:
+            self.logger.error(f"Cache refresh failed: {args[0]}: {e}", exc_info=True)
+
+    def _current_versions(self, tags: Iterable[str]) -> Dict[Optional[str], int]:
+        """태그들의 현재 버전과 clear() 세대 (락 없음)"""
+        versions = {tag: self._tag_versions.get(tag, 0) for tag in tags}
+        versions[None] = self._tag_versions.get(None, 0)
+        return versions
+
+    def tag_versions(self, tags: Iterable[str]) -> Dict[Optional[str], int]:
+        """
+        태그들의 현재 버전을 반환합니다.
+
+        값을 계산하기 전에 받아 두었다가 set(versions=...)에 넘기면,
+        계산 중에 무효화된 태그가 있거나 clear()가 호출되었을 때
+        오래된 값이 저장되지 않습니다.
+        """
+        with self._lock:
+            return self._current_versions(tags)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        태그가 붙은 캐시 항목을 무효화합니다.
+
+        태그 버전을 올리고 태그→키 색인에 있는 항목만 삭제하므로,
+        비용은 캐시 전체 크기가 아니라 태그 수와 해당 항목 수에 비례합니다.
+
+        Args:
+            tags: 무효화할 태그 목록
+
+        Returns:
+            삭제된 항목 수
+
+        Examples:
+            >>> cache_manager.invalidate_tags(["etf:152100", "date:2024-01-02"])
+            3
+        """
+        if not self.enabled:
+            return 0
+
+        tags = list(tags)
+        deleted = 0
+
+        with self._lock:
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+                for key in self._tag_index.pop(tag, ()):
+                    entry = self._cache.pop(key, None)
+                    if entry is not None:
+                        self._forget(key, entry)
+                        deleted += 1
+
+            self._tag_invalidations += len(tags)
+
+        if deleted:
+            self.logger.info(
+                f"Cache TAG INVALIDATE: {deleted} items removed ({len(tags)} tags)"
+            )
+        return deleted
+
+    def _match_keys(self, pattern: str) -> List[CacheKey]:
+        """패턴과 일치하는 키 목록을 반환합니다. (튜플 키는 문자열로 바꿔 비교, 락 없음)"""
+        keys = [(key, key_to_str(key)) for key in self._cache.keys()]
+
+        # 와일드카드 패턴 처리
+        if pattern.endswith("*"):
+            prefix = pattern[:-1]
+            return [k for k, text in keys if text.startswith(prefix)]
+        elif pattern.startswith("*"):
+            suffix = pattern[1:]
+            return [k for k, text in keys if text.endswith(suffix)]
+        else:
+            return [k for k, text in keys if pattern in text]
+
+    def _is_expired(self, key: CacheKey) -> bool:
+        """캐시 항목이 만료되었는지 확인합니다. (항목별 만료 시각 기준)"""
+        entry = self._cache.get(key)
+        return entry is None or entry.expires_at <= time.monotonic()
 
     def cleanup_expired(self) -> int:
         """
@@ -218,10 +665,14 @@ class CacheManager(LoggerMixin):
             return 0
 
         with self._lock:
-            expired_keys = [key for key in self._cache.keys() if self._is_expired(key)]
+            now = time.monotonic()
+            expired_keys = [
+                key for key, entry in self._cache.items() if entry.stale_until <= now
+            ]
 
             for key in expired_keys:
                 self._delete_internal(key)
+            self._expirations += len(expired_keys)
 
             if expired_keys:
                 self.logger.info(
@@ -230,42 +681,88 @@ class CacheManager(LoggerMixin):
 
             return len(expired_keys)
 
+    def _ensure_sweeper(self) -> None:
+        """만료 정리 스레드를 (처음 저장할 때) 시작합니다."""
+        if not self.sweep_interval or self._sweeper is not None:
+            return
+
+        with self._lock:
+            if self._sweeper is not None:
+                return
+
+            self._stop_sweeper.clear()
+            self._sweeper = Thread(
+                target=self._sweep_loop, name="cache-sweeper", daemon=True
+            )
+            self._sweeper.start()
+
+    def _sweep_loop(self) -> None:
+        """sweep_interval마다 만료 항목을 정리합니다."""
+        while not self._stop_sweeper.wait(self.sweep_interval):
+            try:
+                self.cleanup_expired()
+            except Exception as e:
+                self.logger.error(f"Cache sweep failed: {e}", exc_info=True)
+
+    def stop_sweeper(self) -> None:
+        """만료 정리 스레드를 멈춥니다."""
+        self._stop_sweeper.set()
+        sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None:
+            sweeper.join(timeout=1)
+
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계를 반환합니다."""
         with self._lock:
             # 만료되지 않은 항목만 카운트
+            now = time.monotonic()
             valid_items = sum(
-                1 for key in self._cache.keys() if not self._is_expired(key)
+                1 for entry in self._cache.values() if entry.expires_at > now
+            )
+            negative_items = sum(
+                1 for entry in self._cache.values() if entry.value is None
             )
+            lookups = self._hits + self._negative_hits + self._stale_hits + self._misses
 
             return {
                 "enabled": self.enabled,
                 "total_items": len(self._cache),
                 "valid_items": valid_items,
                 "expired_items": len(self._cache) - valid_items,
+                "negative_items": negative_items,
                 "default_ttl": self.default_ttl,
+                "negative_ttl": self.negative_ttl,
+                "hits": self._hits,
+                "negative_hits": self._negative_hits,
+                "misses": self._misses,
+                "hit_rate": (
+                    round((lookups - self._misses) / lookups, 4) if lookups else 0.0
+                ),
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "total_bytes": self._total_bytes,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "tags": len(self._tag_index),
+                "tag_invalidations": self._tag_invalidations,
+                "in_flight": len(self._inflight),
+                "single_flight_waits": self._flight_waits,
+                "stale_hits": self._stale_hits,
                 "memory_usage_estimate": self._estimate_memory_usage(),
             }
 
     def _estimate_memory_usage(self) -> str:
-        """메모리 사용량 추정 (간단한 근사치)"""
-        try:
-            import sys
-
-            total_size = sum(
-                sys.getsizeof(k) + sys.getsizeof(v) for k, v in self._cache.items()
-            )
+        """메모리 사용량 추정 (저장 시 추정한 항목 크기의 합)"""
+        total_size = self._total_bytes
 
-            if total_size < 1024:
-                return f"{total_size} B"
-            elif total_size < 1024 * 1024:
-                return f"{total_size / 1024:.2f} KB"
-            else:
-                return f"{total_size / (1024 * 1024):.2f} MB"
-        except:
-            return "Unknown"
+        if total_size < 1024:
+            return f"{total_size} B"
+        elif total_size < 1024 * 1024:
+            return f"{total_size / 1024:.2f} KB"
+        else:
+            return f"{total_size / (1024 * 1024):.2f} MB"
 
-    def get_keys_by_pattern(self, pattern: str) -> List[str]:
+    def get_keys_by_pattern(self, pattern: str) -> List[CacheKey]:
         """
         패턴과 일치하는 모든 캐시 키를 반환합니다.
 
@@ -280,16 +777,9 @@ class CacheManager(LoggerMixin):
             ['etf:123', 'etf:456', 'etf:holdings:123:2024-01-01']
         """
         with self._lock:
-            if pattern.endswith("*"):
-                prefix = pattern[:-1]
-                return [k for k in self._cache.keys() if k.startswith(prefix)]
-            elif pattern.startswith("*"):
-                suffix = pattern[1:]
-                return [k for k in self._cache.keys() if k.endswith(suffix)]
-            else:
-                return [k for k in self._cache.keys() if pattern in k]
+            return self._match_keys(pattern)
 
-    def exists(self, key: str) -> bool:
+    def exists(self, key: CacheKey) -> bool:
         """
         캐시에 키가 존재하고 유효한지 확인합니다.
 
@@ -303,11 +793,9 @@ class CacheManager(LoggerMixin):
             return False
 
         with self._lock:
-            if key not in self._cache:
-                return False
             return not self._is_expired(key)
 
-    def get_ttl(self, key: str) -> Optional[int]:
+    def get_ttl(self, key: CacheKey) -> Optional[int]:
         """
         캐시 항목의 남은 TTL을 초 단위로 반환합니다.
 
@@ -317,16 +805,15 @@ class CacheManager(LoggerMixin):
         Returns:
             남은 TTL (초), 키가 없거나 만료되었으면 None
         """
-        if not self.enabled or key not in self._timestamps:
+        if not self.enabled:
             return None
 
         with self._lock:
-            if key not in self._timestamps:
+            entry = self._cache.get(key)
+            if entry is None:
                 return None
 
-            age = datetime.now() - self._timestamps[key]
-            remaining = self.default_ttl - age.total_seconds()
-
+            remaining = entry.expires_at - time.monotonic()
             return int(remaining) if remaining > 0 else None
 
 
@@ -334,74 +821,166 @@ class CacheManager(LoggerMixin):
 cache_manager = CacheManager()
 
 
-def cached(ttl: Optional[int] = None, key_prefix: str = ""):
+# 태그 지정: 고정 태그 목록 또는 함수 인자로 태그를 만드는 함수
+TagSpec = Union[Iterable[str], Callable[..., Iterable[str]]]
+
+
+def cached(
+    ttl: Optional[int] = None,
+    key_prefix: str = "",
+    tags: Optional[TagSpec] = None,
+    stale_ttl: float = 0,
+    negative_ttl: Optional[float] = None,
+):
     """
     함수 결과를 캐싱하는 데코레이터
 
     Args:
         ttl: TTL (초)
         key_prefix: 캐시 키 접두사
+        tags: 항목에 붙일 태그 (고정 목록, 또는 함수와 같은 인자를 받아
+            태그 목록을 반환하는 함수)
+        stale_ttl: 만료 후 이전 값을 반환하며 백그라운드에서 갱신할 시간 (초)
+        negative_ttl: None 결과 TTL (초), None이면 설정값 사용 (0이면 캐시 안 함)
+
+    동시에 같은 인자로 호출되면 함수는 한 번만 실행됩니다. (single-flight)
 
     Examples:
-        >>> @cached(ttl=300, key_prefix="etf")
+        >>> @cached(ttl=300, key_prefix="etf", tags=[cache_tags.ETF_LIST])
         >>> def get_etf_list():
         ...     return expensive_query()
+
+        >>> @cached(ttl=600, tags=lambda self, ticker: [cache_tags.etf_tag(ticker)])
+        >>> def get_available_dates(self, ticker):
+        ...     ...
     """
+    static_tags = None if tags is None or callable(tags) else tuple(tags)
 
     def decorator(func: Callable) -> Callable:
+        func_name = f"{func.__module__}.{func.__qualname__}"
+        # 메서드면 self는 키에서 제외 (같은 클래스의 인스턴스끼리 캐시 공유)
+        skip = 1 if _is_method(func) else 0
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             if not cache_manager.enabled:
                 return func(*args, **kwargs)
 
             # 캐시 키 생성
-            cache_key = _generate_cache_key(func, args, kwargs, key_prefix)
-
-            # 캐시 조회
-            cached_value = cache_manager.get(cache_key)
-            if cached_value is not None:
-                return cached_value
-
-            # 캐시 미스 - 함수 실행
-            start_time = time.time()
-            result = func(*args, **kwargs)
-            elapsed = time.time() - start_time
-
-            # 결과 캐싱
-            cache_manager.set(cache_key, result, ttl)
+            cache_key = (
+                key_prefix,
+                func_name,
+                _normalize_args(args[skip:]),
+                _normalize_kwargs(kwargs) if kwargs else (),
+            )
 
-            cache_manager.logger.debug(
-                f"Cache MISS: {cache_key} (computed in {elapsed:.3f}s)"
+            # 태그는 미스일 때만 계산
+            entry_tags = (
+                static_tags
+                if static_tags is not None
+                else ((lambda: tags(*args, **kwargs)) if tags is not None else ())
             )
 
-            return result
+            # 캐시 조회, 미스면 같은 키의 동시 호출과 합쳐 한 번만 실행
+            return cache_manager.get_or_set(
+                cache_key,
+                lambda: func(*args, **kwargs),
+                ttl,
+                tags=entry_tags,
+                stale_ttl=stale_ttl,
+                negative_ttl=negative_ttl,
+            )
 
         return wrapper
 
     return decorator
 
 
-def _generate_cache_key(func: Callable, args: tuple, kwargs: dict, prefix: str) -> str:
-    """캐시 키를 생성합니다."""
-    # 함수명
-    func_name = f"{func.__module__}.{func.__name__}"
+# 그대로 키에 쓸 수 있는 타입 (해시 가능하고 값으로 비교됨)
+_ATOMIC_KEY_TYPES = frozenset({str, int, float, bool, type(None), bytes})
 
-    # 인자를 문자열로 변환
-    args_str = "_".join(str(arg) for arg in args)
-    kwargs_str = "_".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
 
-    # 키 조합
-    parts = [prefix, func_name, args_str, kwargs_str]
-    key = ":".join(part for part in parts if part)
+def _resolve_tags(tags: Any) -> Tuple[str, ...]:
+    """태그 목록 (또는 태그를 반환하는 함수)을 튜플로 만듭니다."""
+    if callable(tags):
+        tags = tags()
+    return tuple(tags or ())
+
+
+def _is_method(func: Callable) -> bool:
+    """첫 번째 인자가 self인 함수(메서드)인지 확인합니다."""
+    try:
+        params = list(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        return False
+    return bool(params) and params[0] == "self"
+
+
+def _normalize_args(args: tuple) -> tuple:
+    """위치 인자를 키용 튜플로 정규화합니다. (흔한 원자 타입은 그대로)"""
+    for arg in args:
+        if type(arg) not in _ATOMIC_KEY_TYPES:
+            return tuple(map(_normalize_key_part, args))
+    return args
+
+
+def _normalize_kwargs(kwargs: dict) -> tuple:
+    """키워드 인자를 이름순 (이름, 값) 튜플로 정규화합니다."""
+    return tuple(
+        (name, _normalize_key_part(value)) for name, value in sorted(kwargs.items())
+    )
+
 
-    # 너무 긴 키는 해시로 변환
-    if len(key) > 200:
-        import hashlib
+def _normalize_key_part(value: Any) -> Any:
+    """
+    인자 하나를 해시 가능한 정규형으로 바꿉니다.
+
+    - datetime: 시간대가 있으면 UTC 기준 naive datetime으로 (같은 시각은 같은 키)
+    - date: 그날 0시 datetime으로 (date와 datetime 인자가 같은 키)
+    - list/tuple: 튜플로, set: 정렬된 튜플로, dict: 키 순 (키, 값) 튜플로
+    - 그 외 해시 가능한 값은 그대로, 불가능하면 repr
+    """
+    if type(value) in _ATOMIC_KEY_TYPES:
+        return value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize_key_part(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((_normalize_key_part(item) for item in value), key=repr))
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                ((k, _normalize_key_part(v)) for k, v in value.items()),
+                key=lambda item: repr(item[0]),
+            )
+        )
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
 
-        key_hash = hashlib.md5(key.encode()).hexdigest()
-        return f"{prefix}:{func_name}:{key_hash}"
 
-    return key
+def key_to_str(key: CacheKey) -> str:
+    """
+    캐시 키를 사람이 읽을 수 있는 문자열로 바꿉니다. (패턴 비교/로그용)
+
+    Examples:
+        >>> key_to_str(("etf:dates", "repo.get_available_dates", ("152100",), ()))
+        'etf:dates:repo.get_available_dates:152100'
+    """
+    if isinstance(key, str):
+        return key
+
+    prefix, func_name, args, kwargs = key
+    args_str = "_".join(str(arg) for arg in args)
+    kwargs_str = "_".join(f"{k}={v}" for k, v in kwargs)
+    return ":".join(part for part in (prefix, func_name, args_str, kwargs_str) if part)
 
 
 def invalidate_cache(pattern: str) -> int:
@@ -417,6 +996,19 @@ def invalidate_cache(pattern: str) -> int:
     return cache_manager.clear_pattern(pattern)
 
 
+def invalidate_tags(tags: Iterable[str]) -> int:
+    """
+    태그가 붙은 캐시를 무효화합니다.
+
+    Args:
+        tags: 태그 목록 (infrastructure.cache.cache_tags 참고)
+
+    Returns:
+        삭제된 항목 수
+    """
+    return cache_manager.invalidate_tags(tags)
+
+
 def invalidate_multiple_caches(patterns: List[str]) -> int:
     """
     여러 패턴의 캐시를 한 번에 무효화합니다.
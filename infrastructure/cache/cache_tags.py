@@ -0,0 +1,57 @@
+"""
+Cache Tags
+캐시 항목에 붙이는 태그 이름을 한 곳에서 정의합니다.
+
+캐시 항목은 자신이 의존하는 데이터(ETF, 종목, 날짜, ETF 목록)를 태그로 등록하고,
+저장/삭제 경로는 바뀐 데이터의 태그만 무효화합니다.
+"""
+
+from datetime import datetime
+from typing import Iterable, List, Union
+
+from shared.utils.date_utils import to_date_string
+
+# ETF 목록/ETF 정보 (ETF 추가/수정 시 무효화)
+ETF_LIST = "etf-list"
+
+# 종목 정보 전체 (종목 일괄 삭제 시 무효화)
+STOCK_LIST = "stock-list"
+
+# 보유 종목에서 파생된 모든 항목 (대상을 특정할 수 없는 일괄 삭제 시 무효화)
+HOLDINGS = "holdings"
+
+
+def etf_tag(ticker: str) -> str:
+    """특정 ETF에 의존하는 항목의 태그"""
+    return f"etf:{ticker}"
+
+
+def stock_tag(ticker: str) -> str:
+    """특정 종목에 의존하는 항목의 태그"""
+    return f"stock:{ticker}"
+
+
+def date_tag(date: Union[datetime, str]) -> str:
+    """특정 날짜의 보유 종목에 의존하는 항목의 태그"""
+    if isinstance(date, datetime):
+        date = to_date_string(date)
+    return f"date:{date}"
+
+
+def holdings_tags(
+    etf_tickers: Iterable[str],
+    stock_tickers: Iterable[str],
+    dates: Iterable[Union[datetime, str]],
+) -> List[str]:
+    """
+    보유 종목 행이 바뀌었을 때 무효화할 태그 목록을 반환합니다.
+
+    Args:
+        etf_tickers: 바뀐 행의 ETF 코드
+        stock_tickers: 바뀐 행의 종목 코드
+        dates: 바뀐 행의 날짜
+    """
+    tags = {etf_tag(t) for t in etf_tickers}
+    tags.update(stock_tag(t) for t in stock_tickers)
+    tags.update(date_tag(d) for d in dates)
+    return sorted(tags)
@@ -0,0 +1,197 @@
+"""
+Ticker Name Cache
+종목/ETF 코드 → 이름 조회 결과를 SQLite에 영구 저장하는 캐시입니다.
+"""
+
+import sqlite3
+import time
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from config.logging_config import LoggerMixin
+from config.settings import settings
+from shared.exceptions import DatabaseException
+
+from infrastructure.database.connection import DatabaseConnection
+
+
+class TickerNameCache(LoggerMixin):
+    """
+    티커 이름 캐시
+
+    PyKRX 이름 조회 API 호출을 줄이기 위해 조회 결과를
+    cache_ticker_names 테이블에 저장하고 메모리에 적재해 사용합니다.
+    처음 사용할 때 data_stocks / data_etfs 테이블의 이름으로 채워지므로
+    이미 알고 있는 티커는 API를 호출하지 않습니다.
+    (채운 시각을 저장 시각으로 기록하므로 오래된 data 테이블 행도 새 항목으로 취급)
+
+    갱신 정책:
+        저장된 지 ttl_days가 지난 항목은 만료된 것으로 보고 API로 다시 조회합니다.
+        재조회에 실패하면 만료된 이름이라도 그대로 사용합니다 (get_stale).
+
+    Args:
+        db_connection: 데이터베이스 연결
+        ttl_days: 이름 갱신 주기 (일), None이면 설정값 사용
+
+    Examples:
+        >>> cache = TickerNameCache(db_connection)
+        >>> cache.get(TickerNameCache.KIND_STOCK, "005930")
+        '삼성전자'
+    """
+
+    KIND_STOCK = "stock"
+    KIND_ETF = "etf"
+
+    def __init__(self, db_connection: DatabaseConnection, ttl_days: int = None):
+        self.db_conn = db_connection
+        self.ttl_seconds = (ttl_days or settings.NAME_CACHE_TTL_DAYS) * 24 * 60 * 60
+
+        # (kind, ticker) -> (name, fetched_at)
+        self._names: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._pending: Dict[Tuple[str, str], str] = {}
+        self._loaded = False
+        self._lock = Lock()
+
+    def get(self, kind: str, ticker: str) -> Optional[str]:
+        """
+        만료되지 않은 캐시 이름을 반환합니다.
+
+        Args:
+            kind: 티커 종류 (KIND_STOCK, KIND_ETF)
+            ticker: 종목/ETF 코드
+
+        Returns:
+            캐시된 이름, 없거나 만료되었으면 None
+        """
+        self._ensure_loaded()
+
+        entry = self._names.get((kind, ticker))
+        if entry is None:
+            return None
+
+        name, fetched_at = entry
+        if time.time() - fetched_at > self.ttl_seconds:
+            return None
+
+        return name
+
+    def get_stale(self, kind: str, ticker: str) -> Optional[str]:
+        """만료 여부와 관계없이 캐시된 이름을 반환합니다."""
+        self._ensure_loaded()
+
+        entry = self._names.get((kind, ticker))
+        return entry[0] if entry else None
+
+    def put(self, kind: str, ticker: str, name: str) -> None:
+        """
+        이름을 캐시에 저장합니다.
+
+        메모리에는 즉시 반영되고, DB에는 flush() 호출 시 일괄 저장됩니다.
+        """
+        self._ensure_loaded()
+
+        with self._lock:
+            self._names[(kind, ticker)] = (name, time.time())
+            self._pending[(kind, ticker)] = name
+
+    def flush(self) -> int:
+        """
+        아직 저장되지 않은 이름들을 DB에 일괄 저장합니다.
+
+        Returns:
+            저장된 항목 수
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending = self._pending
+            self._pending = {}
+
+        data = [(ticker, kind, name) for (kind, ticker), name in pending.items()]
+
+        try:
+            query = """
+                INSERT OR REPLACE INTO cache_ticker_names (ticker, kind, name, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """
+
+            conn = self.db_conn.get_connection()
+            conn.executemany(query, data)
+            conn.commit()
+
+            self.logger.debug(f"Flushed {len(data)} ticker names")
+            return len(data)
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to flush ticker names: {e}", exc_info=True)
+            raise DatabaseException("flush_ticker_names", str(e))
+
+    def size(self) -> int:
+        """캐시된 항목 수를 반환합니다."""
+        self._ensure_loaded()
+        return len(self._names)
+
+    def _ensure_loaded(self) -> None:
+        """처음 사용할 때 DB에서 캐시를 적재합니다."""
+        if self._loaded:
+            return
+
+        with self._lock:
+            if self._loaded:
+                return
+
+            self._seed_from_data_tables()
+            self._names = self._load_all()
+            self._loaded = True
+
+            self.logger.info(f"Ticker name cache loaded: {len(self._names)} entries")
+
+    def _seed_from_data_tables(self) -> None:
+        """
+        data_stocks / data_etfs에 있는 이름으로 캐시 테이블을 채웁니다.
+
+        ✅ 수정: data 테이블의 updated_at을 복사하면 업그레이드 직후 대부분이
+        이미 만료된 상태가 되므로, 채우는 시각(CURRENT_TIMESTAMP)으로 기록합니다.
+        """
+        try:
+            conn = self.db_conn.get_connection()
+
+            with conn:
+                conn.execute(f"""
+                    INSERT OR IGNORE INTO cache_ticker_names (ticker, kind, name, updated_at)
+                    SELECT ticker, '{self.KIND_STOCK}', name, CURRENT_TIMESTAMP
+                    FROM data_stocks
+                """)
+                conn.execute(f"""
+                    INSERT OR IGNORE INTO cache_ticker_names (ticker, kind, name, updated_at)
+                    SELECT ticker, '{self.KIND_ETF}', name, CURRENT_TIMESTAMP
+                    FROM data_etfs
+                """)
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to seed ticker names: {e}", exc_info=True)
+            raise DatabaseException("seed_ticker_names", str(e))
+
+    def _load_all(self) -> Dict[Tuple[str, str], Tuple[str, float]]:
+        """캐시 테이블 전체를 조회합니다."""
+        try:
+            query = """
+                SELECT ticker, kind, name,
+                       CAST(strftime('%s', updated_at) AS INTEGER) AS fetched_at
+                FROM cache_ticker_names
+            """
+
+            cursor = self.db_conn.execute_query(query)
+            rows: List[sqlite3.Row] = cursor.fetchall()
+
+            return {
+                (row["kind"], row["ticker"]): (
+                    row["name"],
+                    float(row["fetched_at"] or 0),
+                )
+                for row in rows
+            }
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to load ticker names: {e}", exc_info=True)
+            raise DatabaseException("load_ticker_names", str(e))
@@ -0,0 +1,229 @@
+"""
+Trading Calendar Cache
+거래일 정보를 SQLite에 저장하여 재사용하는 거래일 캘린더 구현체입니다.
+"""
+
+import sqlite3
+from datetime import date as date_type
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, List, Set
+
+from config.logging_config import LoggerMixin
+from config.settings import settings
+from domain.services.trading_calendar import TradingCalendar
+from shared.exceptions import DatabaseException
+from shared.utils.date_utils import get_date_range
+
+from infrastructure.adapters.market_data_adapter import MarketDataAdapter
+from infrastructure.database.connection import DatabaseConnection
+
+# 조회 구간 앞에 덧붙이는 날 수 (연휴만 있는 구간도 거래일이 한 번은 포함되도록)
+LOOKBACK_DAYS = 14
+
+
+class CachedTradingCalendar(TradingCalendar, LoggerMixin):
+    """
+    캐시 기반 거래일 캘린더
+
+    아직 모르는 평일이 있으면 해당 구간 전체의 거래일을 어댑터에서
+    한 번에 조회하고, 결과를 cache_trading_days 테이블에 저장합니다.
+    이후 조회는 메모리에서 바로 응답합니다.
+
+    갱신 정책:
+        - 주말은 조회 없이 휴장일로 판단합니다.
+        - 오늘 이후 날짜가 휴장일로 나오면 아직 시세가 없는 것일 수 있으므로
+          저장하지 않고 다음 조회 때 다시 확인합니다.
+        - 조회에 실패하면 평일을 거래일로 간주합니다 (저장하지 않음).
+          지난 평일이 있는데 거래일이 하나도 없는 빈 응답도 실패로 봅니다.
+        - 저장된 휴장일은 TRADING_CALENDAR_CLOSED_TTL_DAYS가 지나면 다시 확인하며,
+          refresh()로 특정 기간을 즉시 다시 확인할 수 있습니다.
+
+    Args:
+        db_connection: 데이터베이스 연결
+        market_adapter: 시장 데이터 어댑터
+
+    Examples:
+        >>> calendar = CachedTradingCalendar(db_connection, market_adapter)
+        >>> calendar.business_days(datetime(2024, 2, 8), datetime(2024, 2, 13))
+        [datetime(2024, 2, 8), datetime(2024, 2, 13)]  # 설 연휴 제외
+    """
+
+    def __init__(
+        self, db_connection: DatabaseConnection, market_adapter: MarketDataAdapter
+    ):
+        self.db_conn = db_connection
+        self.market_adapter = market_adapter
+
+        # date -> 거래일 여부
+        self._days: Dict[date_type, bool] = {}
+        self._loaded = False
+        self._lock = Lock()
+
+    def business_days(self, start_date: datetime, end_date: datetime) -> List[datetime]:
+        """
+        기간 내의 거래일 리스트를 반환합니다.
+
+        Args:
+            start_date: 시작일
+            end_date: 종료일
+
+        Returns:
+            거래일 리스트 (시작일의 시각을 유지)
+        """
+        candidates = [
+            d for d in get_date_range(start_date, end_date) if d.weekday() < 5
+        ]
+        if not candidates:
+            return []
+
+        self._ensure_loaded()
+
+        missing = [d for d in candidates if d.date() not in self._days]
+        closed = self._resolve(missing) if missing else set()
+
+        return [
+            d
+            for d in candidates
+            if d.date() not in closed and self._days.get(d.date(), True)
+        ]
+
+    def refresh(self, start_date: datetime, end_date: datetime) -> List[datetime]:
+        """
+        기간의 거래일 정보를 버리고 어댑터에서 다시 확인합니다.
+
+        Args:
+            start_date: 시작일
+            end_date: 종료일
+
+        Returns:
+            다시 확인한 거래일 리스트
+        """
+        self._ensure_loaded()
+
+        with self._lock:
+            for d in get_date_range(start_date, end_date):
+                self._days.pop(d.date(), None)
+
+        return self.business_days(start_date, end_date)
+
+    def size(self) -> int:
+        """캐시된 날짜 수를 반환합니다."""
+        self._ensure_loaded()
+        return len(self._days)
+
+    def _resolve(self, missing: List[datetime]) -> Set[date_type]:
+        """
+        모르는 평일들의 거래일 여부를 한 번의 조회로 확정합니다.
+
+        Returns:
+            이번 조회에서 휴장으로 나왔지만 저장을 보류한 날짜 집합
+        """
+        with self._lock:
+            missing = [d for d in missing if d.date() not in self._days]
+            if not missing:
+                return set()
+
+            try:
+                # 앞쪽을 넓혀 조회하므로 정상 응답에는 항상 거래일이 있음
+                trading_days = self.market_adapter.get_trading_days(
+                    missing[0] - timedelta(days=LOOKBACK_DAYS), missing[-1]
+                )
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to load trading days, falling back to weekdays: {e}"
+                )
+                return set()
+
+            today = datetime.now().date()
+            if not trading_days and any(d.date() < today for d in missing):
+                # 지난 평일이 있는 2주 이상 구간이 모두 휴장일 수는 없으므로
+                # 빈 응답은 일시적 장애로 처리 (저장하지 않음)
+                self.logger.warning(
+                    f"Empty trading days for {missing[0].date()} ~ "
+                    f"{missing[-1].date()}, falling back to weekdays"
+                )
+                return set()
+
+            trading = {d.date() for d in trading_days}
+            resolved: Dict[date_type, bool] = {}
+            deferred: Set[date_type] = set()
+
+            for d in missing:
+                day = d.date()
+                is_trading = day in trading
+
+                # 오늘 이후의 휴장 판정은 시세 미반영일 수 있으므로 보류
+                if not is_trading and day >= today:
+                    deferred.add(day)
+                    continue
+
+                resolved[day] = is_trading
+
+            self._days.update(resolved)
+            self._save(resolved)
+
+            self.logger.debug(
+                f"Resolved {len(resolved)} calendar days "
+                f"({missing[0].date()} ~ {missing[-1].date()})"
+            )
+            return deferred
+
+    def _ensure_loaded(self) -> None:
+        """처음 사용할 때 DB에서 캐시를 적재합니다."""
+        if self._loaded:
+            return
+
+        with self._lock:
+            if self._loaded:
+                return
+
+            self._days = self._load_all()
+            self._loaded = True
+
+            self.logger.info(f"Trading calendar loaded: {len(self._days)} days")
+
+    def _load_all(self) -> Dict[date_type, bool]:
+        """캐시 테이블을 조회합니다. (재확인 주기가 지난 휴장일은 제외)"""
+        try:
+            query = """
+                SELECT date, is_trading FROM cache_trading_days
+                WHERE is_trading = 1 OR updated_at >= datetime('now', ?)
+            """
+
+            cursor = self.db_conn.execute_query(
+                query, (f"-{settings.TRADING_CALENDAR_CLOSED_TTL_DAYS} days",)
+            )
+            rows: List[sqlite3.Row] = cursor.fetchall()
+
+            return {
+                date_type.fromisoformat(row["date"]): bool(row["is_trading"])
+                for row in rows
+            }
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to load trading days: {e}", exc_info=True)
+            raise DatabaseException("load_trading_days", str(e))
+
+    def _save(self, resolved: Dict[date_type, bool]) -> None:
+        """확정된 거래일 정보를 저장합니다."""
+        if not resolved:
+            return
+
+        data = [
+            (day.isoformat(), int(is_trading)) for day, is_trading in resolved.items()
+        ]
+
+        try:
+            query = """
+                INSERT OR REPLACE INTO cache_trading_days (date, is_trading, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+            """
+
+            conn = self.db_conn.get_connection()
+            conn.executemany(query, data)
+            conn.commit()
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to save trading days: {e}", exc_info=True)
+            raise DatabaseException("save_trading_days", str(e))
@@ -0,0 +1,261 @@
+"""
+Daily Ingestion Writer
+하루치 수집 데이터를 하나의 트랜잭션으로 저장하는 일괄 저장기입니다.
+"""
+
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config.logging_config import LoggerMixin
+from domain.entities.etf import ETF
+from domain.entities.holding import Holding
+from domain.entities.job import CheckpointStatus
+from shared.exceptions import DatabaseException
+from shared.utils.date_utils import to_date_string
+
+from infrastructure.cache import cache_tags, invalidate_tags
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.repositories.sqlite_holding_diff_repository import (
+    SQLiteHoldingDiffRepository,
+)
+from infrastructure.database.repositories.sqlite_statistics_repository import (
+    SQLiteStatisticsRepository,
+)
+
+
+@dataclass
+class DailyIngestionBatch:
+    """
+    하루치 저장 대기 데이터
+
+    수집 중에는 메모리에 행만 쌓고, DailyIngestionWriter.write()에서
+    한 번에 저장합니다. 보유 종목의 종목 정보(data_stocks)도 함께 모읍니다.
+    job_id가 있으면 (날짜, ETF) 체크포인트도 같은 트랜잭션으로 저장됩니다.
+
+    Attributes:
+        date: 기준일
+        job_id: 체크포인트를 기록할 작업 ID (없으면 기록하지 않음)
+        etfs: ETF 코드 → ETF명
+        stocks: 종목 코드 → 종목명
+        holdings: data_etf_holdings 삽입용 행
+        checkpoints: ETF 코드 → 체크포인트 상태
+    """
+
+    date: datetime
+    job_id: Optional[str] = None
+    etfs: Dict[str, str] = field(default_factory=dict)
+    stocks: Dict[str, str] = field(default_factory=dict)
+    holdings: List[Tuple[str, str, str, float, float]] = field(default_factory=list)
+    checkpoints: Dict[str, str] = field(default_factory=dict)
+
+    def add_etfs(self, etfs: Iterable[ETF]) -> None:
+        """ETF들을 추가합니다."""
+        for etf in etfs:
+            self.etfs[etf.ticker] = etf.name
+
+    def add_holdings(self, holdings: Iterable[Holding]) -> None:
+        """보유 종목들과 해당 종목 정보를 추가합니다."""
+        date_str = to_date_string(self.date)
+
+        for h in holdings:
+            self.holdings.append(
+                (h.etf_ticker, h.stock_ticker, date_str, h.weight, h.amount)
+            )
+            if h.stock_ticker not in self.stocks:
+                self.stocks[h.stock_ticker] = h.stock_name or h.stock_ticker
+
+    def add_checkpoint(self, etf_ticker: str, status: str) -> None:
+        """ETF 처리 완료 체크포인트를 추가합니다."""
+        self.checkpoints[etf_ticker] = status
+
+    def mark_day_complete(self) -> None:
+        """날짜 전체 처리 완료 체크포인트를 추가합니다."""
+        self.checkpoints[CheckpointStatus.DAY_MARKER] = CheckpointStatus.DONE
+
+    def holding_etf_tickers(self) -> List[str]:
+        """보유 종목이 있는 ETF 코드 목록을 반환합니다."""
+        return sorted({row[0] for row in self.holdings})
+
+    def is_empty(self) -> bool:
+        """저장할 데이터가 없는지 확인합니다."""
+        return not (self.etfs or self.stocks or self.holdings or self.checkpoints)
+
+
+@dataclass(frozen=True)
+class IngestionResult:
+    """일괄 저장 결과 (새로 삽입된 행 수)"""
+
+    etfs_inserted: int = 0
+    stocks_inserted: int = 0
+    holdings_inserted: int = 0
+    checkpoints_saved: int = 0
+    cache_entries_invalidated: int = 0
+
+
+class DailyIngestionWriter(LoggerMixin):
+    """
+    일 단위 일괄 저장기
+
+    ETF, 종목, 보유 종목을 테이블마다 executemany 한 번으로 저장하고,
+    날짜별 통계 집계와 ETF별 이전 거래일 대비 비교 결과까지 갱신한 뒤
+    전체를 하나의 트랜잭션으로 커밋합니다.
+    실패하면 그날 데이터는 모두 롤백됩니다. 캐시 무효화도 저장이 끝난 뒤 한 번만 수행합니다.
+
+    Args:
+        db_connection: 데이터베이스 연결
+
+    Examples:
+        >>> batch = writer.new_batch(date)
+        >>> batch.add_etfs(etfs)
+        >>> batch.add_holdings(holdings)
+        >>> writer.write(batch)
+    """
+
+    def __init__(self, db_connection: DatabaseConnection):
+        self.db_conn = db_connection
+
+    def new_batch(
+        self, date: datetime, job_id: Optional[str] = None
+    ) -> DailyIngestionBatch:
+        """새 일 단위 배치를 생성합니다."""
+        return DailyIngestionBatch(date=date, job_id=job_id)
+
+    def write(self, batch: DailyIngestionBatch) -> IngestionResult:
+        """
+        배치를 하나의 트랜잭션으로 저장합니다.
+
+        Args:
+            batch: 저장할 배치
+
+        Returns:
+            IngestionResult: 저장 결과
+
+        Raises:
+            DatabaseException: 저장 실패 시 (롤백됨)
+            Exception: 집계/비교 계산 중 오류 (롤백 후 그대로 전달)
+        """
+        if batch.is_empty():
+            return IngestionResult()
+
+        try:
+            conn = self.db_conn.get_connection()
+            self.db_conn.begin_transaction()
+
+            # 신규 ETF만 추가 (기존 ETF는 무시)
+            etfs_inserted = self._execute_many(
+                conn,
+                "INSERT OR IGNORE INTO data_etfs (ticker, name) VALUES (?, ?)",
+                list(batch.etfs.items()),
+            )
+
+            # 보유 종목의 외래 키를 위해 종목 정보를 먼저 저장
+            stocks_inserted = self._execute_many(
+                conn,
+                "INSERT OR IGNORE INTO data_stocks (ticker, name) VALUES (?, ?)",
+                list(batch.stocks.items()),
+            )
+
+            holdings_inserted = self._execute_many(
+                conn,
+                """
+                INSERT OR IGNORE INTO data_etf_holdings
+                (etf_ticker, stock_ticker, date, weight, amount)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                batch.holdings,
+            )
+
+            # ✅ 날짜별 통계 집계와 이전 거래일 대비 비교 결과 갱신 (조회 시 재계산 불필요)
+            if holdings_inserted:
+                SQLiteStatisticsRepository.write_aggregates(
+                    conn, to_date_string(batch.date)
+                )
+                SQLiteHoldingDiffRepository.write_diffs(
+                    conn, to_date_string(batch.date), batch.holding_etf_tickers()
+                )
+
+            # ✅ 작업 체크포인트 (데이터와 같은 트랜잭션)
+            checkpoints_saved = 0
+            if batch.job_id:
+                date_str = to_date_string(batch.date)
+                checkpoints_saved = self._execute_many(
+                    conn,
+                    """
+                    INSERT OR REPLACE INTO job_checkpoints
+                    (job_id, date, etf_ticker, status, updated_at)
+                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    """,
+                    [
+                        (batch.job_id, date_str, ticker, status)
+                        for ticker, status in batch.checkpoints.items()
+                    ],
+                )
+
+            conn.commit()
+
+        except (sqlite3.Error, DatabaseException) as e:
+            self.db_conn.rollback()
+            self.logger.error(
+                f"Failed to write batch for {to_date_string(batch.date)}: {e}",
+                exc_info=True,
+            )
+            raise DatabaseException("write_daily_batch", str(e))
+
+        except Exception as e:
+            # ✅ 수정: 집계/비교 계산 중 Python 예외도 롤백해 트랜잭션이 열린 채 남지 않게 함
+            self.db_conn.rollback()
+            self.logger.error(
+                f"Failed to write batch for {to_date_string(batch.date)}: {e}",
+                exc_info=True,
+            )
+            raise
+
+        invalidated = self._invalidate_cache(batch, etfs_inserted)
+
+        self.logger.info(
+            f"Saved {to_date_string(batch.date)}: "
+            f"{etfs_inserted} new ETFs, {stocks_inserted} new stocks, "
+            f"{holdings_inserted} holdings (invalidated {invalidated} cache entries)"
+        )
+
+        return IngestionResult(
+            etfs_inserted=etfs_inserted,
+            stocks_inserted=stocks_inserted,
+            holdings_inserted=holdings_inserted,
+            checkpoints_saved=checkpoints_saved,
+            cache_entries_invalidated=invalidated,
+        )
+
+    def _execute_many(
+        self, conn: sqlite3.Connection, query: str, rows: List[tuple]
+    ) -> int:
+        """executemany를 실행하고 삽입된 행 수를 반환합니다."""
+        if not rows:
+            return 0
+
+        cursor = conn.executemany(query, rows)
+        return max(cursor.rowcount, 0)
+
+    def _invalidate_cache(self, batch: DailyIngestionBatch, etfs_inserted: int) -> int:
+        """
+        배치 저장 후 관련 캐시를 한 번에 무효화합니다.
+
+        ✅ 개선: 키 패턴 전체 검색 대신 바뀐 데이터의 태그만 무효화합니다.
+        (ETF 목록, 보유 종목이 바뀐 ETF/종목, 기준일)
+        """
+        tags = []
+        if etfs_inserted:
+            tags.append(cache_tags.ETF_LIST)
+        if batch.holdings:
+            tags.extend(
+                cache_tags.holdings_tags(
+                    batch.holding_etf_tickers(), batch.stocks, [batch.date]
+                )
+            )
+
+        if not tags:
+            return 0
+
+        return invalidate_tags(tags)
@@ -9,6 +9,12 @@ from config.logging_config import LoggerMixin
 from shared.exceptions import DatabaseException
 
 from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.repositories.sqlite_holding_diff_repository import (
+    SQLiteHoldingDiffRepository,
+)
+from infrastructure.database.repositories.sqlite_statistics_repository import (
+    SQLiteStatisticsRepository,
+)
 
 
 class DatabaseMigrations(LoggerMixin):
@@ -33,6 +39,15 @@ class DatabaseMigrations(LoggerMixin):
                 # 데이터 테이블
                 self._create_data_tables(conn)
 
+                # 캐시 테이블
+                self._create_cache_tables(conn)
+
+                # ✅ 작업(Job) 테이블
+                self._create_job_tables(conn)
+
+                # ✅ 사전 집계 테이블
+                self._create_aggregate_tables(conn)
+
                 # ✅ 인덱스 생성 (성능 최적화)
                 self._create_indexes(conn)
 
@@ -104,6 +119,158 @@ class DatabaseMigrations(LoggerMixin):
 
         self.logger.debug("Data tables created")
 
+    def _create_job_tables(self, conn: sqlite3.Connection) -> None:
+        """장시간 실행 작업과 체크포인트 테이블을 생성합니다."""
+        # 작업 실행 이력 테이블
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_runs (
+                id TEXT PRIMARY KEY,
+                job_type TEXT NOT NULL,
+                status TEXT NOT NULL,
+                stage TEXT NOT NULL DEFAULT '',
+                params TEXT NOT NULL DEFAULT '{}',
+                total_units INTEGER NOT NULL DEFAULT 0,
+                done_units INTEGER NOT NULL DEFAULT 0,
+                etfs_done INTEGER NOT NULL DEFAULT 0,
+                rows_written INTEGER NOT NULL DEFAULT 0,
+                message TEXT NOT NULL DEFAULT '',
+                error TEXT NOT NULL DEFAULT '',
+                started_units INTEGER NOT NULL DEFAULT 0,
+                started_at TEXT,
+                finished_at TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_job_runs_type_created
+            ON job_runs (job_type, created_at DESC)
+        """)
+
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_job_runs_status
+            ON job_runs (status)
+        """)
+
+        # 작업 체크포인트 테이블 (날짜, ETF 단위)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_checkpoints (
+                job_id TEXT NOT NULL,
+                date TEXT NOT NULL,
+                etf_ticker TEXT NOT NULL,
+                status TEXT NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (job_id, date, etf_ticker),
+                FOREIGN KEY (job_id) REFERENCES job_runs (id) ON DELETE CASCADE
+            )
+        """)
+
+        self.logger.debug("Job tables created")
+
+    def _create_aggregate_tables(self, conn: sqlite3.Connection) -> None:
+        """수집 시점에 갱신되는 날짜별 통계 집계 테이블을 생성합니다."""
+        # (날짜, 종목)별 집계
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS agg_stock_daily (
+                date TEXT NOT NULL,
+                stock_ticker TEXT NOT NULL,
+                etf_count INTEGER NOT NULL,
+                etf_tickers TEXT NOT NULL,
+                total_amount REAL NOT NULL DEFAULT 0,
+                avg_weight REAL NOT NULL,
+                min_weight REAL NOT NULL,
+                max_weight REAL NOT NULL,
+                PRIMARY KEY (date, stock_ticker)
+            )
+        """)
+
+        # 중복 종목 통계 (ETF 수, 총 평가금액 순)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_agg_stock_date_count
+            ON agg_stock_daily (date, etf_count DESC, total_amount DESC)
+        """)
+
+        # 평가금액 순위
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_agg_stock_date_amount
+            ON agg_stock_daily (date, total_amount DESC)
+        """)
+
+        # 날짜별 요약 및 비중 분포
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS agg_daily_summary (
+                date TEXT PRIMARY KEY,
+                etf_count INTEGER NOT NULL DEFAULT 0,
+                stock_count INTEGER NOT NULL DEFAULT 0,
+                holding_count INTEGER NOT NULL DEFAULT 0,
+                weight_under_1 INTEGER NOT NULL DEFAULT 0,
+                weight_1_to_3 INTEGER NOT NULL DEFAULT 0,
+                weight_3_to_5 INTEGER NOT NULL DEFAULT 0,
+                weight_5_to_10 INTEGER NOT NULL DEFAULT 0,
+                weight_over_10 INTEGER NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # ETF별 연속 거래일 보유 종목 비교 결과
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS agg_holding_diffs (
+                etf_ticker TEXT NOT NULL,
+                date TEXT NOT NULL,
+                prev_date TEXT NOT NULL,
+                stock_ticker TEXT NOT NULL,
+                status TEXT NOT NULL,
+                prev_weight REAL NOT NULL DEFAULT 0,
+                curr_weight REAL NOT NULL DEFAULT 0,
+                change REAL NOT NULL DEFAULT 0,
+                curr_amount REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (etf_ticker, date, stock_ticker)
+            )
+        """)
+
+        # 기본 비교 조회 (현재 비중 순)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_agg_diffs_etf_date_weight
+            ON agg_holding_diffs (etf_ticker, date, prev_date, curr_weight DESC)
+        """)
+
+        # 날짜 단위 삭제 (이전 날짜로 참조하는 결과 포함)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_agg_diffs_date
+            ON agg_holding_diffs (date)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_agg_diffs_prev_date
+            ON agg_holding_diffs (prev_date)
+        """)
+
+        self.logger.debug("Aggregate tables created")
+
+    def _create_cache_tables(self, conn: sqlite3.Connection) -> None:
+        """캐시 관련 테이블을 생성합니다."""
+        # 티커 이름 캐시 테이블 (PyKRX 이름 조회 결과)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_ticker_names (
+                ticker TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                name TEXT NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (ticker, kind)
+            )
+        """)
+
+        # 거래일 캐시 테이블 (기준 종목 시세 조회 결과)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_trading_days (
+                date TEXT PRIMARY KEY,
+                is_trading INTEGER NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        self.logger.debug("Cache tables created")
+
     def _create_indexes(self, conn: sqlite3.Connection) -> None:
         """
         성능 향상을 위한 인덱스를 생성합니다.
@@ -291,6 +458,10 @@ class DatabaseMigrations(LoggerMixin):
             # ✅ NEW: 최적화 인덱스 추가
             self.migrate_add_optimized_indexes()
 
+            # ✅ 누락된 사전 계산 결과 채우기 (조회 경로는 쓰지 않음)
+            self.migrate_backfill_aggregates()
+            self.migrate_backfill_holding_diffs()
+
             self.logger.info("All migrations completed successfully")
 
         except Exception as e:
@@ -314,6 +485,13 @@ class DatabaseMigrations(LoggerMixin):
 
                 # 모든 테이블 삭제
                 tables = [
+                    "agg_stock_daily",
+                    "agg_daily_summary",
+                    "agg_holding_diffs",
+                    "job_checkpoints",
+                    "job_runs",
+                    "cache_ticker_names",
+                    "cache_trading_days",
                     "data_etf_holdings",
                     "data_etfs",
                     "data_stocks",
@@ -518,3 +696,47 @@ class DatabaseMigrations(LoggerMixin):
         except sqlite3.Error as e:
             self.logger.error(f"Failed to add optimized indexes: {e}", exc_info=True)
             raise DatabaseException("migrate_add_optimized_indexes", str(e))
+
+    def migrate_backfill_aggregates(self) -> None:
+        """
+        ✅ 날짜별 통계 집계 백필
+
+        집계 도입 이전에 수집한 날짜나 삭제 경로에서 지운 집계를
+        다시 계산합니다. (이미 채워져 있으면 조회 한 번으로 끝남)
+        """
+        try:
+            conn = self.db_conn.get_connection()
+
+            with conn:
+                dates = SQLiteStatisticsRepository.write_missing_aggregates(conn)
+
+            if dates:
+                self.logger.info(f"Backfilled aggregates for {dates} dates")
+            else:
+                self.logger.debug("Aggregates are up to date")
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to backfill aggregates: {e}", exc_info=True)
+            raise DatabaseException("migrate_backfill_aggregates", str(e))
+
+    def migrate_backfill_holding_diffs(self) -> None:
+        """
+        ✅ 연속 거래일 비교 결과 백필
+
+        비교 테이블 도입 이전에 수집한 날짜나 삭제 경로에서 지운 결과를
+        다시 계산합니다. (이미 채워져 있으면 조회 한 번으로 끝남)
+        """
+        try:
+            conn = self.db_conn.get_connection()
+
+            with conn:
+                written = SQLiteHoldingDiffRepository.write_missing_diffs(conn)
+
+            if written:
+                self.logger.info(f"Backfilled {written} holding diff rows")
+            else:
+                self.logger.debug("Holding diffs are up to date")
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to backfill holding diffs: {e}", exc_info=True)
+            raise DatabaseException("migrate_backfill_holding_diffs", str(e))
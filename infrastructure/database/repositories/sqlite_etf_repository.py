@@ -5,17 +5,28 @@ ETF 리포지토리의 SQLite 구현체입니다.
 
 import sqlite3
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
 from config.logging_config import LoggerMixin
 from domain.entities.etf import ETF
-from domain.entities.holding import Holding
-from domain.repositories.etf_repository import ETFRepository
+from domain.entities.holding import Holding, HoldingRow
+from domain.repositories.etf_repository import ETFRepository, HoldingList
+from domain.value_objects.holdings_snapshot import HoldingsSnapshot
 from shared.exceptions import DatabaseException
-from shared.utils.date_utils import from_date_string, to_date_string
+from shared.utils.date_utils import (
+    from_date_string,
+    parse_date_cached,
+    to_date_string,
+)
 
-from infrastructure.cache import cached, invalidate_cache
+from infrastructure.cache import cache_tags, cached, invalidate_tags
 from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.repositories.sqlite_holding_diff_repository import (
+    SQLiteHoldingDiffRepository,
+)
+from infrastructure.database.repositories.sqlite_statistics_repository import (
+    SQLiteStatisticsRepository,
+)
 
 
 class SQLiteETFRepository(ETFRepository, LoggerMixin):
@@ -48,8 +59,8 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             conn.execute(query, (entity.ticker, entity.name))
             conn.commit()
 
-            # ✅ 캐시 무효화
-            invalidate_cache("etf:*")
+            # ✅ 캐시 무효화 (ETF 목록/정보 태그)
+            invalidate_tags([cache_tags.ETF_LIST])
 
             self.logger.debug(f"Saved ETF: {entity.ticker} (cache invalidated)")
 
@@ -76,8 +87,8 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             conn.executemany(query, data)
             conn.commit()
 
-            # ✅ 캐시 무효화
-            invalidate_cache("etf:*")
+            # ✅ 캐시 무효화 (ETF 목록/정보 태그)
+            invalidate_tags([cache_tags.ETF_LIST])
 
             self.logger.info(f"Saved {len(entities)} ETFs (cache invalidated)")
 
@@ -90,7 +101,11 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
         return self.find_by_ticker(id)
 
     # ✅ 캐싱 적용: 개별 ETF 조회 (10분 캐시)
-    @cached(ttl=600, key_prefix="etf")
+    @cached(
+        ttl=600,
+        key_prefix="etf",
+        tags=lambda self, ticker: [cache_tags.ETF_LIST, cache_tags.etf_tag(ticker)],
+    )
     def find_by_ticker(self, ticker: str) -> Optional[ETF]:
         """
         티커로 ETF를 조회합니다.
@@ -156,8 +171,8 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             self.logger.error(f"Failed to find ETFs by name like: {e}", exc_info=True)
             raise DatabaseException("find_by_name_like", str(e))
 
-    # ✅ 캐싱 적용: 액티브 ETF 목록 (5분 캐시)
-    @cached(ttl=300, key_prefix="etf:active")
+    # ✅ 캐싱 적용: 액티브 ETF 목록 (5분 캐시, 만료 후 5분간 이전 값 제공하며 갱신)
+    @cached(ttl=300, key_prefix="etf:active", tags=[cache_tags.ETF_LIST], stale_ttl=300)
     def find_active_etfs(self) -> List[ETF]:
         """
         액티브 ETF들을 조회합니다.
@@ -181,8 +196,8 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             self.logger.error(f"Failed to find active ETFs: {e}", exc_info=True)
             raise DatabaseException("find_active_etfs", str(e))
 
-    # ✅ 캐싱 적용: ETF 목록 (5분 캐시)
-    @cached(ttl=300, key_prefix="etf")
+    # ✅ 캐싱 적용: ETF 목록 (5분 캐시, 만료 후 5분간 이전 값 제공하며 갱신)
+    @cached(ttl=300, key_prefix="etf", tags=[cache_tags.ETF_LIST], stale_ttl=300)
     def find_all(self) -> List[ETF]:
         """
         모든 ETF를 조회합니다.
@@ -231,7 +246,11 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
 
             conn = self.db_conn.get_connection()
             conn.execute(query, (id,))
+            # 보유 종목이 함께 삭제(CASCADE)되므로 집계도 비움
+            SQLiteStatisticsRepository.clear_aggregates(conn)
+            SQLiteHoldingDiffRepository.clear_diffs(conn)
             conn.commit()
+            invalidate_tags([cache_tags.ETF_LIST, cache_tags.HOLDINGS])
 
             self.logger.debug(f"Deleted ETF: {id}")
 
@@ -246,7 +265,11 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
 
             conn = self.db_conn.get_connection()
             conn.execute(query)
+            # 보유 종목이 함께 삭제(CASCADE)되므로 집계도 비움
+            SQLiteStatisticsRepository.clear_aggregates(conn)
+            SQLiteHoldingDiffRepository.clear_diffs(conn)
             conn.commit()
+            invalidate_tags([cache_tags.ETF_LIST, cache_tags.HOLDINGS])
 
             self.logger.warning("Deleted all ETFs")
 
@@ -290,7 +313,18 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
                     holding.amount,
                 ),
             )
+            SQLiteStatisticsRepository.clear_aggregates(
+                conn, [to_date_string(holding.date)]
+            )
+            SQLiteHoldingDiffRepository.clear_diffs(
+                conn, [to_date_string(holding.date)]
+            )
             conn.commit()
+            invalidate_tags(
+                cache_tags.holdings_tags(
+                    [holding.etf_ticker], [holding.stock_ticker], [holding.date]
+                )
+            )
 
         except sqlite3.Error as e:
             self.logger.error(f"Failed to save holding: {e}", exc_info=True)
@@ -323,21 +357,19 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
 
             conn = self.db_conn.get_connection()
             conn.executemany(query, data)
+            SQLiteStatisticsRepository.clear_aggregates(conn, [row[2] for row in data])
+            SQLiteHoldingDiffRepository.clear_diffs(conn, [row[2] for row in data])
             conn.commit()
 
-            # ✅ 개선: 배치 캐시 무효화
+            # ✅ 개선: 바뀐 ETF/종목/날짜 태그만 무효화 (캐시 크기와 무관)
             if holdings:
-                from infrastructure.cache import cache_manager
-
-                etf_tickers = set(h.etf_ticker for h in holdings)
-                patterns = []
-
-                for ticker in etf_tickers:
-                    patterns.append(f"etf:holdings:{ticker}:*")
-                    patterns.append(f"etf:dates:{ticker}")
-
-                # 한 번에 무효화
-                deleted_count = cache_manager.invalidate_multiple_patterns(patterns)
+                deleted_count = invalidate_tags(
+                    cache_tags.holdings_tags(
+                        {row[0] for row in data},
+                        {row[1] for row in data},
+                        {row[2] for row in data},
+                    )
+                )
 
                 self.logger.debug(
                     f"Saved {len(holdings)} holdings, "
@@ -349,16 +381,22 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             raise DatabaseException("save_holdings", str(e))
 
     def find_holdings_by_etf_and_date(
-        self, etf_ticker: str, date: datetime
-    ) -> List[Holding]:
+        self,
+        etf_ticker: str,
+        date: datetime,
+        as_rows: bool = False,
+        sort_by_stock: bool = False,
+    ) -> HoldingList:
         """특정 ETF의 특정 날짜 보유 종목을 조회합니다."""
         try:
-            query = """
+            # ✅ 정렬 병합 비교용: 커버링 인덱스 (date, etf_ticker, stock_ticker) 순서로 조회
+            order_by = "h.stock_ticker" if sort_by_stock else "h.weight DESC"
+            query = f"""
                 SELECT h.etf_ticker, h.stock_ticker, h.date, h.weight, h.amount, s.name as stock_name
                 FROM data_etf_holdings h
                 JOIN data_stocks s ON h.stock_ticker = s.ticker
                 WHERE h.etf_ticker = ? AND h.date = ?
-                ORDER BY h.weight DESC
+                ORDER BY {order_by}
             """
 
             cursor = self.db_conn.execute_query(
@@ -366,25 +404,15 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             )
             rows = cursor.fetchall()
 
-            return [
-                Holding.create(
-                    etf_ticker=row["etf_ticker"],
-                    stock_ticker=row["stock_ticker"],
-                    date=from_date_string(row["date"]),
-                    weight=row["weight"],
-                    amount=row["amount"],
-                    stock_name=row["stock_name"],
-                )
-                for row in rows
-            ]
+            return self._hydrate_holdings(rows, as_rows)
 
         except sqlite3.Error as e:
             self.logger.error(f"Failed to find holdings: {e}", exc_info=True)
             raise DatabaseException("find_holdings_by_etf_and_date", str(e))
 
     def find_holdings_by_stock_and_date(
-        self, stock_ticker: str, date: datetime
-    ) -> List[Holding]:
+        self, stock_ticker: str, date: datetime, as_rows: bool = False
+    ) -> HoldingList:
         """특정 종목을 보유한 모든 ETF를 특정 날짜 기준으로 조회합니다."""
         try:
             query = """
@@ -400,27 +428,80 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             )
             rows = cursor.fetchall()
 
-            return [
-                Holding.create(
-                    etf_ticker=row["etf_ticker"],
-                    stock_ticker=row["stock_ticker"],
-                    date=from_date_string(row["date"]),
-                    weight=row["weight"],
-                    amount=row["amount"],
-                    stock_name=row["stock_name"],
-                )
-                for row in rows
-            ]
+            return self._hydrate_holdings(rows, as_rows)
 
         except sqlite3.Error as e:
             self.logger.error(f"Failed to find holdings by stock: {e}", exc_info=True)
             raise DatabaseException("find_holdings_by_stock_and_date", str(e))
 
+    # ✅ 캐싱 적용: 해당 종목의 보유 행이 바뀌면 무효화 (종목 태그)
+    @cached(
+        ttl=600,
+        key_prefix="stock:ownership",
+        tags=lambda self, stock_ticker, *args, **kwargs: [
+            cache_tags.HOLDINGS,
+            cache_tags.stock_tag(stock_ticker),
+        ],
+    )
+    def find_holdings_by_stock(
+        self,
+        stock_ticker: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[HoldingRow]:
+        """
+        특정 종목을 보유한 ETF들을 기간 전체에 걸쳐 조회합니다.
+
+        ✅ 추가: (stock_ticker, date, weight DESC) 인덱스 순서 그대로 범위 탐색
+        (정렬 단계 없음, 종목명은 호출하는 쪽에서 한 번만 조회)
+        """
+        try:
+            conditions = ["stock_ticker = ?"]
+            params = [stock_ticker]
+
+            if start_date:
+                conditions.append("date >= ?")
+                params.append(to_date_string(start_date))
+            if end_date:
+                conditions.append("date <= ?")
+                params.append(to_date_string(end_date))
+
+            query = f"""
+                SELECT etf_ticker, stock_ticker, date, weight, amount, '' as stock_name
+                FROM data_etf_holdings
+                WHERE {" AND ".join(conditions)}
+                ORDER BY date, weight DESC
+            """
+
+            cursor = self.db_conn.execute_query(query, tuple(params))
+            return self._hydrate_holdings(cursor.fetchall(), as_rows=True)
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to find holdings by stock: {e}", exc_info=True)
+            raise DatabaseException("find_holdings_by_stock", str(e))
+
     def find_holdings_by_date(self, date: datetime) -> List[Holding]:
         """특정 날짜의 모든 보유 종목을 조회합니다."""
+        return self.find_holdings_snapshot(date).to_holdings()
+
+    # ✅ 캐싱 적용: 날짜별 열 저장소 (10분 캐시, 통계/비교 조회가 공유)
+    # 저장/삭제 시에는 태그로 즉시 무효화되므로 TTL 만료 후의 이전 값은
+    # 그대로 유효하며, 만료 후 10분간은 이전 값을 제공하며 갱신합니다.
+    @cached(
+        ttl=600,
+        key_prefix="etf:snapshot",
+        tags=lambda self, date: [cache_tags.HOLDINGS, cache_tags.date_tag(date)],
+        stale_ttl=600,
+    )
+    def find_holdings_snapshot(self, date: datetime) -> HoldingsSnapshot:
+        """
+        특정 날짜의 모든 보유 종목을 열 저장소로 조회합니다.
+
+        ✅ 개선: 행마다 Holding을 만들지 않고 열 배열로 바로 적재합니다.
+        """
         try:
             query = """
-                SELECT h.etf_ticker, h.stock_ticker, h.date, h.weight, h.amount, s.name as stock_name
+                SELECT h.etf_ticker, h.stock_ticker, h.weight, h.amount, s.name
                 FROM data_etf_holdings h
                 JOIN data_stocks s ON h.stock_ticker = s.ticker
                 WHERE h.date = ?
@@ -429,23 +510,32 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             cursor = self.db_conn.execute_query(query, (to_date_string(date),))
             rows = cursor.fetchall()
 
-            return [
-                Holding.create(
-                    etf_ticker=row["etf_ticker"],
-                    stock_ticker=row["stock_ticker"],
-                    date=from_date_string(row["date"]),
-                    weight=row["weight"],
-                    amount=row["amount"],
-                    stock_name=row["stock_name"],
-                )
-                for row in rows
-            ]
+            etf_tickers, stock_tickers, weights, amounts, names = (
+                zip(*rows) if rows else ((), (), (), (), ())
+            )
+
+            snapshot = HoldingsSnapshot.from_columns(
+                date,
+                etf_tickers,
+                stock_tickers,
+                weights,
+                [amount or 0.0 for amount in amounts],
+                dict(zip(stock_tickers, names)),
+            )
+
+            self.logger.debug(
+                f"Loaded holdings snapshot for {to_date_string(date)}: "
+                f"{len(snapshot)} rows, {snapshot.nbytes} bytes"
+            )
+            return snapshot
 
         except sqlite3.Error as e:
-            self.logger.error(f"Failed to find holdings by date: {e}", exc_info=True)
-            raise DatabaseException("find_holdings_by_date", str(e))
+            self.logger.error(f"Failed to load holdings snapshot: {e}", exc_info=True)
+            raise DatabaseException("find_holdings_snapshot", str(e))
 
-    def find_weight_history(self, etf_ticker: str, stock_ticker: str) -> List[Holding]:
+    def find_weight_history(
+        self, etf_ticker: str, stock_ticker: str, as_rows: bool = False
+    ) -> HoldingList:
         """특정 ETF 내 특정 종목의 비중 추이를 조회합니다."""
         try:
             query = """
@@ -459,22 +549,118 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             cursor = self.db_conn.execute_query(query, (etf_ticker, stock_ticker))
             rows = cursor.fetchall()
 
-            return [
-                Holding.create(
-                    etf_ticker=row["etf_ticker"],
-                    stock_ticker=row["stock_ticker"],
-                    date=from_date_string(row["date"]),
-                    weight=row["weight"],
-                    amount=row["amount"],
-                    stock_name=row["stock_name"],
-                )
-                for row in rows
-            ]
+            return self._hydrate_holdings(rows, as_rows)
 
         except sqlite3.Error as e:
             self.logger.error(f"Failed to find weight history: {e}", exc_info=True)
             raise DatabaseException("find_weight_history", str(e))
 
+    def find_weight_histories(
+        self,
+        etf_tickers: List[str],
+        stock_tickers: List[str],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[HoldingRow]:
+        """
+        여러 ETF × 종목 조합의 비중 추이를 한 번에 조회합니다.
+
+        ✅ 추가: 조합마다 find_weight_history를 호출하지 않고 단일 쿼리로 조회
+        UNIQUE (etf_ticker, stock_ticker, date) 인덱스 순서로 범위 탐색합니다.
+        """
+        if not etf_tickers or not stock_tickers:
+            return []
+
+        try:
+            conditions = [
+                f"h.etf_ticker IN ({','.join('?' * len(etf_tickers))})",
+                f"h.stock_ticker IN ({','.join('?' * len(stock_tickers))})",
+            ]
+            params = [*etf_tickers, *stock_tickers]
+
+            if start_date:
+                conditions.append("h.date >= ?")
+                params.append(to_date_string(start_date))
+            if end_date:
+                conditions.append("h.date <= ?")
+                params.append(to_date_string(end_date))
+
+            query = f"""
+                SELECT h.etf_ticker, h.stock_ticker, h.date, h.weight, h.amount, s.name as stock_name
+                FROM data_etf_holdings h
+                LEFT JOIN data_stocks s ON h.stock_ticker = s.ticker
+                WHERE {" AND ".join(conditions)}
+                ORDER BY h.etf_ticker, h.stock_ticker, h.date
+            """
+
+            cursor = self.db_conn.execute_query(query, tuple(params))
+            return self._hydrate_holdings(cursor.fetchall(), as_rows=True)
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to find weight histories: {e}", exc_info=True)
+            raise DatabaseException("find_weight_histories", str(e))
+
+    def find_latest_weight(self, etf_ticker: str, stock_ticker: str) -> Optional[float]:
+        """특정 ETF 내 특정 종목의 가장 최근 비중을 조회합니다."""
+        try:
+            query = """
+                SELECT weight
+                FROM data_etf_holdings
+                WHERE etf_ticker = ? AND stock_ticker = ?
+                ORDER BY date DESC
+                LIMIT 1
+            """
+
+            cursor = self.db_conn.execute_query(query, (etf_ticker, stock_ticker))
+            row = cursor.fetchone()
+
+            return row["weight"] if row else None
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to find latest weight: {e}", exc_info=True)
+            raise DatabaseException("find_latest_weight", str(e))
+
+    def has_weight_history(self, etf_ticker: str, stock_ticker: str) -> bool:
+        """특정 ETF 내 특정 종목의 보유 이력이 있는지 확인합니다."""
+        try:
+            query = """
+                SELECT EXISTS (
+                    SELECT 1 FROM data_etf_holdings
+                    WHERE etf_ticker = ? AND stock_ticker = ?
+                ) as found
+            """
+
+            cursor = self.db_conn.execute_query(query, (etf_ticker, stock_ticker))
+            return bool(cursor.fetchone()["found"])
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to check weight history: {e}", exc_info=True)
+            raise DatabaseException("has_weight_history", str(e))
+
+    @staticmethod
+    def _hydrate_holdings(
+        rows: List[sqlite3.Row], as_rows: bool = False
+    ) -> HoldingList:
+        """
+        조회 행을 Holding(또는 HoldingRow) 리스트로 변환합니다.
+
+        ✅ 개선: 저장 시 검증된 DB 행이므로 Holding.create()의 정규화/검증을 생략하고,
+        반복되는 날짜 문자열은 캐시된 파싱 결과를 재사용합니다.
+        컬럼 순서: etf_ticker, stock_ticker, date, weight, amount, stock_name
+        """
+        if as_rows:
+            return [
+                HoldingRow(etf, stock, date, weight, amount or 0.0, name or "")
+                for etf, stock, date, weight, amount, name in rows
+            ]
+
+        return [
+            Holding.from_trusted(
+                etf, stock, parse_date_cached(date), weight, amount, name
+            )
+            for etf, stock, date, weight, amount, name in rows
+        ]
+
     # 날짜 관련
 
     def get_latest_date(self) -> Optional[datetime]:
@@ -495,7 +681,14 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             raise DatabaseException("get_latest_date", str(e))
 
     # ✅ 캐싱 적용: 날짜 목록 (10분 캐시)
-    @cached(ttl=600, key_prefix="etf:dates")
+    @cached(
+        ttl=600,
+        key_prefix="etf:dates",
+        tags=lambda self, etf_ticker: [
+            cache_tags.HOLDINGS,
+            cache_tags.etf_tag(etf_ticker),
+        ],
+    )
     def get_available_dates(self, etf_ticker: str) -> List[datetime]:
         """
         특정 ETF의 데이터가 있는 모든 날짜를 조회합니다.
@@ -513,7 +706,7 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             cursor = self.db_conn.execute_query(query, (etf_ticker,))
             rows = cursor.fetchall()
 
-            return [from_date_string(row["date"]) for row in rows]
+            return [parse_date_cached(row["date"]) for row in rows]
 
         except sqlite3.Error as e:
             self.logger.error(f"Failed to get available dates: {e}", exc_info=True)
@@ -531,7 +724,7 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             cursor = self.db_conn.execute_query(query)
             rows = cursor.fetchall()
 
-            return [from_date_string(row["date"]) for row in rows]
+            return [parse_date_cached(row["date"]) for row in rows]
 
         except sqlite3.Error as e:
             self.logger.error(f"Failed to get all available dates: {e}", exc_info=True)
@@ -555,6 +748,36 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
             self.logger.error(f"Failed to check data for date: {e}", exc_info=True)
             raise DatabaseException("has_data_for_date", str(e))
 
+    def get_collection_status(self, date: datetime) -> Tuple[Set[str], Set[str]]:
+        """
+        ✅ 추가: 등록된 ETF와 해당 날짜 수집 완료 ETF를 단일 쿼리로 조회합니다.
+
+        엔티티를 만들지 않고 티커만 조회하므로 중단된 업데이트를
+        다시 실행할 때 이미 수집된 ETF를 쿼리 한 번으로 건너뛸 수 있습니다.
+        """
+        try:
+            query = """
+                SELECT e.ticker,
+                       EXISTS (
+                           SELECT 1
+                           FROM data_etf_holdings h
+                           WHERE h.etf_ticker = e.ticker AND h.date = ?
+                       ) AS collected
+                FROM data_etfs e
+            """
+
+            cursor = self.db_conn.execute_query(query, (to_date_string(date),))
+            rows = cursor.fetchall()
+
+            known = {row["ticker"] for row in rows}
+            collected = {row["ticker"] for row in rows if row["collected"]}
+
+            return known, collected
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to get collection status: {e}", exc_info=True)
+            raise DatabaseException("get_collection_status", str(e))
+
     # 통계 관련
 
     def count_holdings_by_etf(self, etf_ticker: str, date: datetime) -> int:
@@ -604,7 +827,10 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
 
             conn = self.db_conn.get_connection()
             conn.execute(query, (to_date_string(date),))
+            SQLiteStatisticsRepository.clear_aggregates(conn, [to_date_string(date)])
+            SQLiteHoldingDiffRepository.clear_diffs(conn, [to_date_string(date)])
             conn.commit()
+            invalidate_tags([cache_tags.HOLDINGS])
 
             self.logger.info(f"Deleted holdings for date: {to_date_string(date)}")
 
@@ -619,7 +845,10 @@ class SQLiteETFRepository(ETFRepository, LoggerMixin):
 
             conn = self.db_conn.get_connection()
             conn.execute(query, (etf_ticker,))
+            SQLiteStatisticsRepository.clear_aggregates(conn)
+            SQLiteHoldingDiffRepository.clear_diffs(conn)
             conn.commit()
+            invalidate_tags([cache_tags.HOLDINGS])
 
             self.logger.info(f"Deleted holdings for ETF: {etf_ticker}")
 
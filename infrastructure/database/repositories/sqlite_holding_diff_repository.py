@@ -0,0 +1,304 @@
+"""
+SQLite Holding Diff Repository Implementation
+연속 거래일 보유 종목 비교 결과의 SQLite 구현체입니다.
+"""
+
+import sqlite3
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from config.logging_config import LoggerMixin
+from domain.entities.holding import HoldingRow
+from domain.repositories.holding_diff_repository import HoldingDiffRepository
+from domain.services.holdings_analyzer import HoldingsAnalyzer
+from domain.value_objects.weight_change import ChangeStatus
+from shared.exceptions import DatabaseException
+from shared.utils.date_utils import to_date_string
+
+from infrastructure.database.connection import DatabaseConnection
+
+
+class SQLiteHoldingDiffRepository(HoldingDiffRepository, LoggerMixin):
+    """
+    SQLite 기반 보유 종목 비교 리포지토리 구현
+
+    비교 테이블:
+        agg_holding_diffs → (ETF, 날짜, 종목)별 이전 거래일 대비 상태와 비중 변화
+
+    DailyIngestionWriter가 하루치 저장과 같은 트랜잭션에서 write_diffs()로
+    그날 비교 결과를 계산합니다. 과거 날짜를 나중에 수집한 경우를 위해
+    바로 다음 날짜의 비교 결과도 함께 다시 계산합니다.
+    그 밖의 경로로 보유 종목이 바뀌면 clear_diffs()로 관련 결과를 지우고,
+    비어 있는 결과는 시작 시 마이그레이션이 write_missing_diffs()로 채웁니다.
+
+    Args:
+        db_connection: 데이터베이스 연결
+    """
+
+    def __init__(self, db_connection: DatabaseConnection):
+        self.db_conn = db_connection
+
+    @classmethod
+    def write_diffs(
+        cls,
+        conn: sqlite3.Connection,
+        date_str: str,
+        etf_tickers: Optional[Iterable[str]] = None,
+    ) -> int:
+        """
+        특정 날짜의 비교 결과를 다시 계산합니다. (커밋하지 않음)
+
+        호출하는 쪽의 트랜잭션 안에서 실행되어야 합니다.
+
+        Args:
+            conn: 데이터베이스 연결
+            date_str: 기준일 (YYYY-MM-DD)
+            etf_tickers: 대상 ETF 코드들, None이면 그날 보유 종목이 있는 전체 ETF
+
+        Returns:
+            저장한 비교 행 수
+        """
+        current = cls._rows_by_etf(conn, date_str, etf_tickers)
+        tickers = set(current) if etf_tickers is None else set(etf_tickers)
+
+        written = cls._write_for_date(conn, date_str, tickers, current)
+
+        # 뒤늦게 수집한 과거 날짜면 다음 날짜의 비교 기준이 바뀜
+        next_dates = cls._neighbor_dates(conn, date_str, tickers, before=False)
+        for next_date, next_tickers in cls._group_by_date(next_dates).items():
+            written += cls._write_for_date(
+                conn,
+                next_date,
+                next_tickers,
+                cls._rows_by_etf(conn, next_date, next_tickers),
+            )
+
+        return written
+
+    @staticmethod
+    def clear_diffs(
+        conn: sqlite3.Connection, date_strs: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        비교 결과를 삭제합니다. (커밋하지 않음)
+
+        해당 날짜를 현재 날짜 또는 이전 날짜로 사용하는 결과를 모두 지웁니다.
+
+        Args:
+            conn: 데이터베이스 연결
+            date_strs: 삭제할 날짜들 (YYYY-MM-DD), None이면 전체
+        """
+        if date_strs is None:
+            conn.execute("DELETE FROM agg_holding_diffs")
+            return
+
+        params = [(date_str, date_str) for date_str in set(date_strs)]
+        conn.executemany(
+            "DELETE FROM agg_holding_diffs WHERE date = ? OR prev_date = ?", params
+        )
+
+    @classmethod
+    def write_missing_diffs(cls, conn: sqlite3.Connection) -> int:
+        """
+        이전 날짜가 있는데 비교 결과가 없는 (ETF, 날짜)를 채웁니다. (커밋하지 않음)
+
+        비교 테이블 도입 이전 데이터나 clear_diffs()로 지운 결과가 대상입니다.
+        호출하는 쪽의 트랜잭션 안에서 실행되어야 합니다.
+
+        Args:
+            conn: 데이터베이스 연결
+
+        Returns:
+            저장한 비교 행 수
+        """
+        cursor = conn.execute(
+            """
+            SELECT h.date, h.etf_ticker
+            FROM (SELECT DISTINCT etf_ticker, date FROM data_etf_holdings) h
+            WHERE EXISTS (
+                    SELECT 1 FROM data_etf_holdings p
+                    WHERE p.etf_ticker = h.etf_ticker AND p.date < h.date)
+              AND NOT EXISTS (
+                    SELECT 1 FROM agg_holding_diffs d
+                    WHERE d.etf_ticker = h.etf_ticker AND d.date = h.date)
+            """
+        )
+
+        missing = defaultdict(list)
+        for date_str, etf_ticker in cursor.fetchall():
+            missing[date_str].append(etf_ticker)
+
+        written = 0
+        for date_str, tickers in sorted(missing.items()):
+            written += cls._write_for_date(
+                conn, date_str, tickers, cls._rows_by_etf(conn, date_str, tickers)
+            )
+        return written
+
+    def find_diffs(
+        self, etf_ticker: str, date: datetime, prev_date: datetime
+    ) -> Optional[Dict]:
+        """특정 ETF의 날짜별 비교 결과를 조회합니다."""
+        try:
+            query = """
+                SELECT d.stock_ticker, COALESCE(s.name, '') AS stock_name,
+                       d.prev_weight, d.curr_weight, d.change, d.curr_amount,
+                       d.status
+                FROM agg_holding_diffs d
+                LEFT JOIN data_stocks s ON d.stock_ticker = s.ticker
+                WHERE d.etf_ticker = ? AND d.date = ? AND d.prev_date = ?
+                ORDER BY d.curr_weight DESC, d.stock_ticker
+            """
+
+            cursor = self.db_conn.execute_query(
+                query, (etf_ticker, to_date_string(date), to_date_string(prev_date))
+            )
+            rows = cursor.fetchall()
+
+            if not rows:
+                return None
+
+            counts = dict.fromkeys(ChangeStatus, 0)
+            diffs = []
+            for row in rows:
+                status = ChangeStatus(row["status"])
+                counts[status] += 1
+                diffs.append(
+                    {
+                        "stock_ticker": row["stock_ticker"],
+                        "stock_name": row["stock_name"],
+                        "prev_weight": row["prev_weight"],
+                        "current_weight": row["curr_weight"],
+                        "change": row["change"],
+                        "current_amount": row["curr_amount"],
+                        "status": status.value,
+                    }
+                )
+
+            return {"diffs": diffs, "counts": counts}
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to find holding diffs: {e}", exc_info=True)
+            raise DatabaseException("find_holding_diffs", str(e))
+
+    @classmethod
+    def _write_for_date(
+        cls,
+        conn: sqlite3.Connection,
+        date_str: str,
+        etf_tickers: Iterable[str],
+        current: Dict[str, List[HoldingRow]],
+    ) -> int:
+        """ETF들의 특정 날짜 비교 결과를 바로 이전 날짜 기준으로 저장합니다."""
+        etf_tickers = set(etf_tickers)
+        conn.executemany(
+            "DELETE FROM agg_holding_diffs WHERE etf_ticker = ? AND date = ?",
+            [(ticker, date_str) for ticker in etf_tickers],
+        )
+
+        analyzer = HoldingsAnalyzer()
+        prev_dates = cls._neighbor_dates(conn, date_str, etf_tickers, before=True)
+        rows = []
+
+        # 이전 날짜가 같은 ETF끼리 한 번에 조회 (보통 전체가 같은 날짜)
+        for prev_date, tickers in cls._group_by_date(prev_dates).items():
+            previous = cls._rows_by_etf(conn, prev_date, tickers)
+
+            for ticker in tickers:
+                for diff in analyzer.merge_holdings(
+                    previous.get(ticker, []), current.get(ticker, [])
+                ):
+                    prev, curr = diff.previous, diff.current
+                    rows.append(
+                        (
+                            ticker,
+                            date_str,
+                            prev_date,
+                            diff.stock_ticker,
+                            diff.status.value,
+                            prev.weight if prev else 0.0,
+                            curr.weight if curr else 0.0,
+                            round(diff.change, 4),
+                            curr.amount if curr else 0.0,
+                        )
+                    )
+
+        if rows:
+            conn.executemany(
+                """
+                INSERT INTO agg_holding_diffs
+                (etf_ticker, date, prev_date, stock_ticker, status,
+                 prev_weight, curr_weight, change, curr_amount)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+
+        return len(rows)
+
+    @staticmethod
+    def _rows_by_etf(
+        conn: sqlite3.Connection,
+        date_str: str,
+        etf_tickers: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[HoldingRow]]:
+        """특정 날짜 보유 종목을 ETF별, 종목 코드 순으로 조회합니다."""
+        wanted = None if etf_tickers is None else set(etf_tickers)
+
+        # (date, etf_ticker, stock_ticker, ...) 커버링 인덱스 순서
+        cursor = conn.execute(
+            """
+            SELECT etf_ticker, stock_ticker, weight, amount
+            FROM data_etf_holdings
+            WHERE date = ?
+            ORDER BY etf_ticker, stock_ticker
+            """,
+            (date_str,),
+        )
+
+        by_etf = defaultdict(list)
+        for etf, stock, weight, amount in cursor.fetchall():
+            if wanted is None or etf in wanted:
+                by_etf[etf].append(
+                    HoldingRow(etf, stock, date_str, weight, amount or 0.0, "")
+                )
+        return by_etf
+
+    @staticmethod
+    def _neighbor_dates(
+        conn: sqlite3.Connection,
+        date_str: str,
+        etf_tickers: Iterable[str],
+        before: bool,
+    ) -> Dict[str, str]:
+        """ETF별 바로 이전(before=True) 또는 다음 보유 종목 날짜를 조회합니다."""
+        wanted = set(etf_tickers)
+        if not wanted:
+            return {}
+
+        # ETF마다 (etf_ticker, date) 인덱스 탐색 한 번
+        aggregate, op = ("MAX", "<") if before else ("MIN", ">")
+        cursor = conn.execute(
+            f"""
+            SELECT e.ticker,
+                   (SELECT {aggregate}(h.date) FROM data_etf_holdings h
+                    WHERE h.etf_ticker = e.ticker AND h.date {op} ?) AS neighbor
+            FROM data_etfs e
+            """,
+            (date_str,),
+        )
+
+        return {
+            ticker: neighbor
+            for ticker, neighbor in cursor.fetchall()
+            if neighbor and ticker in wanted
+        }
+
+    @staticmethod
+    def _group_by_date(dates: Dict[str, str]) -> Dict[str, List[str]]:
+        """ETF 코드 → 날짜 매핑을 날짜 → ETF 코드 목록으로 바꿉니다."""
+        grouped = defaultdict(list)
+        for ticker, date_str in dates.items():
+            grouped[date_str].append(ticker)
+        return grouped
@@ -0,0 +1,207 @@
+"""
+SQLite Job Repository Implementation
+Job 리포지토리의 SQLite 구현체입니다.
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+from typing import List, Optional, Set
+
+from config.logging_config import LoggerMixin
+from domain.entities.job import CheckpointStatus, Job
+from domain.repositories.job_repository import JobRepository
+from shared.exceptions import DatabaseException
+from shared.utils.date_utils import to_date_string
+
+from infrastructure.database.connection import DatabaseConnection
+
+
+class SQLiteJobRepository(JobRepository, LoggerMixin):
+    """
+    SQLite 기반 Job 리포지토리 구현
+
+    Args:
+        db_connection: 데이터베이스 연결
+    """
+
+    _SELECT_JOB = """
+        SELECT id, job_type, status, stage, params, total_units, done_units,
+               etfs_done, rows_written, message, error, started_units,
+               started_at, finished_at, created_at, updated_at
+        FROM job_runs
+    """
+
+    def __init__(self, db_connection: DatabaseConnection):
+        self.db_conn = db_connection
+
+    def save(self, job: Job) -> None:
+        """작업 상태를 저장합니다."""
+        try:
+            query = """
+                INSERT INTO job_runs
+                (id, job_type, status, stage, params, total_units, done_units,
+                 etfs_done, rows_written, message, error, started_units,
+                 started_at, finished_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    status = excluded.status,
+                    stage = excluded.stage,
+                    params = excluded.params,
+                    total_units = excluded.total_units,
+                    done_units = excluded.done_units,
+                    etfs_done = excluded.etfs_done,
+                    rows_written = excluded.rows_written,
+                    message = excluded.message,
+                    error = excluded.error,
+                    started_units = excluded.started_units,
+                    started_at = excluded.started_at,
+                    finished_at = excluded.finished_at,
+                    updated_at = CURRENT_TIMESTAMP
+            """
+
+            conn = self.db_conn.get_connection()
+            conn.execute(
+                query,
+                (
+                    job.id,
+                    job.job_type,
+                    job.status,
+                    job.stage,
+                    json.dumps(job.params, ensure_ascii=False),
+                    job.total_units,
+                    job.done_units,
+                    job.etfs_done,
+                    job.rows_written,
+                    job.message,
+                    job.error,
+                    job.started_units,
+                    self._format_timestamp(job.started_at),
+                    self._format_timestamp(job.finished_at),
+                ),
+            )
+            conn.commit()
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to save job: {e}", exc_info=True)
+            raise DatabaseException("save_job", str(e))
+
+    def find_by_id(self, job_id: str) -> Optional[Job]:
+        """ID로 작업을 조회합니다."""
+        try:
+            query = self._SELECT_JOB + " WHERE id = ?"
+
+            cursor = self.db_conn.execute_query(query, (job_id,))
+            row = cursor.fetchone()
+
+            return self._row_to_job(row) if row else None
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to find job: {e}", exc_info=True)
+            raise DatabaseException("find_job_by_id", str(e))
+
+    def find_latest(self, job_type: str) -> Optional[Job]:
+        """특정 종류의 가장 최근 작업을 조회합니다."""
+        try:
+            query = (
+                self._SELECT_JOB
+                + " WHERE job_type = ? ORDER BY created_at DESC, rowid DESC LIMIT 1"
+            )
+
+            cursor = self.db_conn.execute_query(query, (job_type,))
+            row = cursor.fetchone()
+
+            return self._row_to_job(row) if row else None
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to find latest job: {e}", exc_info=True)
+            raise DatabaseException("find_latest_job", str(e))
+
+    def find_by_status(self, statuses: List[str]) -> List[Job]:
+        """특정 상태의 작업들을 조회합니다."""
+        try:
+            if not statuses:
+                return []
+
+            placeholders = ",".join(["?" for _ in statuses])
+            query = (
+                self._SELECT_JOB
+                + f" WHERE status IN ({placeholders})"
+                + " ORDER BY created_at DESC, rowid DESC"
+            )
+
+            cursor = self.db_conn.execute_query(query, tuple(statuses))
+            return [self._row_to_job(row) for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to find jobs by status: {e}", exc_info=True)
+            raise DatabaseException("find_jobs_by_status", str(e))
+
+    def find_completed_dates(self, job_id: str) -> Set[str]:
+        """작업에서 전체 완료된 날짜들을 조회합니다."""
+        try:
+            query = """
+                SELECT date
+                FROM job_checkpoints
+                WHERE job_id = ? AND etf_ticker = ?
+            """
+
+            cursor = self.db_conn.execute_query(
+                query, (job_id, CheckpointStatus.DAY_MARKER)
+            )
+            return {row["date"] for row in cursor.fetchall()}
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to find completed dates: {e}", exc_info=True)
+            raise DatabaseException("find_completed_dates", str(e))
+
+    def find_checkpointed_tickers(self, job_id: str, date: datetime) -> Set[str]:
+        """작업에서 특정 날짜에 처리가 끝난 ETF 코드들을 조회합니다."""
+        try:
+            query = """
+                SELECT etf_ticker
+                FROM job_checkpoints
+                WHERE job_id = ? AND date = ? AND etf_ticker != ?
+            """
+
+            cursor = self.db_conn.execute_query(
+                query, (job_id, to_date_string(date), CheckpointStatus.DAY_MARKER)
+            )
+            return {row["etf_ticker"] for row in cursor.fetchall()}
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to find checkpoints: {e}", exc_info=True)
+            raise DatabaseException("find_checkpointed_tickers", str(e))
+
+    def _row_to_job(self, row: sqlite3.Row) -> Job:
+        """DB 행을 Job 엔티티로 변환합니다."""
+        return Job(
+            id=row["id"],
+            job_type=row["job_type"],
+            status=row["status"],
+            stage=row["stage"],
+            params=json.loads(row["params"] or "{}"),
+            total_units=row["total_units"],
+            done_units=row["done_units"],
+            etfs_done=row["etfs_done"],
+            rows_written=row["rows_written"],
+            message=row["message"],
+            error=row["error"],
+            started_units=row["started_units"],
+            started_at=self._parse_timestamp(row["started_at"]),
+            finished_at=self._parse_timestamp(row["finished_at"]),
+            created_at=self._parse_timestamp(row["created_at"]),
+            updated_at=self._parse_timestamp(row["updated_at"]),
+        )
+
+    @staticmethod
+    def _format_timestamp(value: Optional[datetime]) -> Optional[str]:
+        """datetime을 ISO 문자열로 변환합니다."""
+        return value.isoformat() if value else None
+
+    @staticmethod
+    def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+        """ISO/CURRENT_TIMESTAMP 문자열을 datetime으로 변환합니다."""
+        if not value:
+            return None
+        return datetime.fromisoformat(value)
@@ -0,0 +1,335 @@
+"""
+SQLite Statistics Repository Implementation
+날짜별 사전 집계 통계의 SQLite 구현체입니다.
+"""
+
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config.logging_config import LoggerMixin
+from domain.repositories.statistics_repository import StatisticsRepository
+from shared.exceptions import DatabaseException
+from shared.utils.date_utils import to_date_string
+
+from infrastructure.database.connection import DatabaseConnection
+
+
+class SQLiteStatisticsRepository(StatisticsRepository, LoggerMixin):
+    """
+    SQLite 기반 통계 리포지토리 구현
+
+    집계 테이블:
+        agg_stock_daily   → (날짜, 종목)별 ETF 수, 총 평가금액, 평균/최소/최대 비중
+        agg_daily_summary → 날짜별 ETF/종목/보유 종목 수와 비중 분포
+
+    집계는 DailyIngestionWriter가 하루치 저장과 같은 트랜잭션에서
+    write_aggregates()로 갱신합니다. 그 밖의 경로로 보유 종목이 바뀌면
+    clear_aggregates()로 해당 날짜 집계를 지우고, 비어 있는 날짜는
+    시작 시 마이그레이션이 write_missing_aggregates()로 채웁니다.
+
+    Args:
+        db_connection: 데이터베이스 연결
+    """
+
+    _ORDER_CLAUSES = {
+        StatisticsRepository.ORDER_BY_ETF_COUNT: "a.etf_count DESC, a.total_amount DESC",
+        StatisticsRepository.ORDER_BY_AMOUNT: "a.total_amount DESC",
+    }
+
+    # 종목별 집계 (data_etf_holdings에서 GROUP BY stock_ticker)
+    _STOCK_AGGREGATE_COLUMNS = """
+        stock_ticker,
+        COUNT(DISTINCT etf_ticker) AS etf_count,
+        GROUP_CONCAT(etf_ticker) AS etf_tickers,
+        TOTAL(amount) AS total_amount,
+        AVG(weight) AS avg_weight,
+        MIN(weight) AS min_weight,
+        MAX(weight) AS max_weight
+    """
+
+    # 요약 및 비중 분포 (CASE 구간 집계)
+    _SUMMARY_COLUMNS = """
+        COUNT(DISTINCT etf_ticker) AS etf_count,
+        COUNT(DISTINCT stock_ticker) AS stock_count,
+        COUNT(*) AS holding_count,
+        TOTAL(CASE WHEN weight < 1.0 THEN 1 END) AS weight_under_1,
+        TOTAL(CASE WHEN weight >= 1.0 AND weight < 3.0 THEN 1 END) AS weight_1_to_3,
+        TOTAL(CASE WHEN weight >= 3.0 AND weight < 5.0 THEN 1 END) AS weight_3_to_5,
+        TOTAL(CASE WHEN weight >= 5.0 AND weight < 10.0 THEN 1 END) AS weight_5_to_10,
+        TOTAL(CASE WHEN weight >= 10.0 THEN 1 END) AS weight_over_10
+    """
+
+    def __init__(self, db_connection: DatabaseConnection):
+        self.db_conn = db_connection
+
+    @classmethod
+    def write_aggregates(cls, conn: sqlite3.Connection, date_str: str) -> None:
+        """
+        특정 날짜의 집계를 다시 계산합니다. (커밋하지 않음)
+
+        호출하는 쪽의 트랜잭션 안에서 실행되어야 합니다.
+
+        Args:
+            conn: 데이터베이스 연결
+            date_str: 기준일 (YYYY-MM-DD)
+        """
+        conn.execute("DELETE FROM agg_stock_daily WHERE date = ?", (date_str,))
+        conn.execute(
+            f"""
+            INSERT INTO agg_stock_daily
+            (stock_ticker, etf_count, etf_tickers, total_amount,
+             avg_weight, min_weight, max_weight, date)
+            SELECT {cls._STOCK_AGGREGATE_COLUMNS}, date
+            FROM data_etf_holdings
+            WHERE date = ?
+            GROUP BY stock_ticker
+            """,
+            (date_str,),
+        )
+
+        # 보유 종목이 없는 날도 요약 행을 남겨 집계 완료를 표시
+        conn.execute(
+            f"""
+            INSERT OR REPLACE INTO agg_daily_summary
+            (etf_count, stock_count, holding_count,
+             weight_under_1, weight_1_to_3, weight_3_to_5, weight_5_to_10,
+             weight_over_10, date, updated_at)
+            SELECT {cls._SUMMARY_COLUMNS}, ?, CURRENT_TIMESTAMP
+            FROM data_etf_holdings
+            WHERE date = ?
+            """,
+            (date_str, date_str),
+        )
+
+    @staticmethod
+    def clear_aggregates(
+        conn: sqlite3.Connection, date_strs: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        집계를 삭제합니다. (커밋하지 않음)
+
+        Args:
+            conn: 데이터베이스 연결
+            date_strs: 삭제할 날짜들 (YYYY-MM-DD), None이면 전체
+        """
+        if date_strs is None:
+            conn.execute("DELETE FROM agg_stock_daily")
+            conn.execute("DELETE FROM agg_daily_summary")
+            return
+
+        params = [(date_str,) for date_str in set(date_strs)]
+        conn.executemany("DELETE FROM agg_stock_daily WHERE date = ?", params)
+        conn.executemany("DELETE FROM agg_daily_summary WHERE date = ?", params)
+
+    @classmethod
+    def write_missing_aggregates(cls, conn: sqlite3.Connection) -> int:
+        """
+        보유 종목은 있는데 집계가 없는 날짜를 채웁니다. (커밋하지 않음)
+
+        집계 도입 이전 데이터나 clear_aggregates()로 지운 날짜가 대상입니다.
+        호출하는 쪽의 트랜잭션 안에서 실행되어야 합니다.
+
+        Args:
+            conn: 데이터베이스 연결
+
+        Returns:
+            집계한 날짜 수
+        """
+        cursor = conn.execute(
+            """
+            SELECT DISTINCT date FROM data_etf_holdings
+            WHERE date NOT IN (SELECT date FROM agg_daily_summary)
+            ORDER BY date
+            """
+        )
+        date_strs = [row[0] for row in cursor.fetchall()]
+
+        for date_str in date_strs:
+            cls.write_aggregates(conn, date_str)
+        return len(date_strs)
+
+    def find_stock_aggregates(
+        self,
+        date: datetime,
+        order_by: str = StatisticsRepository.ORDER_BY_ETF_COUNT,
+        min_etf_count: int = 1,
+        min_amount: Optional[float] = None,
+        limit: int = 0,
+    ) -> List[Dict]:
+        """특정 날짜의 종목별 집계를 사전 집계 테이블에서 조회합니다."""
+        try:
+            source = "SELECT * FROM agg_stock_daily WHERE date = ?"
+            return self._query_stock_aggregates(
+                source,
+                [to_date_string(date)],
+                order_by,
+                min_etf_count,
+                min_amount,
+                limit,
+            )
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to find stock aggregates: {e}", exc_info=True)
+            raise DatabaseException("find_stock_aggregates", str(e))
+
+    def aggregate_stocks_for_etfs(
+        self,
+        date: datetime,
+        etf_tickers: Optional[List[str]],
+        order_by: str = StatisticsRepository.ORDER_BY_ETF_COUNT,
+        min_etf_count: int = 1,
+        min_amount: Optional[float] = None,
+        limit: int = 0,
+    ) -> List[Dict]:
+        """
+        특정 ETF들의 보유 종목만으로 종목별 집계를 계산합니다.
+
+        (date, etf_ticker, ...) 커버링 인덱스만 읽고 상위 N개만 반환합니다.
+        """
+        if etf_tickers is not None and not etf_tickers:
+            return []
+
+        try:
+            where, params = self._holdings_filter(date, etf_tickers)
+            source = f"""
+                SELECT {self._STOCK_AGGREGATE_COLUMNS}
+                FROM data_etf_holdings
+                WHERE {where}
+                GROUP BY stock_ticker
+            """
+            return self._query_stock_aggregates(
+                source,
+                params,
+                order_by,
+                min_etf_count,
+                min_amount,
+                limit,
+            )
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to aggregate stocks: {e}", exc_info=True)
+            raise DatabaseException("aggregate_stocks_for_etfs", str(e))
+
+    def find_daily_summary(self, date: datetime) -> Optional[Dict]:
+        """특정 날짜의 요약 집계를 조회합니다."""
+        try:
+            query = """
+                SELECT etf_count, stock_count, holding_count,
+                       weight_under_1, weight_1_to_3, weight_3_to_5,
+                       weight_5_to_10, weight_over_10
+                FROM agg_daily_summary
+                WHERE date = ?
+            """
+
+            cursor = self.db_conn.execute_query(query, (to_date_string(date),))
+            row = cursor.fetchone()
+
+            return self._row_to_summary(row) if row else None
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to find daily summary: {e}", exc_info=True)
+            raise DatabaseException("find_daily_summary", str(e))
+
+    def summarize_for_etfs(
+        self, date: datetime, etf_tickers: Optional[List[str]]
+    ) -> Dict:
+        """특정 ETF들의 보유 종목 요약을 계산합니다."""
+        if etf_tickers is not None and not etf_tickers:
+            return self._row_to_summary(None)
+
+        try:
+            where, params = self._holdings_filter(date, etf_tickers)
+            query = f"""
+                SELECT {self._SUMMARY_COLUMNS}
+                FROM data_etf_holdings
+                WHERE {where}
+            """
+
+            cursor = self.db_conn.execute_query(query, tuple(params))
+            return self._row_to_summary(cursor.fetchone())
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to summarize holdings: {e}", exc_info=True)
+            raise DatabaseException("summarize_for_etfs", str(e))
+
+    @staticmethod
+    def _holdings_filter(
+        date: datetime, etf_tickers: Optional[List[str]]
+    ) -> Tuple[str, list]:
+        """보유 종목 조회 조건 (etf_tickers가 None이면 그날 전체 ETF)"""
+        params = [to_date_string(date)]
+        if etf_tickers is None:
+            return "date = ?", params
+
+        placeholders = ",".join(["?" for _ in etf_tickers])
+        return f"date = ? AND etf_ticker IN ({placeholders})", [*params, *etf_tickers]
+
+    def _query_stock_aggregates(
+        self,
+        source: str,
+        params: list,
+        order_by: str,
+        min_etf_count: int,
+        min_amount: Optional[float],
+        limit: int,
+    ) -> List[Dict]:
+        """종목별 집계 결과(source)에 조건/정렬/개수 제한을 적용하여 조회합니다."""
+        if order_by not in self._ORDER_CLAUSES:
+            raise ValueError(f"Unsupported order: {order_by}")
+
+        query = f"""
+            SELECT a.stock_ticker, COALESCE(s.name, a.stock_ticker) AS name,
+                   a.etf_count, a.etf_tickers, a.total_amount,
+                   a.avg_weight, a.min_weight, a.max_weight
+            FROM ({source}) a
+            LEFT JOIN data_stocks s ON a.stock_ticker = s.ticker
+            WHERE a.etf_count >= ?
+        """
+        params = [*params, min_etf_count]
+
+        if min_amount is not None:
+            query += " AND a.total_amount > ?"
+            params.append(min_amount)
+
+        query += f" ORDER BY {self._ORDER_CLAUSES[order_by]}"
+
+        if limit > 0:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self.db_conn.execute_query(query, tuple(params))
+
+        return [
+            {
+                "ticker": row["stock_ticker"],
+                "name": row["name"],
+                "etf_count": row["etf_count"],
+                "etf_tickers": row["etf_tickers"].split(","),
+                "total_amount": row["total_amount"],
+                "avg_weight": round(row["avg_weight"], 2),
+                "max_weight": round(row["max_weight"], 2),
+                "min_weight": round(row["min_weight"], 2),
+            }
+            for row in cursor.fetchall()
+        ]
+
+    @staticmethod
+    def _row_to_summary(row: Optional[sqlite3.Row]) -> Dict:
+        """요약 행을 딕셔너리로 변환합니다. (행이 없으면 0으로 채움)"""
+
+        def value(column: str) -> int:
+            return int(row[column] or 0) if row else 0
+
+        return {
+            "etf_count": value("etf_count"),
+            "stock_count": value("stock_count"),
+            "holding_count": value("holding_count"),
+            "distribution": {
+                "under_1": value("weight_under_1"),
+                "1_to_3": value("weight_1_to_3"),
+                "3_to_5": value("weight_3_to_5"),
+                "5_to_10": value("weight_5_to_10"),
+                "over_10": value("weight_over_10"),
+            },
+        }
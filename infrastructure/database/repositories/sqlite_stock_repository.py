@@ -11,7 +11,14 @@ from domain.entities.stock import Stock
 from domain.repositories.stock_repository import StockRepository
 from shared.exceptions import DatabaseException
 
+from infrastructure.cache import cache_tags, cached, invalidate_tags
 from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.repositories.sqlite_holding_diff_repository import (
+    SQLiteHoldingDiffRepository,
+)
+from infrastructure.database.repositories.sqlite_statistics_repository import (
+    SQLiteStatisticsRepository,
+)
 
 
 class SQLiteStockRepository(StockRepository, LoggerMixin):
@@ -36,6 +43,7 @@ class SQLiteStockRepository(StockRepository, LoggerMixin):
             conn = self.db_conn.get_connection()
             conn.execute(query, (entity.ticker, entity.name))
             conn.commit()
+            invalidate_tags([cache_tags.stock_tag(entity.ticker)])
 
             self.logger.debug(f"Saved stock: {entity.ticker}")
 
@@ -56,6 +64,8 @@ class SQLiteStockRepository(StockRepository, LoggerMixin):
             conn = self.db_conn.get_connection()
             conn.executemany(query, data)
             conn.commit()
+            # 없는 종목으로 캐시된 조회 결과도 함께 무효화
+            invalidate_tags([cache_tags.stock_tag(stock.ticker) for stock in entities])
 
             self.logger.info(f"Saved {len(entities)} stocks")
 
@@ -67,6 +77,12 @@ class SQLiteStockRepository(StockRepository, LoggerMixin):
         """ID(ticker)로 주식을 조회합니다."""
         return self.find_by_ticker(id)
 
+    # ✅ 캐싱 적용: 없는 종목(None)도 짧게 캐시 (종목 저장 시 태그로 무효화)
+    @cached(
+        ttl=600,
+        key_prefix="stock",
+        tags=lambda self, ticker: [cache_tags.STOCK_LIST, cache_tags.stock_tag(ticker)],
+    )
     def find_by_ticker(self, ticker: str) -> Optional[Stock]:
         """티커로 주식을 조회합니다."""
         try:
@@ -236,7 +252,11 @@ class SQLiteStockRepository(StockRepository, LoggerMixin):
 
             conn = self.db_conn.get_connection()
             conn.execute(query, (id,))
+            # 보유 종목이 함께 삭제(CASCADE)되므로 집계도 비움
+            SQLiteStatisticsRepository.clear_aggregates(conn)
+            SQLiteHoldingDiffRepository.clear_diffs(conn)
             conn.commit()
+            invalidate_tags([cache_tags.HOLDINGS, cache_tags.stock_tag(id)])
 
             self.logger.debug(f"Deleted stock: {id}")
 
@@ -251,7 +271,11 @@ class SQLiteStockRepository(StockRepository, LoggerMixin):
 
             conn = self.db_conn.get_connection()
             conn.execute(query)
+            # 보유 종목이 함께 삭제(CASCADE)되므로 집계도 비움
+            SQLiteStatisticsRepository.clear_aggregates(conn)
+            SQLiteHoldingDiffRepository.clear_diffs(conn)
             conn.commit()
+            invalidate_tags([cache_tags.STOCK_LIST, cache_tags.HOLDINGS])
 
             self.logger.warning("Deleted all stocks")
 
@@ -0,0 +1,8 @@
+"""
+Jobs Infrastructure Module
+오래 걸리는 작업을 백그라운드에서 실행하는 인프라 컴포넌트를 제공합니다.
+"""
+
+from infrastructure.jobs.background_runner import BackgroundJobRunner
+
+__all__ = ["BackgroundJobRunner"]
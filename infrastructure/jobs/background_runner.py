@@ -0,0 +1,128 @@
+"""
+Background Job Runner
+초기화/업데이트 작업을 요청 스레드와 분리하여 실행하는 작업 실행기입니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Dict, Optional
+
+from config.logging_config import LoggerMixin
+from domain.entities.job import Job, JobStatus
+from domain.repositories.job_repository import JobRepository
+
+
+class BackgroundJobRunner(LoggerMixin):
+    """
+    백그라운드 작업 실행기
+
+    작업은 단일 워커 스레드에서 순서대로 실행됩니다. 수집 작업은 모두
+    같은 DB와 외부 API를 사용하므로 동시에 실행하지 않습니다.
+    같은 종류의 작업이 이미 대기/실행 중이면 새로 제출하지 않고
+    기존 작업을 반환합니다.
+
+    진행 상황은 작업 함수가 JobRepository에 저장하며, 클라이언트는
+    작업 ID로 조회합니다.
+
+    Args:
+        job_repository: 작업 리포지토리
+
+    Examples:
+        >>> runner = BackgroundJobRunner(job_repo)
+        >>> job = runner.submit(job, use_case.run_job)
+        >>> job_repo.find_by_id(job.id).progress_percent
+        40.0
+    """
+
+    INTERRUPTED_MESSAGE = (
+        "서버 재시작으로 작업이 중단되었습니다. 다시 실행하면 이어서 진행합니다."
+    )
+
+    def __init__(self, job_repository: JobRepository):
+        self.job_repo = job_repository
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="job-runner"
+        )
+        self._active: Dict[str, Job] = {}  # job_type -> 대기/실행 중인 작업
+        self._lock = Lock()
+
+    def submit(self, job: Job, work: Callable[[Job], Job]) -> Job:
+        """
+        작업을 백그라운드 실행 대기열에 추가합니다.
+
+        Args:
+            job: 실행할 작업 (저장된 상태여야 함)
+            work: 작업을 실행하고 최종 상태를 반환하는 함수
+
+        Returns:
+            제출된 작업, 같은 종류의 작업이 이미 있으면 그 작업
+        """
+        with self._lock:
+            active = self._active.get(job.job_type)
+            if active is not None:
+                self.logger.info(
+                    f"Job {active.id} ({job.job_type}) is already active, "
+                    f"ignoring {job.id}"
+                )
+                return active
+
+            self._active[job.job_type] = job
+
+        self._executor.submit(self._run, job, work)
+        self.logger.info(f"Submitted job {job.id} ({job.job_type})")
+        return job
+
+    def find_active(self, job_type: str) -> Optional[Job]:
+        """대기/실행 중인 작업의 최신 상태를 조회합니다."""
+        with self._lock:
+            active = self._active.get(job_type)
+
+        if active is None:
+            return None
+
+        return self.job_repo.find_by_id(active.id) or active
+
+    def recover_interrupted(self) -> int:
+        """
+        이전 프로세스에서 끝나지 않은 작업을 실패 상태로 정리합니다.
+
+        서버 시작 시 한 번 호출합니다. 체크포인트는 유지되므로
+        초기화 작업은 다시 요청하면 이어서 실행됩니다.
+
+        Returns:
+            정리한 작업 수
+        """
+        interrupted = self.job_repo.find_by_status(
+            [JobStatus.PENDING, JobStatus.RUNNING]
+        )
+
+        for job in interrupted:
+            self.job_repo.save(job.fail(self.INTERRUPTED_MESSAGE))
+
+        if interrupted:
+            self.logger.warning(f"Marked {len(interrupted)} interrupted jobs as failed")
+
+        return len(interrupted)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """실행기를 종료합니다."""
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job: Job, work: Callable[[Job], Job]) -> None:
+        """작업을 실행하고, 예외가 나면 최신 상태를 실패로 저장합니다."""
+        try:
+            finished = work(job)
+            self.logger.info(f"Job {job.id} finished: {finished.status}")
+
+        except Exception as e:
+            self.logger.error(f"Job {job.id} failed: {e}", exc_info=True)
+            try:
+                latest = self.job_repo.find_by_id(job.id) or job
+                if not latest.is_finished():
+                    self.job_repo.save(latest.fail(str(e)))
+            except Exception as save_error:
+                self.logger.warning(f"Failed to save job failure: {save_error}")
+
+        finally:
+            with self._lock:
+                self._active.pop(job.job_type, None)
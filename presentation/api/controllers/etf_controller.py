@@ -4,12 +4,21 @@ ETF Controller (개선됨)
 ✅ 공통 유틸리티 사용
 """
 
+import json
+
+from application.queries.weight_change_feed_query import WeightChangeFeedQuery
 from application.queries.weight_history_query import WeightHistoryQuery
 from application.use_cases.export_data import ExportDataUseCase
 from application.use_cases.get_holdings_comparison import GetHoldingsComparisonUseCase
 from domain.repositories.etf_repository import ETFRepository
-from flask import jsonify
-from shared.utils.request_utils import get_int_param, parse_date_from_request
+from flask import Response, jsonify, stream_with_context
+from shared.utils.request_utils import (
+    get_float_param,
+    get_int_param,
+    get_list_param,
+    get_str_param,
+    parse_date_from_request,
+)
 
 from presentation.api.decorators import handle_controller_errors, log_api_call
 
@@ -30,11 +39,13 @@ class ETFController:
         get_holdings_comparison_use_case: GetHoldingsComparisonUseCase,
         export_data_use_case: ExportDataUseCase,
         weight_history_query: WeightHistoryQuery,
+        weight_change_feed_query: WeightChangeFeedQuery,
     ):
         self.etf_repo = etf_repository
         self.get_holdings_comparison_uc = get_holdings_comparison_use_case
         self.export_data_uc = export_data_use_case
         self.weight_history_query = weight_history_query
+        self.weight_change_feed_query = weight_change_feed_query
 
     @log_api_call
     @handle_controller_errors("ETF 목록을 가져오는 데 실패했습니다.")
@@ -93,6 +104,54 @@ class ETFController:
         result_dto = self.weight_history_query.execute(etf_ticker, stock_ticker)
         return jsonify(result_dto.to_dict()), 200
 
+    @log_api_call
+    @handle_controller_errors("비중 추이를 가져오는 데 실패했습니다.")
+    def get_weight_history_batch(self):
+        """
+        여러 ETF × 종목 조합의 비중 추이를 한 번에 조회합니다.
+
+        ✅ 추가: 날짜 축을 공유하는 열 단위 JSON으로 응답
+        """
+        result_dto = self.weight_history_query.execute_batch(
+            etf_tickers=get_list_param("etfs"),
+            stock_tickers=get_list_param("stocks"),
+            start_date=parse_date_from_request("start_date"),
+            end_date=parse_date_from_request("end_date"),
+        )
+        return jsonify(result_dto.to_dict()), 200
+
+    @log_api_call
+    @handle_controller_errors("비중 변화 피드를 가져오는 데 실패했습니다.")
+    def get_weight_change_feed(self):
+        """
+        전체 ETF의 비중 변화 피드를 조회합니다.
+
+        ✅ 추가: ETF마다 비교 API를 호출하지 않고 한 번에 조회
+        format=ndjson이면 첫 줄에 요약, 이후 한 줄에 변화 하나씩 스트리밍합니다.
+        """
+        feed = self.weight_change_feed_query.execute(
+            current_date=parse_date_from_request("current_date"),
+            previous_date=parse_date_from_request("previous_date"),
+            threshold=get_float_param("threshold", 0.5),
+            theme=get_str_param("theme") or None,
+            statuses=get_list_param("status") or None,
+            limit=get_int_param("limit", 0),
+        )
+
+        if get_str_param("format") != "ndjson":
+            return jsonify(feed.to_dict()), 200
+
+        def generate():
+            header = feed.to_dict()
+            header.pop("changes")
+            yield json.dumps(header, ensure_ascii=False) + "\n"
+            for change in feed.changes:
+                yield json.dumps(change.to_dict(), ensure_ascii=False) + "\n"
+
+        return Response(
+            stream_with_context(generate()), mimetype="application/x-ndjson"
+        ), 200
+
     @log_api_call
     @handle_controller_errors("상위 보유 종목을 가져오는 데 실패했습니다.")
     def get_top_holdings(self, ticker: str):
@@ -6,7 +6,11 @@ Statistics Controller (개선됨)
 
 from application.use_cases.get_statistics import GetStatisticsUseCase
 from flask import jsonify
-from shared.utils.request_utils import get_int_param, parse_date_from_request
+from shared.utils.request_utils import (
+    get_int_param,
+    get_str_param,
+    parse_date_from_request,
+)
 
 from presentation.api.decorators import handle_controller_errors, log_api_call
 
@@ -100,3 +104,21 @@ class StatisticsController:
             return jsonify({"status": "error", "message": result.error}), 400
 
         return jsonify(result.value), 200
+
+    @log_api_call
+    @handle_controller_errors("ETF 중복도를 가져오는 데 실패했습니다.")
+    def get_etf_overlap_matrix(self):
+        """전체 ETF 쌍의 종목 중복도 행렬을 조회합니다."""
+        date = parse_date_from_request("date")
+        theme = get_str_param("theme") or None
+        min_overlap = get_int_param("min_overlap", 1)
+        top_n = get_int_param("top_n", 20)
+
+        result = self.get_statistics_uc.get_etf_overlap_matrix(
+            date=date, theme=theme, min_overlap=min_overlap, top_n=top_n
+        )
+
+        if result.is_failure():
+            return jsonify({"status": "error", "message": result.error}), 400
+
+        return jsonify(result.value.to_dict()), 200
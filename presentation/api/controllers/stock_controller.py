@@ -0,0 +1,32 @@
+"""
+Stock Controller
+종목 중심 조회 API를 처리합니다.
+"""
+
+from application.queries.stock_ownership_query import StockOwnershipQuery
+from flask import jsonify
+from shared.utils.request_utils import parse_date_from_request
+
+from presentation.api.decorators import handle_controller_errors, log_api_call
+
+
+class StockController:
+    """
+    종목 컨트롤러
+
+    특정 종목을 기준으로 보유 ETF 정보를 조회합니다.
+    """
+
+    def __init__(self, stock_ownership_query: StockOwnershipQuery):
+        self.stock_ownership_query = stock_ownership_query
+
+    @log_api_call
+    @handle_controller_errors("종목 보유 추이를 가져오는 데 실패했습니다.")
+    def get_stock_ownership(self, ticker: str):
+        """종목을 보유한 ETF들의 기간별 추이를 조회합니다."""
+        result_dto = self.stock_ownership_query.execute(
+            stock_ticker=ticker,
+            start_date=parse_date_from_request("start_date"),
+            end_date=parse_date_from_request("end_date"),
+        )
+        return jsonify(result_dto.to_dict()), 200
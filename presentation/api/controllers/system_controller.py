@@ -3,9 +3,14 @@ System Controller (개선됨)
 ✅ 데코레이터로 중복 코드 제거
 """
 
+from threading import Lock
+
 from application.use_cases.initialize_system import InitializeSystemUseCase
 from application.use_cases.update_etf_data import UpdateETFDataUseCase
-from flask import jsonify
+from domain.entities.job import Job
+from domain.repositories.job_repository import JobRepository
+from flask import jsonify, request, url_for
+from infrastructure.jobs import BackgroundJobRunner
 
 from presentation.api.decorators import handle_controller_errors, log_api_call
 
@@ -16,60 +21,173 @@ class SystemController:
 
     ✅ 개선사항:
     - 데코레이터로 에러 처리 자동화
+    - 초기화/업데이트는 백그라운드 작업으로 실행하고 202로 즉시 응답
     """
 
     def __init__(
         self,
         initialize_system_use_case: InitializeSystemUseCase,
         update_etf_data_use_case: UpdateETFDataUseCase,
+        job_runner: BackgroundJobRunner,
+        job_repository: JobRepository,
     ):
         self.initialize_system_uc = initialize_system_use_case
         self.update_etf_data_uc = update_etf_data_use_case
+        self.job_runner = job_runner
+        self.job_repo = job_repository
+
+        # 작업 준비(생성/재개 판단)와 제출을 한 번에 처리하기 위한 잠금
+        self._submit_lock = Lock()
 
     @log_api_call
     @handle_controller_errors("시스템 초기화 중 오류가 발생했습니다.")
     def initialize(self):
-        """시스템을 초기화합니다."""
-        result = self.initialize_system_uc.execute()
-
-        if result.is_failure():
-            return jsonify({"status": "error", "message": result.error}), 400
-
-        data = result.value
-
-        return jsonify(
-            {
-                "status": "success",
-                "initialized": data["initialized"],
-                "stocks_collected": data["stocks_collected"],
-                "etfs_collected": data["etfs_collected"],
-                "days_collected": data["days_collected"],
-                "message": data["message"],
-            }
-        ), 200
+        """
+        시스템 초기화 작업을 시작합니다.
+
+        ✅ 개선: 미완료 초기화 작업이 있으면 이어서 실행합니다.
+        요청 본문의 days로 수집 기간을 지정할 수 있습니다. (최대 MAX_COLLECT_DAYS)
+        ✅ 개선: 작업은 백그라운드에서 실행되며 202와 작업 ID를 바로 반환합니다.
+        """
+        payload = request.get_json(silent=True) or {}
+        days = payload.get("days")
+        if days is not None and (
+            isinstance(days, bool) or not isinstance(days, int) or days <= 0
+        ):
+            return jsonify(
+                {"status": "error", "message": "days는 양의 정수여야 합니다."}
+            ), 400
+
+        job_type = InitializeSystemUseCase.JOB_TYPE
+
+        with self._submit_lock:
+            active = self.job_runner.find_active(job_type)
+            if active is not None:
+                return self._accepted(active, "이미 초기화 작업이 진행 중입니다.")
+
+            result = self.initialize_system_uc.prepare(days=days)
+            if result.is_failure():
+                return jsonify({"status": "error", "message": result.error}), 400
+
+            job = result.value["job"]
+            if job is None:
+                return jsonify(
+                    {
+                        "status": "success",
+                        "initialized": False,
+                        "job_id": None,
+                        "message": InitializeSystemUseCase.ALREADY_INITIALIZED_MESSAGE,
+                    }
+                ), 200
+
+            job = self.job_runner.submit(job, self.initialize_system_uc.run_job)
+
+        message = (
+            "중단된 초기화 작업을 이어서 실행합니다."
+            if result.value["resumed"]
+            else "초기화 작업을 시작했습니다."
+        )
+        return self._accepted(job, message, resumed=result.value["resumed"])
 
     @log_api_call
     @handle_controller_errors("데이터 업데이트 중 오류가 발생했습니다.")
     def update_data(self):
-        """데이터를 업데이트합니다."""
-        result = self.update_etf_data_uc.execute()
+        """
+        데이터 업데이트 작업을 시작합니다.
+
+        ✅ 개선: 작업은 백그라운드에서 실행되며 202와 작업 ID를 바로 반환합니다.
+        ✅ 수정: 초기화 작업이 진행 중이면 409와 그 작업 ID를 반환합니다.
+        (일부만 수집된 최신 날짜로 기간을 잡아 초기화 범위를 다시 받지 않도록)
+        """
+        job_type = UpdateETFDataUseCase.JOB_TYPE
+
+        with self._submit_lock:
+            active = self.job_runner.find_active(job_type)
+            if active is not None:
+                return self._accepted(active, "이미 업데이트 작업이 진행 중입니다.")
+
+            initializing = self.job_runner.find_active(InitializeSystemUseCase.JOB_TYPE)
+            if initializing is not None:
+                return self._conflict(
+                    initializing,
+                    "초기화 작업이 진행 중입니다. 완료된 후 업데이트하세요.",
+                )
+
+            result = self.update_etf_data_uc.prepare()
+            if result.is_failure():
+                return jsonify({"status": "error", "message": result.error}), 400
+
+            data = result.value
+            if data["job"] is None:
+                return jsonify(
+                    {
+                        "status": "success",
+                        "updated": False,
+                        "job_id": None,
+                        "start_date": data["start_date"],
+                        "end_date": data["end_date"],
+                        "message": UpdateETFDataUseCase.UP_TO_DATE_MESSAGE,
+                    }
+                ), 200
+
+            job = self.job_runner.submit(data["job"], self.update_etf_data_uc.run_job)
+
+        return self._accepted(job, "업데이트 작업을 시작했습니다.")
 
-        if result.is_failure():
-            return jsonify({"status": "error", "message": result.error}), 400
+    @log_api_call
+    @handle_controller_errors("작업 조회 중 오류가 발생했습니다.")
+    def get_job(self, job_id: str):
+        """
+        ✅ 추가: 작업 진행 상황을 조회합니다.
+
+        완료 일수, 처리한 ETF 수, 저장한 행 수, 남은 예상 시간을 포함합니다.
+        """
+        job = self.job_repo.find_by_id(job_id)
+        if job is None:
+            return jsonify(
+                {"status": "error", "message": "작업을 찾을 수 없습니다."}
+            ), 404
 
-        data = result.value
+        return jsonify(job.to_dict()), 200
+
+    @log_api_call
+    @handle_controller_errors("작업 조회 중 오류가 발생했습니다.")
+    def get_latest_jobs(self):
+        """✅ 추가: 작업 종류별 가장 최근 작업을 조회합니다."""
+        jobs = {}
+        for job_type in (
+            InitializeSystemUseCase.JOB_TYPE,
+            UpdateETFDataUseCase.JOB_TYPE,
+        ):
+            job = self.job_repo.find_latest(job_type)
+            jobs[job_type] = job.to_dict() if job else None
+
+        return jsonify(jobs), 200
+
+    def _conflict(self, job: Job, message: str):
+        """다른 작업 진행 중 응답 (409)"""
+        return jsonify(
+            {
+                "status": "error",
+                "job_id": job.id,
+                "status_url": url_for("api.get_job", job_id=job.id),
+                "job": job.to_dict(),
+                "message": message,
+            }
+        ), 409
 
+    def _accepted(self, job: Job, message: str, resumed: bool = False):
+        """작업 접수 응답 (202)"""
         return jsonify(
             {
-                "status": "success",
-                "updated": data["updated"],
-                "etfs_updated": data["etfs_updated"],
-                "days_updated": data["days_updated"],
-                "start_date": data["start_date"],
-                "end_date": data["end_date"],
-                "message": data["message"],
+                "status": "accepted",
+                "job_id": job.id,
+                "resumed": resumed,
+                "status_url": url_for("api.get_job", job_id=job.id),
+                "job": job.to_dict(),
+                "message": message,
             }
-        ), 200
+        ), 202
 
     @log_api_call
     @handle_controller_errors("시스템 상태 조회 중 오류가 발생했습니다.")
@@ -8,6 +8,7 @@ from flask import Blueprint
 from presentation.api.routes.config_routes import register_config_routes
 from presentation.api.routes.etf_routes import register_etf_routes
 from presentation.api.routes.statistics_routes import register_statistics_routes
+from presentation.api.routes.stock_routes import register_stock_routes
 from presentation.api.routes.system_routes import register_system_routes
 
 
@@ -24,6 +25,7 @@ def register_all_routes(app):
     # 각 라우트 등록
     register_etf_routes(api_bp)
     register_statistics_routes(api_bp)
+    register_stock_routes(api_bp)
     register_system_routes(api_bp)
     register_config_routes(api_bp)
 
@@ -23,6 +23,38 @@ def register_etf_routes(api_bp: Blueprint):
         controller = api_bp.etf_controller
         return controller.get_all_etfs()
 
+    @api_bp.route("/etfs/weight-history", methods=["GET"])
+    def get_weight_history_batch():
+        """
+        여러 ETF × 종목 비중 추이 일괄 조회
+
+        Query Parameters:
+            - etfs: ETF 코드 목록, 쉼표 구분 (필수)
+            - stocks: 종목 코드 목록, 쉼표 구분 (필수)
+            - start_date: 시작일 (선택)
+            - end_date: 종료일 (선택)
+        """
+        controller = api_bp.etf_controller
+        return controller.get_weight_history_batch()
+
+    @api_bp.route("/etfs/weight-changes", methods=["GET"])
+    def get_weight_change_feed():
+        """
+        전체 ETF 비중 변화 피드 조회
+
+        Query Parameters:
+            - current_date: 현재 날짜 (선택, 기본값: 최신)
+            - previous_date: 이전 날짜 (선택, 기본값: current_date의 이전)
+            - threshold: 최소 변화량 %p (선택, 기본값: 0.5)
+            - theme: ETF명 테마 키워드 (선택)
+            - status: new,removed,increased,decreased,unchanged 중 쉼표 구분
+              (선택, 기본값: unchanged 제외 전체)
+            - limit: 최대 개수 (선택, 기본값: 전체)
+            - format: ndjson이면 한 줄에 한 건씩 스트리밍 (선택)
+        """
+        controller = api_bp.etf_controller
+        return controller.get_weight_change_feed()
+
     @api_bp.route("/etf/<ticker>", methods=["GET"])
     def get_etf_detail(ticker):
         """특정 ETF 상세 정보 조회"""
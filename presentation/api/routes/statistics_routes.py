@@ -72,3 +72,17 @@ def register_statistics_routes(api_bp: Blueprint):
         """
         controller = api_bp.statistics_controller
         return controller.get_weight_distribution()
+
+    @api_bp.route("/stats/etf-overlap", methods=["GET"])
+    def get_etf_overlap_matrix():
+        """
+        전체 ETF 쌍 종목 중복도 행렬 조회
+
+        Query Parameters:
+            - date: 기준일 (선택, 기본값: 최신)
+            - theme: ETF명 테마 키워드 (선택, 기본값: 전체)
+            - min_overlap: 상위 쌍의 최소 중복 종목 수 (선택, 기본값: 1)
+            - top_n: 상위 쌍 개수 (선택, 기본값: 20)
+        """
+        controller = api_bp.statistics_controller
+        return controller.get_etf_overlap_matrix()
@@ -0,0 +1,27 @@
+"""
+Stock Routes
+종목 관련 API 라우트를 정의합니다.
+"""
+
+from flask import Blueprint
+
+
+def register_stock_routes(api_bp: Blueprint):
+    """
+    종목 관련 라우트를 등록합니다.
+
+    Args:
+        api_bp: API Blueprint
+    """
+
+    @api_bp.route("/stock/<ticker>/ownership", methods=["GET"])
+    def get_stock_ownership(ticker):
+        """
+        종목 보유 ETF 추이 조회
+
+        Query Parameters:
+            - start_date: 시작일 (선택, 기본값: 처음부터)
+            - end_date: 종료일 (선택, 기본값: 최신까지)
+        """
+        controller = api_bp.stock_controller
+        return controller.get_stock_ownership(ticker)
@@ -20,6 +20,7 @@ def register_system_routes(api_bp: Blueprint):
         시스템 초기화
 
         데이터베이스가 비어있을 경우 기본 설정과 초기 데이터를 수집합니다.
+        작업은 백그라운드에서 실행되며 202와 작업 ID를 반환합니다.
         """
         controller = api_bp.system_controller
         return controller.initialize()
@@ -30,10 +31,32 @@ def register_system_routes(api_bp: Blueprint):
         데이터 업데이트
 
         최신 날짜부터 현재까지의 데이터를 수집하여 업데이트합니다.
+        작업은 백그라운드에서 실행되며 202와 작업 ID를 반환합니다.
+        초기화 작업이 진행 중이면 409와 초기화 작업 ID를 반환합니다.
         """
         controller = api_bp.system_controller
         return controller.update_data()
 
+    @api_bp.route("/system/jobs/<job_id>", methods=["GET"])
+    def get_job(job_id):
+        """
+        작업 진행 상황 조회
+
+        완료 일수, 처리한 ETF 수, 저장한 행 수, 남은 예상 시간을 반환합니다.
+        """
+        controller = api_bp.system_controller
+        return controller.get_job(job_id)
+
+    @api_bp.route("/system/jobs", methods=["GET"])
+    def get_latest_jobs():
+        """
+        최근 작업 조회
+
+        작업 종류(initialize, update)별 가장 최근 작업을 반환합니다.
+        """
+        controller = api_bp.system_controller
+        return controller.get_latest_jobs()
+
     @api_bp.route("/system/status", methods=["GET"])
     def get_system_status():
         """
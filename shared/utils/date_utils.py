@@ -4,6 +4,7 @@
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Optional
 
 
@@ -20,6 +21,17 @@ def from_date_string(date_str: str, format: str = "%Y-%m-%d") -> datetime:
         raise ValueError(f"Invalid date format '{date_str}': {e}")
 
 
+@lru_cache(maxsize=4096)
+def parse_date_cached(date_str: str) -> datetime:
+    """
+    문자열(YYYY-MM-DD)을 datetime으로 변환 (결과 캐시)
+
+    DB에서 읽은 행처럼 같은 날짜 문자열이 반복될 때 사용합니다.
+    datetime은 불변이므로 같은 객체를 공유해도 안전합니다.
+    """
+    return from_date_string(date_str)
+
+
 def to_krx_format(date: datetime) -> str:
     """KRX API 형식으로 변환 (YYYYMMDD)"""
     return date.strftime("%Y%m%d")
@@ -4,7 +4,7 @@ Flask request 처리를 위한 공통 함수를 제공합니다.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from flask import request
 
@@ -87,3 +87,36 @@ def get_bool_param(param_name: str, default: bool = False) -> bool:
     elif value in ("false", "0", "no", "off"):
         return False
     return default
+
+
+def get_float_param(param_name: str, default: float = None) -> Optional[float]:
+    """
+    Flask request에서 실수 파라미터를 가져옵니다.
+
+    Args:
+        param_name: 쿼리 파라미터 이름
+        default: 기본값
+
+    Returns:
+        파라미터 값, 없으면 기본값
+    """
+    return request.args.get(param_name, default, type=float)
+
+
+def get_list_param(param_name: str) -> List[str]:
+    """
+    Flask request에서 쉼표로 구분된 목록 파라미터를 가져옵니다.
+
+    Args:
+        param_name: 쿼리 파라미터 이름
+
+    Returns:
+        공백을 제거한 값 목록, 없으면 빈 리스트
+
+    Examples:
+        >>> # GET /api/etfs/weight-history?etfs=152100,091160
+        >>> get_list_param('etfs')
+        ['152100', '091160']
+    """
+    value = request.args.get(param_name, "")
+    return [item.strip() for item in value.split(",") if item.strip()]
@@ -242,21 +242,63 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     }
 
+    // --- 백그라운드 작업 (✅ 추가) ---
+    const JOB_POLL_INTERVAL_MS = 2000;
+
+    function formatEta(seconds) {
+        if (seconds === null || seconds === undefined) return '계산 중';
+        const total = Math.round(seconds);
+        const minutes = Math.floor(total / 60);
+        const secs = total % 60;
+        return minutes > 0 ? `${minutes}분 ${secs}초` : `${secs}초`;
+    }
+
+    function formatJobProgress(title, job) {
+        return `${title} ${job.done_units}/${job.total_units}일 (${job.progress_percent}%) · ` +
+            `ETF ${job.etfs_done.toLocaleString('ko-KR')}개 · ` +
+            `${job.rows_written.toLocaleString('ko-KR')}행 저장 · ` +
+            `남은 시간 ${formatEta(job.eta_seconds)}`;
+    }
+
+    async function waitForJob(jobId, title) {
+        while (true) {
+            const response = await fetch(`/api/system/jobs/${jobId}`);
+            const job = await response.json();
+
+            if (!response.ok) {
+                throw new Error(job.message || '작업 상태를 조회하지 못했습니다.');
+            }
+            if (job.status === 'completed' || job.status === 'failed') {
+                return job;
+            }
+
+            loadingText.textContent = formatJobProgress(title, job);
+            await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+        }
+    }
+
+    async function runSystemJob(url, title, defaultError) {
+        const response = await fetch(url, { method: 'POST' });
+        const result = await response.json();
+
+        // 202: 백그라운드 작업 접수 → 완료될 때까지 진행 상황 표시
+        if (response.status === 202) {
+            const job = await waitForJob(result.job_id, title);
+            alert(job.status === 'completed' ? job.message : (job.error || defaultError));
+        } else if (result.status === 'success') {
+            alert(result.message);
+        } else {
+            alert(result.message || defaultError);
+        }
+    }
+
     // --- API 호출 (✅ 수정됨) ---
     async function initializeApp() {
         showLoading('애플리케이션을 초기화하고 있습니다. 잠시만 기다려주세요...');
         try {
-            // ✅ 수정: 올바른 엔드포인트 사용
-            const response = await fetch('/api/system/initialize', { method: 'POST' });
-            const result = await response.json();
-            
-            // ✅ 수정: 응답 구조 처리
-            if (result.status === 'success') {
-                alert(result.message);
-            } else {
-                alert(result.message || '초기화 중 오류가 발생했습니다.');
-            }
-            
+            // ✅ 수정: 백그라운드 작업 진행 상황 표시
+            await runSystemJob('/api/system/initialize', '초기화 중:', '초기화 중 오류가 발생했습니다.');
+
             await fetchEtfList();
             await loadThemes();
         } catch (error) {
@@ -428,17 +470,9 @@ document.addEventListener('DOMContentLoaded', () => {
     refreshBtn.addEventListener('click', async () => {
         showLoading('최신 데이터로 업데이트 중입니다...');
         try {
-            // ✅ 수정: 올바른 엔드포인트 사용
-            const response = await fetch('/api/system/update', { method: 'POST' });
-            const result = await response.json();
-            
-            // ✅ 수정: 응답 구조 처리
-            if (result.status === 'success') {
-                alert(result.message);
-            } else {
-                alert(result.message || '데이터 업데이트 중 오류가 발생했습니다.');
-            }
-            
+            // ✅ 수정: 백그라운드 작업 진행 상황 표시
+            await runSystemJob('/api/system/update', '업데이트 중:', '데이터 업데이트 중 오류가 발생했습니다.');
+
             const activeEtf = etfList.querySelector('.active');
             if (activeEtf && currentView === 'etf') {
                 await fetchEtfDetails(activeEtf.dataset.ticker);
@@ -0,0 +1,31 @@
+"""
+Test Configuration
+여러 테스트 모듈이 공유하는 픽스처입니다.
+"""
+
+import pytest
+
+from infrastructure.cache import cache_manager
+from infrastructure.database.connection import db_connection
+from infrastructure.database.migrations import DatabaseMigrations
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """
+    임시 DB 파일로 연결을 전환합니다.
+
+    캐시 키에 리포지토리 인스턴스가 들어가지 않으므로, 이전 DB에서 캐시된 값이
+    새 DB 조회에 쓰이지 않도록 전환 전후에 전역 캐시를 비웁니다.
+    """
+    original_path = db_connection.db_path
+    db_connection.close_connection()
+    db_connection.db_path = str(tmp_path / "test.db")
+    DatabaseMigrations(db_connection).create_tables()
+    cache_manager.clear()
+
+    yield db_connection
+
+    cache_manager.clear()
+    db_connection.close_connection()
+    db_connection.db_path = original_path
@@ -0,0 +1,218 @@
+"""
+Cache Manager Test
+항목별 TTL, LRU 제거, 메모리 상한, 백그라운드 만료 정리, 태그 무효화,
+single-flight, stale-while-revalidate, None 결과 캐시, 구조화된 캐시 키를 검증하는 테스트
+"""
+
+import sys
+import threading
+import time
+from datetime import date, datetime
+
+from infrastructure.cache import MISSING, CacheManager, cache_manager, cached
+
+# 패키지의 cache_manager 속성은 전역 인스턴스이므로 모듈은 sys.modules에서 가져옴
+cache_module = sys.modules[CacheManager.__module__]
+
+
+class FakeClock:
+    """time.monotonic 대체용 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_each_entry_uses_its_own_ttl(monkeypatch):
+    """set()에 넘긴 TTL이 항목마다 적용되는지 확인합니다."""
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    cache = CacheManager(default_ttl=300, sweep_interval=0)
+
+    cache.set("short", "a", ttl=10)
+    cache.set("long", "b", ttl=600)
+    cache.set("default", "c")
+
+    clock.now += 301
+    assert cache.get("short") is None
+    assert cache.get("default") is None
+    assert cache.get("long") == "b"
+    assert cache.get_ttl("long") == 299
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    """상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거되는지 확인합니다."""
+    cache = CacheManager(max_entries=2, max_bytes=0, sweep_interval=0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # a를 최근 사용으로
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.get_stats()["evictions"] == 1
+
+    budget = CacheManager(max_entries=0, max_bytes=20_000, sweep_interval=0)
+    for i in range(10):
+        budget.set(f"k{i}", list(range(500)))
+
+    stats = budget.get_stats()
+    assert 0 < stats["total_items"] < 10
+    assert stats["total_bytes"] <= 20_000
+    assert budget.get("k9") is not None
+
+    budget.set("huge", list(range(100_000)))
+    assert budget.get("huge") is None
+
+
+def test_sweeper_removes_expired_entries():
+    """백그라운드 정리 스레드가 조회 없이도 만료 항목을 지우는지 확인합니다."""
+    cache = CacheManager(sweep_interval=0.05)
+    try:
+        cache.set("gone", "x", ttl=0.01)
+        time.sleep(0.3)
+        assert cache.get_stats()["total_items"] == 0
+    finally:
+        cache.stop_sweeper()
+
+
+def test_tag_invalidation_removes_only_tagged_entries():
+    """태그 무효화가 해당 태그 항목만 지우고, 계산 중 무효화된 값은 저장하지 않는지 확인합니다."""
+    cache = CacheManager(max_entries=0, max_bytes=0, sweep_interval=0)
+    for i in range(1000):
+        cache.set(f"other:{i}", i, tags=[f"etf:{i}"])
+    cache.set("dates:152100", ["2024-01-02"], tags=["holdings", "etf:152100"])
+    cache.set("snapshot:2024-01-02", "snap", tags=["holdings", "date:2024-01-02"])
+    cache.set("etfs", ["152100"], tags=["etf-list"])
+
+    assert cache.invalidate_tags(["etf:152100", "date:2024-01-02"]) == 2
+    assert cache.get("dates:152100") is None
+    assert cache.get("snapshot:2024-01-02") is None
+    assert cache.get("etfs") == ["152100"]
+    assert cache.get_stats()["total_items"] == 1001
+
+    versions = cache.tag_versions(["etf-list"])
+    cache.invalidate_tags(["etf-list"])  # 계산 도중 무효화
+    cache.set("etfs", ["152100", "091160"], tags=["etf-list"], versions=versions)
+    assert cache.get("etfs") is None
+
+
+def test_concurrent_misses_compute_once():
+    """같은 키의 동시 미스가 한 번만 계산되고 모두 같은 결과를 받는지 확인합니다."""
+    cache = CacheManager(sweep_interval=0)
+    calls = []
+    started = threading.Event()
+
+    def loader():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_set("k", loader)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == ["value"] * 8
+    assert cache.get_stats()["single_flight_waits"] == 7
+
+
+def test_stale_value_served_while_refreshing(monkeypatch):
+    """만료 후 stale_ttl 동안 이전 값을 반환하고 백그라운드에서 갱신하는지 확인합니다."""
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    cache = CacheManager(sweep_interval=0)
+    refreshed = threading.Event()
+
+    def refresh():
+        refreshed.set()
+        return "new"
+
+    cache.get_or_set("k", lambda: "old", ttl=10, stale_ttl=60)
+    clock.now += 30
+    assert cache.get_or_set("k", refresh, ttl=10, stale_ttl=60) == "old"
+    assert refreshed.wait(1)
+
+    deadline = time.time() + 1
+    while cache.get("k") != "new" and time.time() < deadline:
+        time.sleep(0.01)
+    assert cache.get("k") == "new"
+
+    clock.now += 100  # 만료 값 제공 기간도 지남
+    assert cache.get_or_set("k", lambda: "fresh", ttl=10) == "fresh"
+
+
+def test_none_results_cached_with_negative_ttl(monkeypatch):
+    """None 결과가 짧은 TTL로 캐시되고 적중/미스가 따로 집계되는지 확인합니다."""
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    cache = CacheManager(default_ttl=600, negative_ttl=30, sweep_interval=0)
+    calls = []
+
+    def lookup():
+        calls.append(1)
+        return None
+
+    assert cache.get("unknown", MISSING) is MISSING
+    for _ in range(5):
+        assert cache.get_or_set("unknown", lookup, tags=["etf:999999"]) is None
+    assert len(calls) == 1
+    assert cache.get("unknown", MISSING) is None
+
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["negative_hits"], stats["hits"]) == (2, 5, 0)
+    assert stats["negative_items"] == 1
+
+    clock.now += 31
+    cache.get_or_set("unknown", lookup, tags=["etf:999999"])
+    assert len(calls) == 2
+
+    cache.invalidate_tags(["etf:999999"])  # 새 ETF 저장 시
+    assert cache.get("unknown", MISSING) is MISSING
+
+
+class _CountingRepo:
+    calls = 0
+
+    @cached(ttl=60, key_prefix="test:repo")
+    def load(self, tickers, day):
+        _CountingRepo.calls += 1
+        return len(tickers)
+
+
+def test_cache_key_ignores_self_and_normalizes_args():
+    """인스턴스가 달라도, 리스트/튜플과 date/datetime 인자가 같은 키로 공유되는지 확인합니다."""
+    cache_manager.clear_pattern("test:repo:*")
+
+    assert _CountingRepo().load(["a", "b"], datetime(2024, 1, 2)) == 2
+    assert _CountingRepo().load(("a", "b"), date(2024, 1, 2)) == 2
+    assert _CountingRepo().load(tickers=["a", "b"], day=datetime(2024, 1, 2)) == 2
+    assert _CountingRepo.calls == 2  # 위치 인자 1번 + 키워드 인자 1번
+
+    assert cache_manager.clear_pattern("test:repo:*") == 2
+
+
+def test_clear_discards_values_computed_before_it():
+    """clear() 전에 시작된 계산 결과가 clear() 후에 저장되지 않는지 확인합니다."""
+    cache = CacheManager(sweep_interval=0)
+
+    def loader():
+        cache.clear()  # 계산 도중 /api/cache/clear
+        return "pre-clear"
+
+    assert cache.get_or_set("k", loader) == "pre-clear"
+    assert cache.get("k", MISSING) is MISSING
+
+    versions = cache.tag_versions([])
+    cache.clear()
+    cache.set("untagged", "old", versions=versions)
+    assert cache.get("untagged", MISSING) is MISSING
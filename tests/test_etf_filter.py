@@ -0,0 +1,55 @@
+"""
+ETF Filter Test
+컴파일된 다중 키워드 필터가 기존 순차 필터와 같은 결과를 내는지 검증하는 테스트
+"""
+
+from domain.entities.etf import ETF
+from domain.services.etf_filter_service import ETFFilterService
+from domain.value_objects.filter_criteria import FilterCriteria
+from domain.value_objects.keyword_matcher import KeywordMatcher
+
+ETFS = [
+    ETF.create("111110", "KODEX AI반도체액티브"),
+    ETF.create("222220", "TIGER 반도체 레버리지액티브"),
+    ETF.create("333330", "ACE 바이오헬스"),
+    ETF.create("444440", "KoAct 바이오헬스케어액티브"),
+    ETF.create("555550", "TIME 코리아밸류업액티브"),
+]
+
+
+def test_matcher_finds_overlapping_keywords():
+    """겹치는 키워드와 대소문자가 다른 키워드를 모두 찾는지 확인합니다."""
+    matcher = KeywordMatcher(["AI반도체", "반도체", "ai", "헬스케어"])
+
+    found = matcher.find("KODEX AI반도체액티브")
+
+    assert {matcher.keywords[i] for i in found} == {"ai반도체", "반도체", "ai"}
+    assert matcher.find("TIGER 2차전지") == frozenset()
+
+
+def test_classify_matches_sequential_filters():
+    """컴파일된 필터가 기존 조건별 순차 필터와 같은 ETF를 고르고 테마를 돌려주는지 확인합니다."""
+    service = ETFFilterService()
+    criteria = FilterCriteria.create(
+        themes=["바이오", "반도체", "AI"], exclusions=["레버리지"], require_active=True
+    )
+
+    matches = service.classify_etfs(ETFS, criteria)
+
+    expected = [
+        etf
+        for etf in ETFS
+        if etf.is_active()
+        and not etf.has_exclusion(criteria.exclusions)
+        and etf.matches_theme(criteria.themes)
+    ]
+    assert [m.etf for m in matches] == expected
+    assert [m.themes for m in matches] == [("반도체", "AI"), ("바이오",)]
+
+    # 같은 조건이면 컴파일된 필터를 재사용
+    assert service.compile(criteria) is service.compile(
+        FilterCriteria.create(
+            themes=["바이오", "반도체", "AI"], exclusions=["레버리지"]
+        )
+    )
+    assert len(service.filter_etfs(ETFS, FilterCriteria.active_only())) == 4
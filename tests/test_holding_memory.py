@@ -0,0 +1,85 @@
+"""
+Holding Memory Benchmark
+Holding 한 건이 차지하는 메모리를 측정하는 벤치마크 테스트
+✅ 개선 전(일반 frozen dataclass)과 개선 후(__slots__ + intern + 서수 날짜) 비교
+"""
+
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+
+from domain.entities.holding import Holding
+from shared.utils.date_utils import from_date_string
+
+ROWS = 10_000
+
+
+@dataclass(frozen=True)
+class LegacyHolding:
+    """개선 전 Holding 구조 (비교용)"""
+
+    etf_ticker: str
+    stock_ticker: str
+    date: datetime
+    weight: float
+    amount: float = 0.0
+    stock_name: str = ""
+
+
+def _db_rows():
+    """DB 조회처럼 행마다 새 문자열이 만들어진 입력을 생성합니다."""
+    return [
+        (
+            "".join(["1521", f"{i % 50:02d}"]),
+            "".join(["00", f"{i % 800:04d}"]),
+            "".join(["2024-01-", f"{i % 20 + 1:02d}"]),
+            float(i % 100) / 7,
+            float(i) * 1000.0,
+            "".join(["종목", str(i % 800)]),
+        )
+        for i in range(ROWS)
+    ]
+
+
+def measure_bytes_per_holding(factory) -> float:
+    """입력 문자열을 포함해 Holding 리스트가 유지하는 메모리를 행 수로 나눕니다."""
+    # 측정 전 한 번 생성해 intern 테이블/날짜 캐시의 일회성 증가를 제외
+    [factory(*row) for row in _db_rows()]
+    gc.collect()
+    tracemalloc.start()
+
+    rows = _db_rows()
+    holdings = [factory(*row) for row in rows]
+    del rows
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(holdings) == ROWS
+    return retained / ROWS
+
+
+def test_holding_bytes_per_instance():
+    """Holding 한 건의 메모리가 개선 전보다 작은지 확인합니다."""
+
+    def legacy(etf, stock, date, weight, amount, name):
+        return LegacyHolding(etf, stock, from_date_string(date), weight, amount, name)
+
+    def compact(etf, stock, date, weight, amount, name):
+        return Holding(etf, stock, from_date_string(date), weight, amount, name)
+
+    legacy_bytes = measure_bytes_per_holding(legacy)
+    compact_bytes = measure_bytes_per_holding(compact)
+
+    print("=" * 60)
+    print("Holding Memory Benchmark")
+    print("=" * 60)
+    print(f"개선 전: {legacy_bytes:,.0f} bytes/holding")
+    print(f"개선 후: {compact_bytes:,.0f} bytes/holding")
+    print(f"절감률: {(1 - compact_bytes / legacy_bytes) * 100:.1f}%")
+
+    assert not hasattr(
+        Holding("152100", "005930", datetime(2024, 1, 2), 1.0), "__dict__"
+    )
+    assert compact_bytes < legacy_bytes
@@ -0,0 +1,171 @@
+"""
+Holdings Comparison Test
+정렬 병합 비교와 수집 시점 비교 결과 저장을 검증하는 테스트
+"""
+
+from datetime import datetime
+
+import pytest
+from application.queries.holdings_comparison_query import HoldingsComparisonQuery
+from application.queries.weight_change_feed_query import WeightChangeFeedQuery
+from domain.entities.etf import ETF
+from domain.entities.holding import Holding
+from domain.services.holdings_analyzer import HoldingsAnalyzer
+from domain.value_objects.weight_change import (
+    ChangeStatus,
+    WeightChange,
+    classify_weight_change,
+)
+from infrastructure.database.ingestion_writer import DailyIngestionWriter
+from infrastructure.database.migrations import DatabaseMigrations
+from infrastructure.database.repositories.sqlite_etf_repository import (
+    SQLiteETFRepository,
+)
+from infrastructure.database.repositories.sqlite_holding_diff_repository import (
+    SQLiteHoldingDiffRepository,
+)
+from infrastructure.database.repositories.sqlite_stock_repository import (
+    SQLiteStockRepository,
+)
+
+PREV = datetime(2024, 1, 2)
+CURR = datetime(2024, 1, 3)
+
+
+def _holdings(date, weights):
+    return [
+        Holding.create("152100", ticker, date, weight)
+        for ticker, weight in sorted(weights.items())
+    ]
+
+
+def test_merge_classifies_each_stock_once():
+    """신규/제외/증가/감소/유지가 종목 코드 순으로 한 번씩 나오는지 확인합니다."""
+    previous = _holdings(
+        PREV, {"000660": 5.0, "005930": 20.0, "035420": 3.0, "051910": 1.0}
+    )
+    current = _holdings(
+        CURR, {"005930": 22.0, "035420": 2.0, "051910": 1.005, "068270": 4.0}
+    )
+
+    diffs = list(HoldingsAnalyzer().merge_holdings(previous, current))
+
+    assert [(d.stock_ticker, d.status) for d in diffs] == [
+        ("000660", ChangeStatus.REMOVED),
+        ("005930", ChangeStatus.INCREASED),
+        ("035420", ChangeStatus.DECREASED),
+        ("051910", ChangeStatus.UNCHANGED),
+        ("068270", ChangeStatus.NEW),
+    ]
+
+    # 정렬되지 않은 입력도 compare_holdings에서는 같은 결과
+    result = HoldingsAnalyzer().compare_holdings(previous[::-1], current[::-1])
+    assert {k: len(v) for k, v in result.items()} == {
+        "new": 1,
+        "removed": 1,
+        "increased": 1,
+        "decreased": 1,
+        "unchanged": 1,
+    }
+
+
+def test_threshold_boundary_matches_weight_change():
+    """변화량이 기준(0.01)과 같으면 증가/감소로 분류되는지 확인합니다."""
+    cases = {
+        10.01: ChangeStatus.INCREASED,
+        9.99: ChangeStatus.DECREASED,
+        10.005: ChangeStatus.UNCHANGED,
+        9.9951: ChangeStatus.UNCHANGED,
+    }
+    for current, status in cases.items():
+        assert classify_weight_change(current - 10.0) == status
+        assert WeightChange.create(10.0, current).status == status
+
+    diffs = HoldingsAnalyzer().merge_holdings(
+        _holdings(PREV, {"005930": 10.0}), _holdings(CURR, {"005930": 10.01})
+    )
+    assert [d.status for d in diffs] == [ChangeStatus.INCREASED]
+
+
+def _write_day(conn, date, weights, etf=("152100", "TIGER 액티브")):
+    writer = DailyIngestionWriter(conn)
+    batch = writer.new_batch(date)
+    batch.add_etfs([ETF.create(*etf)])
+    batch.add_holdings(
+        [
+            Holding.create(etf[0], ticker, date, weight)
+            for ticker, weight in sorted(weights.items())
+        ]
+    )
+    writer.write(batch)
+
+
+def test_default_comparison_uses_stored_diffs(temp_db):
+    """기본 비교가 저장된 결과를 쓰고, 그 자리 계산 결과와 같은지 확인합니다."""
+    # 최신 날짜를 먼저 수집하고 과거 날짜를 나중에 수집 (백필 순서)
+    _write_day(temp_db, CURR, {"005930": 22.0, "035420": 2.0, "068270": 4.0})
+    _write_day(temp_db, PREV, {"000660": 5.0, "005930": 20.0, "035420": 3.0})
+
+    diff_repo = SQLiteHoldingDiffRepository(temp_db)
+    stored = diff_repo.find_diffs("152100", CURR, PREV)
+    assert stored is not None
+    assert stored["counts"][ChangeStatus.NEW] == 1
+
+    etf_repo = SQLiteETFRepository(temp_db)
+    query = HoldingsComparisonQuery(
+        etf_repo, SQLiteStockRepository(temp_db), HoldingsAnalyzer(), diff_repo
+    )
+    from_store = query.execute("152100").to_dict()
+
+    SQLiteHoldingDiffRepository.clear_diffs(temp_db.get_connection())
+    on_the_fly = query.execute("152100", CURR, PREV).to_dict()
+
+    assert from_store == on_the_fly
+    assert from_store["summary"]["removed_count"] == 1
+
+    # 조회 경로는 누락된 결과를 저장하지 않음 (마이그레이션이 채움)
+    assert query.execute("152100").to_dict() == on_the_fly
+    assert diff_repo.find_diffs("152100", CURR, PREV) is None
+
+    DatabaseMigrations(temp_db).migrate_backfill_holding_diffs()
+    assert diff_repo.find_diffs("152100", CURR, PREV) == stored
+
+
+def test_weight_change_feed_across_etfs(temp_db):
+    """여러 ETF의 변화가 한 번에 변화량 순으로 나오고 필터가 적용되는지 확인합니다."""
+    _write_day(temp_db, PREV, {"005930": 20.0, "035420": 3.0})
+    _write_day(temp_db, CURR, {"005930": 22.0, "035420": 2.8})
+    semi = ("091160", "KODEX 반도체 액티브")
+    _write_day(temp_db, PREV, {"000660": 10.0, "005930": 5.0}, etf=semi)
+    _write_day(temp_db, CURR, {"005930": 5.0, "042700": 4.0}, etf=semi)
+
+    query = WeightChangeFeedQuery(SQLiteETFRepository(temp_db), HoldingsAnalyzer())
+
+    feed = query.execute().to_dict()
+    assert (feed["prev_date"], feed["current_date"]) == ("2024-01-02", "2024-01-03")
+    assert [
+        (c["etf_ticker"], c["stock_ticker"], c["status"]) for c in feed["changes"]
+    ] == [
+        ("091160", "000660", ChangeStatus.REMOVED.value),
+        ("091160", "042700", ChangeStatus.NEW.value),
+        ("152100", "005930", ChangeStatus.INCREASED.value),
+    ]
+    assert feed["summary"]["etf_count"] == 2
+
+    themed = query.execute(theme="반도체", statuses=["new"]).to_dict()
+    assert [c["stock_ticker"] for c in themed["changes"]] == ["042700"]
+
+    # 유지 행은 기본 threshold(0.5)와 무관하게 조회
+    unchanged = query.execute(statuses=["unchanged"]).to_dict()
+    assert [(c["etf_ticker"], c["stock_ticker"]) for c in unchanged["changes"]] == [
+        ("091160", "005930")
+    ]
+    assert unchanged["summary"]["unchanged_count"] == 1
+
+    # 비중 증가/감소에만 threshold 적용 (035420: -0.2)
+    small = query.execute(threshold=0.1, statuses=["decreased"]).to_dict()
+    assert [c["stock_ticker"] for c in small["changes"]] == ["035420"]
+    assert query.execute(statuses=["decreased"]).to_dict()["changes"] == []
+
+    with pytest.raises(ValueError):
+        query.execute(statuses=["bogus"])
@@ -0,0 +1,72 @@
+"""
+Holdings Conversion Test
+PDF DataFrame → Holding 일괄 변환 결과를 검증하는 테스트
+"""
+
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from domain.entities.holding import Holding
+from infrastructure.adapters import pykrx_adapter
+from infrastructure.adapters.pykrx_adapter import PyKRXAdapter
+
+DATE = datetime(2024, 1, 2)
+
+
+def _portfolio(df):
+    def get_etf_portfolio_deposit_file(etf_ticker, date_str):
+        return df
+
+    return get_etf_portfolio_deposit_file
+
+
+def test_conversion_rejects_bad_rows(monkeypatch):
+    """잘못된 행만 제외하고 나머지는 Holding.create와 같은 결과인지 확인합니다."""
+    df = pd.DataFrame(
+        {
+            "비중": [25.123456, 150.0, np.nan, 10.0, 5.0, 3.0, "x"],
+            "금액": [1000.555, 10.0, 10.0, -1.0, np.nan, 300.0, 1.0],
+            "종목명": [" 삼성전자 ", "A", "B", "C", np.nan, "예금", "D"],
+        },
+        index=["005930", "000660", "035420", "051910", "ABC", "010010", "000270"],
+    )
+    monkeypatch.setattr(
+        pykrx_adapter.stock, "get_etf_portfolio_deposit_file", _portfolio(df)
+    )
+
+    holdings = PyKRXAdapter().collect_holdings_for_date("152100", DATE)
+
+    expected = [
+        Holding.create("152100", "005930", DATE, 25.123456, 1000.555, "삼성전자"),
+        Holding.create("152100", "010010", DATE, 3.0, 300.0, "원화예금"),
+    ]
+    assert holdings == expected
+
+
+def test_conversion_speed(monkeypatch):
+    """대형 PDF 변환 시간을 측정합니다."""
+    size = 5000
+    df = pd.DataFrame(
+        {
+            "비중": np.linspace(0.01, 1.0, size),
+            "금액": np.arange(size, dtype=float) * 1000,
+            "종목명": [f"종목{i}" for i in range(size)],
+        },
+        index=[f"{i:06d}" for i in range(size)],
+    )
+    monkeypatch.setattr(
+        pykrx_adapter.stock, "get_etf_portfolio_deposit_file", _portfolio(df)
+    )
+
+    start = time.perf_counter()
+    holdings = PyKRXAdapter().collect_holdings_for_date("152100", DATE)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n  {size}개 보유 종목 변환: {elapsed * 1000:.1f}ms")
+
+    assert len(holdings) == size
+    assert holdings[10] == Holding.create(
+        "152100", "000010", DATE, float(df["비중"].iloc[10]), 10000.0, "종목10"
+    )
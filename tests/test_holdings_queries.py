@@ -0,0 +1,114 @@
+"""
+Holdings Query Test
+보유 종목 조회(행 재구성, 비중 추이, 종목 보유 추이)를 검증하는 테스트
+"""
+
+from datetime import datetime
+
+from application.queries.stock_ownership_query import StockOwnershipQuery
+from application.queries.weight_history_query import WeightHistoryQuery
+from domain.entities.etf import ETF
+from domain.entities.holding import Holding
+from infrastructure.database.ingestion_writer import DailyIngestionWriter
+from infrastructure.database.repositories.sqlite_etf_repository import (
+    SQLiteETFRepository,
+)
+from infrastructure.database.repositories.sqlite_stock_repository import (
+    SQLiteStockRepository,
+)
+
+DATE = datetime(2024, 1, 2)
+
+
+def test_trusted_hydration_matches_create(temp_db):
+    """DB 행 재구성(검증 생략)이 Holding.create()와 같은 엔티티를 만드는지 확인합니다."""
+    writer = DailyIngestionWriter(temp_db)
+    holdings = [
+        Holding.create("152100", "005930", DATE, 20.12345, 100.555, "삼성전자"),
+        Holding.create("152100", "000660", DATE, 10.0, 50.0, "SK하이닉스"),
+    ]
+
+    batch = writer.new_batch(DATE)
+    batch.add_etfs([ETF.create("152100", "TIGER 액티브")])
+    batch.add_holdings(holdings)
+    writer.write(batch)
+
+    repo = SQLiteETFRepository(temp_db)
+    assert repo.find_holdings_by_etf_and_date("152100", DATE) == holdings
+
+    rows = repo.find_weight_history("152100", "005930", as_rows=True)
+    assert [(r.date, r.weight, r.stock_name) for r in rows] == [
+        ("2024-01-02", holdings[0].weight, "삼성전자")
+    ]
+
+
+def test_batch_weight_history_is_columnar(temp_db):
+    """여러 조합의 비중 추이가 날짜 축을 공유하는 열 단위로 나오는지 확인합니다."""
+    writer = DailyIngestionWriter(temp_db)
+    next_day = datetime(2024, 1, 3)
+
+    for date, weights in [
+        (DATE, {"005930": 20.0, "000660": 10.0}),
+        (next_day, {"005930": 21.0}),
+    ]:
+        batch = writer.new_batch(date)
+        batch.add_etfs([ETF.create("152100", "TIGER 액티브")])
+        batch.add_holdings(
+            Holding.create("152100", stock, date, weight)
+            for stock, weight in weights.items()
+        )
+        writer.write(batch)
+
+    query = WeightHistoryQuery(SQLiteETFRepository(temp_db))
+    result = query.execute_batch(["152100", "999999"], ["005930", "000660"]).to_dict()
+
+    assert result["dates"] == ["2024-01-02", "2024-01-03"]
+    assert [(s["stock_ticker"], s["weights"]) for s in result["series"]] == [
+        ("000660", [10.0, None]),
+        ("005930", [20.0, 21.0]),
+    ]
+
+    ranged = query.execute_batch(["152100"], ["005930"], start_date=next_day)
+    assert ranged.dates == ["2024-01-03"]
+
+    assert query.get_latest_weight("152100", "005930") == 21.0
+    assert query.has_history("152100", "000660")
+    assert not query.has_history("152100", "035420")
+
+
+def test_stock_ownership_over_time(temp_db):
+    """종목 보유 추이가 날짜별 ETF 수/금액과 ETF별 비중 시리즈로 나오는지 확인합니다."""
+    writer = DailyIngestionWriter(temp_db)
+    days = [datetime(2024, 1, 2), datetime(2024, 1, 3)]
+
+    for date, holdings in zip(
+        days,
+        [
+            [("152100", 20.0, 100.0), ("091160", 5.0, 30.0)],
+            [("152100", 21.0, 110.0)],
+        ],
+    ):
+        batch = writer.new_batch(date)
+        batch.add_etfs(
+            [ETF.create("152100", "TIGER 액티브"), ETF.create("091160", "KODEX 반도체")]
+        )
+        batch.add_holdings(
+            Holding.create(etf, "005930", date, weight, amount, "삼성전자")
+            for etf, weight, amount in holdings
+        )
+        writer.write(batch)
+
+    query = StockOwnershipQuery(
+        SQLiteETFRepository(temp_db), SQLiteStockRepository(temp_db)
+    )
+    result = query.execute("005930").to_dict()
+
+    assert result["dates"] == ["2024-01-02", "2024-01-03"]
+    assert result["etf_counts"] == [2, 1]
+    assert result["total_amounts"] == [130.0, 110.0]
+    assert [(e["etf_ticker"], e["weights"]) for e in result["etfs"]] == [
+        ("152100", [20.0, 21.0]),
+        ("091160", [5.0, None]),
+    ]
+
+    assert query.execute("005930", start_date=days[1]).to_dict()["etf_counts"] == [1]
@@ -0,0 +1,107 @@
+"""
+Ingestion Writer Test
+일 단위 일괄 저장과 롤백 동작을 검증하는 테스트
+"""
+
+from datetime import datetime
+
+import pytest
+from domain.entities.etf import ETF
+from domain.entities.holding import Holding
+from infrastructure.database.ingestion_writer import DailyIngestionWriter
+from infrastructure.database.repositories.sqlite_etf_repository import (
+    SQLiteETFRepository,
+)
+from infrastructure.database.repositories.sqlite_statistics_repository import (
+    SQLiteStatisticsRepository,
+)
+from shared.exceptions import DatabaseException
+
+DATE = datetime(2024, 1, 2)
+
+
+def _count(conn, table):
+    return conn.execute_query(f"SELECT COUNT(*) AS c FROM {table}").fetchone()["c"]
+
+
+def test_write_day_in_one_transaction(temp_db):
+    """하루치 ETF/종목/보유 종목이 한 번에 저장되는지 확인합니다."""
+    writer = DailyIngestionWriter(temp_db)
+
+    batch = writer.new_batch(DATE)
+    batch.add_etfs([ETF.create("152100", "TIGER 액티브")])
+    batch.add_holdings(
+        [
+            Holding.create("152100", "005930", DATE, 20.0, 100.0, "삼성전자"),
+            Holding.create("152100", "000660", DATE, 10.0, 50.0, "SK하이닉스"),
+        ]
+    )
+
+    result = writer.write(batch)
+
+    assert result.etfs_inserted == 1
+    assert result.stocks_inserted == 2
+    assert result.holdings_inserted == 2
+    assert _count(temp_db, "data_etf_holdings") == 2
+
+    # 같은 날 재저장은 무시됨
+    assert writer.write(batch).holdings_inserted == 0
+
+
+def test_failed_day_rolls_back(temp_db):
+    """저장 중 오류가 나면 그날 데이터가 모두 롤백되는지 확인합니다."""
+    writer = DailyIngestionWriter(temp_db)
+
+    batch = writer.new_batch(DATE)
+    batch.add_etfs([ETF.create("152100", "TIGER 액티브")])
+    batch.add_holdings(
+        [Holding.create("152100", "005930", DATE, 20.0, 100.0, "삼성전자")]
+    )
+    # 존재하지 않는 ETF를 참조하는 행 → 외래 키 위반
+    batch.holdings.append(("999999", "005930", "2024-01-02", 1.0, 0.0))
+
+    with pytest.raises(DatabaseException):
+        writer.write(batch)
+
+    assert _count(temp_db, "data_etfs") == 0
+    assert _count(temp_db, "data_stocks") == 0
+    assert _count(temp_db, "data_etf_holdings") == 0
+
+
+def test_python_error_rolls_back(temp_db, monkeypatch):
+    """트랜잭션 안의 Python 예외도 롤백되어 다음 저장이 가능한지 확인합니다."""
+    writer = DailyIngestionWriter(temp_db)
+    batch = writer.new_batch(DATE)
+    batch.add_etfs([ETF.create("152100", "TIGER 액티브")])
+    batch.add_holdings(
+        [Holding.create("152100", "005930", DATE, 20.0, 100.0, "삼성전자")]
+    )
+
+    def broken(conn, date_str):
+        raise RuntimeError("aggregate bug")
+
+    with monkeypatch.context() as m:
+        m.setattr(SQLiteStatisticsRepository, "write_aggregates", broken)
+        with pytest.raises(RuntimeError):
+            writer.write(batch)
+
+    assert _count(temp_db, "data_etf_holdings") == 0
+    assert writer.write(batch).holdings_inserted == 1
+
+
+def test_collection_status(temp_db):
+    """등록된 ETF와 수집 완료 ETF가 한 번에 조회되는지 확인합니다."""
+    writer = DailyIngestionWriter(temp_db)
+    batch = writer.new_batch(DATE)
+    batch.add_etfs(
+        [ETF.create("152100", "TIGER 액티브"), ETF.create("069500", "KODEX 액티브")]
+    )
+    batch.add_holdings(
+        [Holding.create("152100", "005930", DATE, 20.0, 100.0, "삼성전자")]
+    )
+    writer.write(batch)
+
+    known, collected = SQLiteETFRepository(temp_db).get_collection_status(DATE)
+
+    assert known == {"152100", "069500"}
+    assert collected == {"152100"}
@@ -0,0 +1,173 @@
+"""
+Initialize Job Test
+체크포인트 기반 초기화 작업의 재개 동작을 검증하는 테스트
+"""
+
+from datetime import datetime
+from threading import Event
+
+from application.use_cases.initialize_system import InitializeSystemUseCase
+from domain.entities.etf import ETF
+from domain.entities.holding import Holding
+from domain.entities.job import Job, JobStatus
+from domain.entities.stock import Stock
+from domain.services.etf_filter_service import ETFFilterService
+from domain.services.trading_calendar import TradingCalendar
+from flask import Flask
+from infrastructure.adapters.market_data_adapter import MarketDataAdapter
+from infrastructure.database.ingestion_writer import DailyIngestionWriter
+from infrastructure.database.repositories.sqlite_config_repository import (
+    SQLiteConfigRepository,
+)
+from infrastructure.database.repositories.sqlite_etf_repository import (
+    SQLiteETFRepository,
+)
+from infrastructure.database.repositories.sqlite_job_repository import (
+    SQLiteJobRepository,
+)
+from infrastructure.database.repositories.sqlite_stock_repository import (
+    SQLiteStockRepository,
+)
+from infrastructure.jobs import BackgroundJobRunner
+from presentation.api.controllers.system_controller import SystemController
+from presentation.api.routes import register_all_routes
+
+DAYS = [datetime(2024, 1, 2), datetime(2024, 1, 3)]
+ETFS = [ETF.create("111110", "반도체 액티브"), ETF.create("222220", "바이오 액티브")]
+
+
+class FakeAdapter(MarketDataAdapter):
+    """첫 실행에서 한 번 실패하는 가짜 시장 데이터 어댑터"""
+
+    def __init__(self, fail_once=None):
+        self.fail_once = set(fail_once or [])
+        self.requests = []
+
+    def collect_all_stocks(self):
+        return [Stock.create("005930", "삼성전자")]
+
+    def collect_stocks_by_market(self, market):
+        return self.collect_all_stocks()
+
+    def collect_etfs_for_date(self, date):
+        return ETFS
+
+    def collect_holdings_for_date(self, etf_ticker, date):
+        key = (etf_ticker, date.day)
+        self.requests.append(key)
+        if key in self.fail_once:
+            self.fail_once.discard(key)
+            raise RuntimeError("network error")
+        return [Holding.create(etf_ticker, "005930", date, 10.0, 100.0, "삼성전자")]
+
+    def is_business_day(self, date):
+        return True
+
+    def get_stock_name(self, ticker):
+        return ticker
+
+    def get_etf_name(self, ticker):
+        return ticker
+
+
+class FixedCalendar(TradingCalendar):
+    def business_days(self, start_date, end_date):
+        return DAYS
+
+
+def _use_case(conn, adapter):
+    return InitializeSystemUseCase(
+        SQLiteETFRepository(conn),
+        SQLiteStockRepository(conn),
+        SQLiteConfigRepository(conn),
+        adapter,
+        ETFFilterService(),
+        FixedCalendar(),
+        DailyIngestionWriter(conn),
+        SQLiteJobRepository(conn),
+    )
+
+
+def test_initialize_resumes_from_checkpoint(temp_db):
+    """실패한 (날짜, ETF)만 다시 수집하고 작업을 완료하는지 확인합니다."""
+    adapter = FakeAdapter(fail_once=[("222220", 3)])
+
+    first = _use_case(temp_db, adapter).execute(days=5)
+    assert first.is_failure()
+
+    job = SQLiteJobRepository(temp_db).find_latest(InitializeSystemUseCase.JOB_TYPE)
+    assert job.status == JobStatus.FAILED
+    assert (job.done_units, job.total_units) == (1, 2)
+
+    adapter.requests.clear()
+    second = _use_case(temp_db, adapter).execute()
+
+    assert second.is_success()
+    assert second.value["resumed"] is True
+    assert second.value["job_id"] == job.id
+    assert adapter.requests == [("222220", 3)]
+
+    # 완료 후에는 다시 초기화하지 않음
+    third = _use_case(temp_db, adapter).execute()
+    assert third.value["initialized"] is False
+
+
+def test_background_runner_reports_progress(temp_db):
+    """백그라운드 실행 후 진행 상황(일수, ETF 수, 행 수)이 저장되는지 확인합니다."""
+    job_repo = SQLiteJobRepository(temp_db)
+    use_case = _use_case(temp_db, FakeAdapter())
+    runner = BackgroundJobRunner(job_repo)
+
+    job = use_case.prepare(days=5).value["job"]
+    assert runner.submit(job, use_case.run_job) is job
+    runner.shutdown(wait=True)
+
+    finished = job_repo.find_by_id(job.id)
+    assert finished.status == JobStatus.COMPLETED
+    assert (finished.done_units, finished.total_units) == (2, 2)
+    assert finished.etfs_done == 4
+    assert finished.rows_written == 4
+    assert runner.find_active(InitializeSystemUseCase.JOB_TYPE) is None
+
+
+def test_recover_interrupted_marks_running_jobs_failed(temp_db):
+    """재시작 시 실행 중으로 남은 작업을 이어서 실행 가능한 실패 상태로 바꿉니다."""
+    job_repo = SQLiteJobRepository(temp_db)
+    job = Job.create(InitializeSystemUseCase.JOB_TYPE).start()
+    job_repo.save(job)
+
+    assert BackgroundJobRunner(job_repo).recover_interrupted() == 1
+
+    recovered = job_repo.find_by_id(job.id)
+    assert recovered.status == JobStatus.FAILED
+    assert recovered.is_resumable()
+
+
+class UnexpectedUpdate:
+    def prepare(self):
+        raise AssertionError("update must not be prepared during initialize")
+
+
+def test_update_rejected_while_initializing(temp_db):
+    """초기화 작업 진행 중에는 업데이트를 준비하지 않고 409를 반환합니다."""
+    job_repo = SQLiteJobRepository(temp_db)
+    runner = BackgroundJobRunner(job_repo)
+    release = Event()
+
+    job = Job.create(InitializeSystemUseCase.JOB_TYPE)
+    job_repo.save(job)
+    runner.submit(job, lambda j: release.wait(5) and j)
+
+    app = Flask(__name__)
+    register_all_routes(app)
+    controller = SystemController(None, UnexpectedUpdate(), runner, job_repo)
+
+    try:
+        with app.test_request_context("/api/system/update", method="POST"):
+            response, status = controller.update_data()
+    finally:
+        release.set()
+        runner.shutdown(wait=True)
+
+    assert status == 409
+    assert response.get_json()["job_id"] == job.id
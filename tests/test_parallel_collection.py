@@ -0,0 +1,70 @@
+"""
+Parallel Collection Test
+병렬 보유 종목 수집과 공유 속도 제한기를 검증하는 테스트
+"""
+
+import time
+from datetime import datetime
+
+import pandas as pd
+from infrastructure.adapters import pykrx_adapter
+from infrastructure.adapters.pykrx_adapter import PyKRXAdapter
+from infrastructure.adapters.rate_limiter import TokenBucketRateLimiter
+
+API_LATENCY = 0.2
+
+
+def _fake_portfolio(calls):
+    """네트워크 지연을 흉내내는 가짜 PDF 조회 함수"""
+
+    def get_etf_portfolio_deposit_file(etf_ticker, date_str):
+        calls.append(time.monotonic())
+        time.sleep(API_LATENCY)
+        return pd.DataFrame(
+            {"비중": [10.0, 5.0], "금액": [1000.0, 500.0], "종목명": ["A", "B"]},
+            index=["005930", "000660"],
+        )
+
+    return get_etf_portfolio_deposit_file
+
+
+def test_rate_limiter_spacing():
+    """속도 제한기가 요청 간격을 유지하는지 확인합니다."""
+    limiter = TokenBucketRateLimiter.from_delay(0.05)
+
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    # 첫 요청은 즉시, 이후 4번은 0.05초 간격
+    assert elapsed >= 0.19
+
+
+def test_parallel_collection(monkeypatch):
+    """병렬 수집이 요청 속도를 유지하면서 전체 시간을 줄이는지 확인합니다."""
+    calls = []
+    monkeypatch.setattr(
+        pykrx_adapter.stock,
+        "get_etf_portfolio_deposit_file",
+        _fake_portfolio(calls),
+    )
+
+    adapter = PyKRXAdapter(max_workers=4)
+    tickers = [f"{i:06d}" for i in range(1, 9)]
+
+    start = time.monotonic()
+    results = dict(adapter.collect_holdings_for_etfs(tickers, datetime(2024, 1, 2)))
+    elapsed = time.monotonic() - start
+
+    print(f"\n  {len(tickers)}개 ETF 병렬 수집: {elapsed:.2f}초")
+
+    assert set(results) == set(tickers)
+    assert all(len(holdings) == 2 for holdings in results.values())
+
+    # 순차 수집이라면 최소 len(tickers) * API_LATENCY 초가 걸림
+    assert elapsed < len(tickers) * API_LATENCY
+
+    # 요청 간격은 API_DELAY_SECONDS 이상 유지
+    gaps = [b - a for a, b in zip(calls, calls[1:])]
+    assert min(gaps) >= adapter.api_delay * 0.9
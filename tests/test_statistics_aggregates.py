@@ -0,0 +1,199 @@
+"""
+Statistics Aggregates Test
+수집 시점 사전 집계가 기존 계산 결과와 같은지 검증하는 테스트
+"""
+
+from datetime import datetime
+
+import pytest
+
+from application.queries.stock_statistics_query import StockStatisticsQuery
+from domain.entities.etf import ETF
+from domain.entities.holding import Holding
+from domain.services.statistics_calculator import StatisticsCalculator
+from domain.value_objects import holdings_snapshot
+from domain.value_objects.holdings_snapshot import HoldingsSnapshot
+from infrastructure.database.ingestion_writer import DailyIngestionWriter
+from infrastructure.database.migrations import DatabaseMigrations
+from infrastructure.database.repositories.sqlite_etf_repository import (
+    SQLiteETFRepository,
+)
+from infrastructure.database.repositories.sqlite_statistics_repository import (
+    SQLiteStatisticsRepository,
+)
+
+DATE = datetime(2024, 1, 2)
+
+HOLDINGS = [
+    Holding.create("111110", "005930", DATE, 20.0, 300.0, "삼성전자"),
+    Holding.create("111110", "000660", DATE, 4.5, 90.0, "SK하이닉스"),
+    Holding.create("111110", "035420", DATE, 0.5, 10.0, "NAVER"),
+    Holding.create("222220", "005930", DATE, 12.0, 200.0, "삼성전자"),
+    Holding.create("222220", "000660", DATE, 2.0, 40.0, "SK하이닉스"),
+    Holding.create("333330", "005930", DATE, 8.0, 0.0, "삼성전자"),
+]
+
+
+@pytest.fixture
+def query(temp_db):
+    writer = DailyIngestionWriter(temp_db)
+    batch = writer.new_batch(DATE)
+    batch.add_etfs(
+        [
+            ETF.create("111110", "반도체 액티브"),
+            ETF.create("222220", "AI 액티브"),
+            ETF.create("333330", "IT 액티브"),
+        ]
+    )
+    batch.add_holdings(HOLDINGS)
+    writer.write(batch)
+
+    return StockStatisticsQuery(
+        SQLiteETFRepository(temp_db),
+        StatisticsCalculator(),
+        SQLiteStatisticsRepository(temp_db),
+    )
+
+
+def _sorted_tickers(stocks):
+    return [{**s, "etf_tickers": sorted(s["etf_tickers"])} for s in stocks]
+
+
+def test_aggregates_match_calculator(temp_db, query):
+    """집계 테이블 결과가 Python 계산 결과와 같은지 확인합니다."""
+    calculator = StatisticsCalculator()
+    stats_repo = SQLiteStatisticsRepository(temp_db)
+
+    assert _sorted_tickers(
+        stats_repo.find_stock_aggregates(DATE, min_etf_count=2)
+    ) == _sorted_tickers(calculator.calculate_duplicate_stocks(HOLDINGS))
+
+    ranking = stats_repo.find_stock_aggregates(
+        DATE, order_by=stats_repo.ORDER_BY_AMOUNT, min_amount=0
+    )
+    expected = calculator.calculate_amount_ranking(HOLDINGS, top_n=0)
+    assert [s["ticker"] for s in ranking] == [s["ticker"] for s in expected]
+
+    summary = stats_repo.find_daily_summary(DATE)
+    assert summary["distribution"] == calculator.calculate_weight_distribution(HOLDINGS)
+    assert (summary["etf_count"], summary["stock_count"]) == (3, 3)
+
+    result = query.get_statistics_summary(DATE)
+    assert result["most_common_stock"]["frequency"] == 3
+    assert result["highest_amount_stock"]["ticker"] == "005930"
+
+
+def test_missing_aggregates_are_computed_without_writing(temp_db, query):
+    """집계가 없는 날짜는 조회 시 저장 없이 계산되고, 마이그레이션이 채우는지 확인합니다."""
+    stats_repo = SQLiteStatisticsRepository(temp_db)
+    expected = (
+        query.get_duplicate_stocks(DATE).to_dict(),
+        query.get_amount_ranking(DATE).to_dict(),
+        query.get_statistics_summary(DATE),
+        query.get_weight_distribution(DATE),
+    )
+
+    with temp_db.get_connection() as conn:
+        SQLiteStatisticsRepository.clear_aggregates(conn)
+
+    assert (
+        query.get_duplicate_stocks(DATE).to_dict(),
+        query.get_amount_ranking(DATE).to_dict(),
+        query.get_statistics_summary(DATE),
+        query.get_weight_distribution(DATE),
+    ) == expected
+    assert stats_repo.find_daily_summary(DATE) is None
+
+    DatabaseMigrations(temp_db).migrate_backfill_aggregates()
+    assert stats_repo.find_daily_summary(DATE)["holding_count"] == len(HOLDINGS)
+    assert query.get_weight_distribution(DATE) == expected[3]
+
+    # 보유 종목을 지운 날짜도 조회는 저장 없이 빈 결과
+    SQLiteETFRepository(temp_db).delete_holdings_by_date(DATE)
+    assert query.get_weight_distribution(DATE)["total_holdings"] == 0
+    assert stats_repo.find_daily_summary(DATE) is None
+
+
+def test_theme_statistics_aggregated_in_sql(query):
+    """테마 통계가 테마 ETF의 보유 종목만으로 집계되는지 확인합니다."""
+    calculator = StatisticsCalculator()
+    theme_holdings = [h for h in HOLDINGS if h.etf_ticker in ("111110", "222220")]
+
+    stats = query.get_theme_statistics("반도체", DATE).to_dict()
+    assert stats["etf_count"] == 1
+    assert (stats["total_holdings"], stats["unique_stocks"]) == (3, 3)
+    assert stats["duplicate_stocks"] == []
+
+    stats = query.get_theme_statistics("액티브", DATE).to_dict()
+    assert stats["total_holdings"] == len(HOLDINGS)
+    assert [s["ticker"] for s in stats["top_stocks"]] == [
+        s["ticker"] for s in calculator.calculate_amount_ranking(HOLDINGS, 10)
+    ]
+
+    duplicates = calculator.calculate_duplicate_stocks(theme_holdings)
+    assert (
+        query.stats_repo.aggregate_stocks_for_etfs(
+            DATE, ["111110", "222220"], min_etf_count=2
+        )[0]["etf_count"]
+        == duplicates[0]["etf_count"]
+    )
+
+
+def test_holdings_snapshot_matches_holding_list(temp_db, query):
+    """열 스냅샷 기반 계산이 Holding 리스트 기반 계산과 같은지 확인합니다."""
+    calculator = StatisticsCalculator()
+    snapshot = SQLiteETFRepository(temp_db).find_holdings_snapshot(DATE)
+
+    assert len(snapshot) == len(HOLDINGS)
+    assert snapshot.nbytes < len(HOLDINGS) * 64
+    assert calculator.calculate_duplicate_stocks(snapshot) == (
+        calculator.calculate_duplicate_stocks(HOLDINGS)
+    )
+    assert calculator.calculate_weight_distribution(snapshot) == (
+        calculator.calculate_weight_distribution(HOLDINGS)
+    )
+    assert sorted(
+        (h.etf_ticker, h.stock_ticker, h.weight) for h in snapshot.to_holdings()
+    ) == sorted((h.etf_ticker, h.stock_ticker, h.weight) for h in HOLDINGS)
+    assert len(HoldingsSnapshot.from_holdings(HOLDINGS).for_etfs(["333330"])) == 1
+
+
+def test_overlap_matrix_matches_pairwise(query):
+    """행렬 중복도가 두 ETF씩 계산한 결과와 같은지 확인합니다."""
+    result = query.get_etf_overlap_matrix(DATE).to_dict()
+
+    assert [e["ticker"] for e in result["etfs"]] == ["111110", "222220", "333330"]
+    assert result["overlap_counts"] == [[3, 2, 1], [2, 2, 1], [1, 1, 1]]
+    assert result["weight_overlap"][0][1] == 14.0  # min(20, 12) + min(4.5, 2)
+
+    top = result["top_pairs"][0]
+    pairwise = StatisticsCalculator().calculate_etf_overlap(
+        [h for h in HOLDINGS if h.etf_ticker == "111110"],
+        [h for h in HOLDINGS if h.etf_ticker == "222220"],
+    )
+    assert (top["etf1_ticker"], top["etf2_ticker"]) == ("111110", "222220")
+    assert top["overlap_count"] == pairwise["overlap_count"]
+    assert top["overlap_stocks"] == sorted(pairwise["overlap_tickers"])
+    assert top["overlap_ratio_1"] == pairwise["overlap_ratio_1"]
+
+    themed = query.get_etf_overlap_matrix(DATE, theme="AI", min_overlap=2)
+    assert [e["ticker"] for e in themed.etfs] == ["222220"]
+    assert themed.top_pairs == []
+
+    with pytest.raises(ValueError):
+        query.get_etf_overlap_matrix(DATE, top_n=-1)
+    with pytest.raises(ValueError):
+        query.get_etf_overlap_matrix(DATE, min_overlap=0)
+    assert len(query.get_etf_overlap_matrix(DATE, top_n=0).top_pairs) == 3
+
+
+def test_overlap_matrix_batches_co_holding_pairs(monkeypatch):
+    """공동 보유 쌍을 작은 단위로 나눠 누적해도 결과가 같은지 확인합니다."""
+    expected = HoldingsSnapshot.from_holdings(HOLDINGS).overlap_matrix
+
+    monkeypatch.setattr(holdings_snapshot, "OVERLAP_BLOCK_ELEMENTS", 1)
+    batched = HoldingsSnapshot.from_holdings(HOLDINGS).overlap_matrix
+
+    assert batched.overlap_counts.tolist() == expected.overlap_counts.tolist()
+    assert batched.weight_overlap.tolist() == expected.weight_overlap.tolist()
+    assert batched.weight_overlap[1, 2] == 8.0  # min(12, 8)
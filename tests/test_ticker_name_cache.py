@@ -0,0 +1,52 @@
+"""
+Ticker Name Cache Test
+이름 캐시의 초기 채우기, TTL 만료, 만료 이름 대체 사용을 검증하는 테스트
+"""
+
+from infrastructure.cache.ticker_name_cache import TickerNameCache
+
+STOCK = TickerNameCache.KIND_STOCK
+ETF = TickerNameCache.KIND_ETF
+
+
+def _execute(conn, query, rows):
+    connection = conn.get_connection()
+    connection.executemany(query, rows)
+    connection.commit()
+
+
+def test_seeded_names_are_fresh(temp_db):
+    """오래 전에 저장된 data 테이블 이름도 새 항목으로 채워지는지 확인합니다."""
+    _execute(
+        temp_db,
+        "INSERT INTO data_stocks (ticker, name, updated_at) VALUES (?, ?, ?)",
+        [("005930", "삼성전자", "2020-01-01 00:00:00")],
+    )
+    _execute(
+        temp_db,
+        "INSERT INTO data_etfs (ticker, name, updated_at) VALUES (?, ?, ?)",
+        [("152100", "TIGER 액티브", "2020-01-01 00:00:00")],
+    )
+
+    cache = TickerNameCache(temp_db, ttl_days=30)
+    assert cache.get(STOCK, "005930") == "삼성전자"
+    assert cache.get(ETF, "152100") == "TIGER 액티브"
+    assert cache.get(STOCK, "000660") is None
+
+
+def test_expired_names_fall_back_to_stale(temp_db):
+    """TTL이 지난 이름은 get()에서 빠지고 get_stale()로는 남는지 확인합니다."""
+    _execute(
+        temp_db,
+        "INSERT INTO cache_ticker_names (ticker, kind, name, updated_at) "
+        "VALUES (?, ?, ?, ?)",
+        [("000660", STOCK, "SK하이닉스", "2020-01-01 00:00:00")],
+    )
+
+    cache = TickerNameCache(temp_db, ttl_days=30)
+    assert cache.get(STOCK, "000660") is None
+    assert cache.get_stale(STOCK, "000660") == "SK하이닉스"
+
+    cache.put(STOCK, "000660", "SK hynix")
+    assert cache.flush() == 1
+    assert TickerNameCache(temp_db, ttl_days=30).get(STOCK, "000660") == "SK hynix"
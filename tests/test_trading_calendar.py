@@ -0,0 +1,67 @@
+"""
+Trading Calendar Test
+거래일 캐시의 빈 응답 처리와 휴장일 재확인을 검증하는 테스트
+"""
+
+from datetime import datetime
+
+from infrastructure.cache.trading_calendar import CachedTradingCalendar
+
+# 2024-01-01(월)은 신정 휴장
+SPAN = (datetime(2024, 1, 1), datetime(2024, 1, 5))
+TRADING = [datetime(2024, 1, d) for d in (2, 3, 4, 5)]
+
+
+class FakeAdapter:
+    """정해진 응답을 차례로 돌려주는 거래일 조회 어댑터"""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def get_trading_days(self, start_date, end_date):
+        self.calls += 1
+        return self.replies.pop(0) if self.replies else TRADING
+
+
+def _stored(conn):
+    return conn.execute_query(
+        "SELECT COUNT(*) AS c FROM cache_trading_days"
+    ).fetchone()["c"]
+
+
+def test_empty_reply_is_not_persisted(temp_db):
+    """일시적 빈 응답은 평일로 대체하고 저장하지 않는지 확인합니다."""
+    adapter = FakeAdapter([])
+    calendar = CachedTradingCalendar(temp_db, adapter)
+
+    assert len(calendar.business_days(*SPAN)) == 5  # 평일 대체
+    assert _stored(temp_db) == 0
+
+    assert calendar.business_days(*SPAN) == TRADING
+    assert adapter.calls == 2
+
+    fresh = CachedTradingCalendar(temp_db, FakeAdapter())
+    assert fresh.business_days(*SPAN) == TRADING
+    assert fresh.market_adapter.calls == 0
+
+
+def test_closed_days_are_rechecked(temp_db):
+    """재확인 주기가 지난 휴장일과 refresh() 구간을 다시 조회하는지 확인합니다."""
+    conn = temp_db.get_connection()
+    conn.executemany(
+        "INSERT INTO cache_trading_days (date, is_trading, updated_at) VALUES (?, ?, ?)",
+        [
+            ("2024-01-01", 0, "2000-01-01 00:00:00"),
+            *[(d.date().isoformat(), 1, "2000-01-01 00:00:00") for d in TRADING],
+        ],
+    )
+    conn.commit()
+
+    adapter = FakeAdapter()
+    calendar = CachedTradingCalendar(temp_db, adapter)
+    assert calendar.business_days(*SPAN) == TRADING
+    assert adapter.calls == 1  # 오래된 휴장일만 다시 확인
+
+    assert calendar.refresh(*SPAN) == TRADING
+    assert adapter.calls == 2